@@ -0,0 +1,248 @@
+"""Headless frame-time benchmark for the Pygame UI.
+
+Drives rps.pygame_app through every screen with scripted input on SDL's
+dummy video/audio drivers, records how long each frame takes per state and
+writes percentiles as JSON. The backend is disabled and the score journal
+goes to a temporary directory, so runs are offline and leave no files.
+
+Time in the game advances by a fixed 1/60 s per frame, so the countdown
+takes the same number of frames however fast they render. Every frame is
+redrawn in full by default, so the `--baseline` check measures render cost.
+With --dirty-rects, frames that update nothing on screen are counted as
+`idle_frames` and left out of the percentiles.
+
+    python benchmarks/bench_frames.py --output bench_frames.json
+    python benchmarks/bench_frames.py --baseline bench_frames.json   # exit 1 on regression
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+STATES = ['enter_name', 'tutorial', 'best_of_choice', 'playing', 'leaderboard', 'post_match_choice',
+          'confirm_quit', 'quit_stats']
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def summarize(samples):
+    out = {}
+    for state, values in samples.items():
+        values = sorted(values)
+        out[state] = {
+            'frames': len(values),
+            'mean_ms': sum(values) / len(values) if values else 0.0,
+            'p50_ms': percentile(values, 50),
+            'p90_ms': percentile(values, 90),
+            'p99_ms': percentile(values, 99),
+            'max_ms': values[-1] if values else 0.0,
+        }
+    return out
+
+
+class SteppedPacer:
+    """FramePacer stand-in: never sleeps, and reports a fixed dt while animating."""
+
+    def __init__(self, step=1 / 60):
+        import pygame
+
+        self.pygame = pygame
+        self.step = step
+
+    def next_frame(self, animating, wake_in_ms=None):
+        return (self.step if animating else 0.0), self.pygame.event.get()
+
+
+class ScriptedDriver:
+    """frame_hook that times frames per state and posts the input for each screen."""
+
+    def __init__(self, frames_per_state, timeout_s):
+        import pygame
+
+        self.pygame = pygame
+        self.frames_per_state = frames_per_state
+        self.deadline = time.perf_counter() + timeout_s
+        self.samples = {state: [] for state in STATES}
+        self.idle = dict.fromkeys(STATES, 0)
+        self.drawn = False
+        self.frames_in_state = 0
+        self.last_state = None
+        self.last_t = None
+        self.wake = pygame.event.custom_type()
+        self.visited_post_match = False
+        self.visited_leaderboard = False
+
+    def install(self):
+        """Wrap the display flips so frames that draw nothing can be told apart."""
+        display = self.pygame.display
+        update, flip = display.update, display.flip
+
+        def traced_update(*args):
+            self.drawn = True
+            return update(*args)
+
+        def traced_flip():
+            self.drawn = True
+            return flip()
+
+        def restore():
+            display.update, display.flip = update, flip
+
+        display.update, display.flip = traced_update, traced_flip
+        return restore
+
+    def key(self, key, text=''):
+        self.pygame.event.post(self.pygame.event.Event(self.pygame.KEYDOWN, key=key, unicode=text, mod=0))
+
+    def click(self, rect):
+        self.pygame.event.post(self.pygame.event.Event(
+            self.pygame.MOUSEBUTTONDOWN, button=1, pos=rect.center))
+
+    def __call__(self, state, targets):
+        pg = self.pygame
+        now = time.perf_counter()
+        if self.last_t is not None and self.last_state in self.samples:
+            if self.drawn:
+                self.samples[self.last_state].append((now - self.last_t) * 1000.0)
+            else:
+                self.idle[self.last_state] += 1
+        self.drawn = False
+        if state != self.last_state:
+            self.frames_in_state = 0
+        self.frames_in_state += 1
+        self.last_state = state
+        self.last_t = now
+        # keep the loop awake so idle screens are still sampled every frame
+        pg.event.post(pg.event.Event(self.wake))
+
+        if now > self.deadline:
+            pg.event.post(pg.event.Event(pg.QUIT))
+            return
+        if self.frames_in_state < self.frames_per_state:
+            if state == 'playing':
+                self.key(pg.K_r, 'r')  # ignored while a countdown runs
+            elif state == 'leaderboard':
+                self.key(pg.K_DOWN)
+            return
+        if state == 'enter_name':
+            if self.frames_in_state == self.frames_per_state:
+                for ch in 'bench':
+                    self.key(getattr(pg, f'K_{ch}'), ch)
+                self.key(pg.K_RETURN)
+        elif state == 'tutorial':
+            self.key(pg.K_RETURN)
+        elif state == 'best_of_choice':
+            self.key(pg.K_3, '3')
+        elif state == 'playing':
+            # browse the board once, play until a match ends, then head for the quit dialogs
+            if not self.visited_leaderboard:
+                self.key(pg.K_l, 'l')
+            elif self.visited_post_match:
+                self.key(pg.K_ESCAPE)
+            else:
+                self.key(pg.K_r, 'r')
+        elif state == 'leaderboard':
+            self.visited_leaderboard = True
+            self.key(pg.K_l, 'l')
+        elif state == 'post_match_choice':
+            self.visited_post_match = True
+            self.key(pg.K_3, '3')
+        elif state in ('confirm_quit', 'quit_stats'):
+            self.click(targets['confirm'])
+
+
+def run(frames_per_state=120, timeout_s=120.0, full_redraw=True):
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    os.environ['BACKEND_API_BASE'] = ''
+    os.environ['RPS_DIRTY_RECTS'] = '0' if full_redraw else '1'
+    with tempfile.TemporaryDirectory() as data_dir:
+        os.environ['RPS_DATA_DIR'] = data_dir
+        from rps import pygame_app
+
+        driver = ScriptedDriver(frames_per_state, timeout_s)
+        uninstall = driver.install()
+        started = time.perf_counter()
+        try:
+            pygame_app.main(frame_hook=driver, pacer=SteppedPacer())
+        finally:
+            uninstall()
+        elapsed = time.perf_counter() - started
+    states = summarize(driver.samples)
+    for state, idle in driver.idle.items():
+        states[state]['idle_frames'] = idle
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'pygame': driver.pygame.version.ver,
+        'mode': 'full_redraw' if full_redraw else 'dirty_rects',
+        'frames_per_state': frames_per_state,
+        'wall_s': elapsed,
+        'states': states,
+    }
+
+
+def compare(result, baseline, tolerance):
+    """Return human-readable p90 regressions beyond `tolerance` (e.g. 0.2 = 20%)."""
+    if baseline.get('mode') != result['mode']:
+        return [f"baseline was run in {baseline.get('mode')} mode, this run in {result['mode']}"]
+    problems = []
+    for state, stats in result['states'].items():
+        base = baseline.get('states', {}).get(state)
+        if not base or not base['frames'] or not stats['frames']:
+            continue
+        if stats['p90_ms'] > base['p90_ms'] * (1 + tolerance):
+            problems.append(f"{state}: p90 {stats['p90_ms']:.2f} ms vs baseline {base['p90_ms']:.2f} ms")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Headless per-state frame-time benchmark.')
+    parser.add_argument('--frames', type=int, default=120, help='frames to sample per state')
+    parser.add_argument('--timeout', type=float, default=120.0, help='give up after this many seconds')
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help='time the dirty-rect path (frames that draw nothing are reported as idle)')
+    parser.add_argument('--output', help='write results JSON here')
+    parser.add_argument('--baseline', help='compare against an earlier results JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed p90 slowdown vs baseline')
+    args = parser.parse_args(argv)
+
+    result = run(args.frames, args.timeout, full_redraw=not args.dirty_rects)
+    print(f"{'state':<18} {'frames':>6} {'idle':>6} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}  (ms)")
+    for state in STATES:
+        s = result['states'][state]
+        print(f"{state:<18} {s['frames']:>6} {s['idle_frames']:>6} {s['p50_ms']:8.2f} {s['p90_ms']:8.2f} "
+              f"{s['p99_ms']:8.2f} {s['max_ms']:8.2f}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2), encoding='utf-8')
+    missing = [state for state in STATES
+               if not result['states'][state]['frames'] and not result['states'][state]['idle_frames']]
+    if missing:
+        print('never reached: ' + ', '.join(missing))
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        problems = compare(result, baseline, args.tolerance)
+        for line in problems:
+            print('REGRESSION ' + line)
+        if problems:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Import-to-first-frame startup benchmark for the Pygame UI.
+
+Each run starts a fresh interpreter on SDL's dummy drivers, imports
+rps.pygame_app and stops as soon as the first frame has been presented, so
+import time, pygame/mixer init, journal replay and anything else on the path
+to the first frame are all counted. The backend is disabled and the data
+directory is temporary (fresh per run with --cold, so the synth cache is
+empty too).
+
+    python benchmarks/bench_startup.py --runs 10 --output bench_startup.json
+    python benchmarks/bench_startup.py --baseline bench_startup.json   # exit 1 on regression
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from bench_frames import percentile
+
+
+def measure_once():
+    """Runs inside the child interpreter; returns timings in milliseconds."""
+    t0 = time.perf_counter()
+    from rps import pygame_app
+    imported = time.perf_counter()
+    import pygame
+
+    marks = {}
+    wake = pygame.event.custom_type()
+
+    def hook(state, targets):
+        # called at the start of each frame: the second call means the first
+        # frame has been drawn and presented
+        now = time.perf_counter()
+        if 'first_hook' not in marks:
+            marks['first_hook'] = now
+            pygame.event.post(pygame.event.Event(wake))
+        elif 'first_frame' not in marks:
+            marks['first_frame'] = now
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    pygame_app.main(frame_hook=hook, fps=0)
+    return {
+        'import_ms': (imported - t0) * 1000.0,
+        'init_ms': (marks['first_hook'] - imported) * 1000.0,
+        'first_frame_ms': (marks['first_frame'] - t0) * 1000.0,
+    }
+
+
+def run(runs=5, cold=False):
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', BACKEND_API_BASE='')
+    samples = []
+    with tempfile.TemporaryDirectory() as shared_dir:
+        for _ in range(runs):
+            with tempfile.TemporaryDirectory() as fresh_dir:
+                env['RPS_DATA_DIR'] = fresh_dir if cold else shared_dir
+                out = subprocess.run([sys.executable, __file__, '--child'], env=env,
+                                     capture_output=True, text=True, check=True)
+                samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    stats = {}
+    for key in ('import_ms', 'init_ms', 'first_frame_ms'):
+        values = sorted(s[key] for s in samples)
+        stats[key] = {'p50': percentile(values, 50), 'min': values[0], 'max': values[-1]}
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'mode': 'cold' if cold else 'warm',
+        'runs': runs,
+        'stats': stats,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Import-to-first-frame startup benchmark.')
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters to time')
+    parser.add_argument('--cold', action='store_true', help='empty data dir (no synth cache) for every run')
+    parser.add_argument('--output', help='write results JSON here')
+    parser.add_argument('--baseline', help='compare against an earlier results JSON')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed first-frame p50 slowdown')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure_once()))
+        return 0
+
+    result = run(args.runs, args.cold)
+    print(f"{'metric':<16} {'p50':>8} {'min':>8} {'max':>8}  (ms, {result['mode']}, {args.runs} runs)")
+    for key, s in result['stats'].items():
+        print(f"{key:<16} {s['p50']:8.1f} {s['min']:8.1f} {s['max']:8.1f}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2), encoding='utf-8')
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        base = baseline['stats']['first_frame_ms']['p50']
+        now = result['stats']['first_frame_ms']['p50']
+        if now > base * (1 + args.tolerance):
+            print(f'REGRESSION first_frame p50 {now:.1f} ms vs baseline {base:.1f} ms')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
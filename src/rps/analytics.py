@@ -0,0 +1,326 @@
+"""Match-history statistics over the binary replay logs.
+
+Run from the repo root with `python -m rps.analytics report` (PYTHONPATH=src).
+
+Each player's log is read in fixed-size windows of rounds (ReplayReader.chunks),
+so memory stays flat however large the file. Per window, frequencies are
+bincounts and streaks / match lengths come from run-length encoding the
+outcome and match-id columns; a run still open at the end of a window is
+carried into the next one. Without NumPy the same steps run as plain loops
+over smaller windows.
+
+Hours of day use the local UTC offset in force during each UTC hour, so a
+window spanning a DST change still buckets every round correctly. Records
+with an out-of-range 2-bit field (corruption; 3 is not a move or outcome)
+are counted in `invalid` and otherwise skipped.
+"""
+import argparse
+import sys
+import time
+from collections import Counter
+from functools import lru_cache
+from itertools import groupby
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the loops below take over
+    np = None
+
+from rps.logic import Outcome, moves
+from rps.replay import REPLAY_DIR, SUFFIX, TICK, ReplayReader, replay_path
+
+CHUNK_ROUNDS = 1 << 20 if np is not None else 1 << 16
+
+
+def bincount(values, minlength):
+    if np is not None and isinstance(values, np.ndarray):
+        return np.bincount(values, minlength=minlength).tolist()
+    counts = [0] * minlength
+    for v in values:
+        counts[v] += 1
+    return counts
+
+
+def run_lengths(values):
+    """Run-length encode a column: (run values, run lengths, run start indices)."""
+    if np is not None and isinstance(values, np.ndarray):
+        if not len(values):
+            return values[:0], np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        starts = np.concatenate(([0], np.flatnonzero(values[1:] != values[:-1]) + 1))
+        lengths = np.diff(np.append(starts, len(values)))
+        return values[starts], lengths, starts
+    run_values, lengths, starts = [], [], []
+    i = 0
+    for value, group in groupby(values):
+        n = sum(1 for _ in group)
+        run_values.append(value)
+        lengths.append(n)
+        starts.append(i)
+        i += n
+    return run_values, lengths, starts
+
+
+def segment_sums(flags, starts):
+    """Sum of a 0/1 column over each segment beginning at `starts`."""
+    if np is not None and isinstance(flags, np.ndarray):
+        if not len(starts):
+            return []
+        return np.add.reduceat(flags.astype(np.int64), starts).tolist()
+    bounds = list(starts) + [len(flags)]
+    return [sum(flags[a:b]) for a, b in zip(bounds, bounds[1:])]
+
+
+@lru_cache(maxsize=4096)
+def utc_offset_at(utc_hour):
+    """Local offset from UTC, in seconds, during the UTC hour `utc_hour` (hours since the epoch)."""
+    return time.localtime(utc_hour * 3600).tm_gmtoff
+
+
+def local_hours(ticks, base_time, utc_offset=None):
+    """Hour of day (0..23) of each round; `utc_offset` None means local time."""
+    if np is not None and isinstance(ticks, np.ndarray):
+        seconds = base_time + ticks * TICK
+        if utc_offset is None:
+            # rounds are in time order, so an hour's rounds form one run
+            hours, lengths, _ = run_lengths((seconds // 3600).astype(np.int64))
+            offsets = np.array([utc_offset_at(int(h)) for h in hours], dtype=np.float64)
+            seconds = seconds + np.repeat(offsets, lengths)
+        else:
+            seconds = seconds + utc_offset
+        return (seconds // 3600 % 24).astype(np.int64)
+    out = []
+    for t in ticks:
+        seconds = base_time + t * TICK
+        offset = utc_offset_at(int(seconds // 3600)) if utc_offset is None else utc_offset
+        out.append(int((seconds + offset) // 3600 % 24))
+    return out
+
+
+def valid_rows(cols):
+    """Drop records whose move or outcome field is out of range; returns (cols, dropped)."""
+    if np is not None and isinstance(cols["outcome"], np.ndarray):
+        ok = (cols["player"] < 3) & (cols["computer"] < 3) & (cols["outcome"] < 3)
+        dropped = len(ok) - int(np.count_nonzero(ok))
+        return ({key: column[ok] for key, column in cols.items()} if dropped else cols), dropped
+    keep = [i for i, (p, c, o) in enumerate(zip(cols["player"], cols["computer"], cols["outcome"]))
+            if p < 3 and c < 3 and o < 3]
+    dropped = len(cols["outcome"]) - len(keep)
+    if dropped:
+        cols = {key: [column[i] for i in keep] for key, column in cols.items()}
+    return cols, dropped
+
+
+class PlayerStats:
+    """Running totals for one player's rounds; feed update() then call finish()."""
+
+    def __init__(self, name):
+        self.name = name
+        self.rounds = 0
+        self.invalid = 0  # corrupt records skipped
+        self.outcomes = [0, 0, 0]  # indexed by Outcome
+        self.player_moves = [0, 0, 0]
+        self.computer_moves = [0, 0, 0]
+        self.hours = [0] * 24
+        self.win_streaks = Counter()  # round-win run length -> how many runs
+        self.match_lengths = Counter()  # rounds per match -> how many matches
+        self.matches_won = 0
+        self.matches_lost = 0
+        self.matches_level = 0  # abandoned or unfinished with equal round wins
+        self.match_streak = 0
+        self.best_streak = 0
+        self._open_streak = 0
+        self._open_match = None  # [match id, rounds, player wins, computer wins]
+
+    def update(self, cols, base_time, utc_offset=None):
+        """Fold one window of decoded replay columns (see replay.decode) into the totals.
+
+        `utc_offset` fixes the offset for hours of day (0 for UTC); None uses local time.
+        """
+        cols, dropped = valid_rows(cols)
+        self.invalid += dropped
+        n = len(cols["outcome"])
+        if not n:
+            return
+        self.rounds += n
+        _add(self.outcomes, bincount(cols["outcome"], 3))
+        _add(self.player_moves, bincount(cols["player"], 3))
+        _add(self.computer_moves, bincount(cols["computer"], 3))
+        _add(self.hours, bincount(local_hours(cols["ticks"], base_time, utc_offset), 24))
+
+        if np is not None and isinstance(cols["outcome"], np.ndarray):
+            won = cols["outcome"] == Outcome.PLAYER
+            lost = cols["outcome"] == Outcome.COMPUTER
+        else:
+            won = [int(o == Outcome.PLAYER) for o in cols["outcome"]]
+            lost = [int(o == Outcome.COMPUTER) for o in cols["outcome"]]
+        self._update_streaks(won)
+        self._update_matches(cols["match"], won, lost)
+
+    def _update_streaks(self, won):
+        values, lengths, _ = run_lengths(won)
+        for i, (value, length) in enumerate(zip(values, lengths)):
+            if not value:
+                self._close_streak()
+                continue
+            self._open_streak += int(length)
+            if i < len(lengths) - 1:
+                self._close_streak()
+        # a winning run touching the end of the window stays open
+
+    def _close_streak(self):
+        if self._open_streak:
+            self.win_streaks[self._open_streak] += 1
+            self._open_streak = 0
+
+    def _update_matches(self, match_ids, won, lost):
+        ids, lengths, starts = run_lengths(match_ids)
+        wins = segment_sums(won, starts)
+        losses = segment_sums(lost, starts)
+        for match_id, length, w, l in zip(ids, lengths, wins, losses):
+            match_id = int(match_id)
+            if self._open_match and self._open_match[0] == match_id:
+                self._open_match[1] += int(length)
+                self._open_match[2] += w
+                self._open_match[3] += l
+                continue
+            self._close_match()
+            self._open_match = [match_id, int(length), w, l]
+
+    def _close_match(self):
+        if self._open_match is None:
+            return
+        _, length, wins, losses = self._open_match
+        self._open_match = None
+        self.match_lengths[length] += 1
+        if wins > losses:
+            self.matches_won += 1
+            self.match_streak += 1
+            self.best_streak = max(self.best_streak, self.match_streak)
+        elif losses > wins:
+            self.matches_lost += 1
+            self.match_streak = 0
+        else:
+            self.matches_level += 1
+
+    def finish(self):
+        """Close the runs still open at the end of the log."""
+        self._close_streak()
+        self._close_match()
+        return self
+
+    @property
+    def round_win_rate(self):
+        decided = self.outcomes[Outcome.PLAYER] + self.outcomes[Outcome.COMPUTER]
+        return self.outcomes[Outcome.PLAYER] / decided if decided else None
+
+    @property
+    def match_win_rate(self):
+        decided = self.matches_won + self.matches_lost
+        return self.matches_won / decided if decided else None
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "rounds": self.rounds,
+            "invalid": self.invalid,
+            "outcomes": dict(zip(("tie", "player", "computer"), self.outcomes)),
+            "round_win_rate": self.round_win_rate,
+            "player_moves": dict(zip(moves, self.player_moves)),
+            "computer_moves": dict(zip(moves, self.computer_moves)),
+            "hours": list(self.hours),
+            "win_streaks": dict(sorted(self.win_streaks.items())),
+            "match_lengths": dict(sorted(self.match_lengths.items())),
+            "matches_won": self.matches_won,
+            "matches_lost": self.matches_lost,
+            "matches_level": self.matches_level,
+            "match_win_rate": self.match_win_rate,
+            "best_streak": self.best_streak,
+        }
+
+
+def _add(totals, counts):
+    for i, n in enumerate(counts):
+        totals[i] += n
+
+
+def analyze_file(path, chunk_size=CHUNK_ROUNDS, utc_offset=None):
+    """PlayerStats for one replay log, streamed `chunk_size` rounds at a time."""
+    path = Path(path)
+    stats = PlayerStats(path.stem)
+    with ReplayReader(path) as reader:
+        cols = None
+        for cols in reader.chunks(chunk_size):
+            stats.update(cols, reader.base_time, utc_offset)
+        del cols  # release the views before the map is closed
+    return stats.finish()
+
+
+def replay_files(directory=None, names=None):
+    directory = Path(directory or REPLAY_DIR)
+    if names:
+        return [replay_path(name, directory) for name in names]
+    return sorted(directory.glob("*" + SUFFIX))
+
+
+def _pct(value):
+    return "   -" if value is None else f"{100 * value:3.0f}%"
+
+
+def _shares(counts):
+    total = sum(counts) or 1
+    return " ".join(f"{name[0].upper()} {100 * n / total:3.0f}%" for name, n in zip(moves, counts))
+
+
+def format_report(all_stats):
+    if not all_stats:
+        return "no replay logs found"
+    width = max(6, max(len(s.name) for s in all_stats))
+    lines = [f"{'player':<{width}}  {'rounds':>7}  {'round%':>6}  {'W':>4} {'L':>4}  "
+             f"{'match%':>6}  {'best':>4}  {'longest':>7}  moves"]
+    for s in all_stats:
+        longest = max(s.win_streaks, default=0)
+        lines.append(f"{s.name:<{width}}  {s.rounds:7d}  {_pct(s.round_win_rate):>6}  "
+                     f"{s.matches_won:4d} {s.matches_lost:4d}  {_pct(s.match_win_rate):>6}  "
+                     f"{s.best_streak:4d}  {longest:7d}  {_shares(s.player_moves)}")
+    for s in all_stats:
+        lines.append("")
+        lines.append(f"{s.name}" + (f"  ({s.invalid} corrupt records skipped)" if s.invalid else ""))
+        lengths = ", ".join(f"{k}:{v}" for k, v in sorted(s.match_lengths.items()))
+        streaks = ", ".join(f"{k}:{v}" for k, v in sorted(s.win_streaks.items()))
+        lines.append(f"  rounds per match   {lengths or '-'}")
+        lines.append(f"  round-win streaks  {streaks or '-'}")
+        lines.append(f"  computer moves     {_shares(s.computer_moves)}")
+        peak = max(s.hours)
+        bars = "".join(" .:-=+*#"[min(7, -(-7 * n // peak))] if peak else " " for n in s.hours)
+        lines.append(f"  hour of day        |{bars}| (00-23, busiest {s.hours.index(peak):02d}:00)")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Statistics over the recorded replay logs.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    report_cmd = sub.add_parser("report", help="per-player summary of every recorded round")
+    report_cmd.add_argument("players", nargs="*", help="player names (default: every log)")
+    report_cmd.add_argument("--dir", default=str(REPLAY_DIR), help="directory with the .rpsr logs")
+    report_cmd.add_argument("--chunk-size", type=int, default=CHUNK_ROUNDS, help="rounds per window")
+    report_cmd.add_argument("--utc", action="store_true", help="hour of day in UTC instead of local time")
+    args = parser.parse_args(argv)
+
+    all_stats = []
+    for path in replay_files(args.dir, args.players):
+        try:
+            all_stats.append(analyze_file(path, args.chunk_size, 0 if args.utc else None))
+        except (OSError, ValueError) as exc:
+            print(f"skipping {path}: {exc}", file=sys.stderr)
+    print(format_report(all_stats))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
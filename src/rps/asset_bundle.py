@@ -0,0 +1,261 @@
+"""Packed, memory-mapped audio bundle.
+
+Sound effects are decoded once, at build time, into the mixer's native
+sample format and packed into a single file together with the music track,
+which stays in its original (compressed) encoding:
+
+    header   magic b'RPSA', version, entry count, rate, sample size, channels
+    index    one (name, offset, length) record per entry
+    payload  raw PCM per effect, the music file as-is under 'music.<ext>',
+             each starting on an ALIGN boundary
+
+At runtime the file is opened once and mmap'd read-only. Effects are
+created from memoryview slices of the map; pygame.mixer.Sound copies the
+PCM, so each process still holds its own copy of the (small) effects, and
+what the bundle saves is the per-file opens and decodes. Music is streamed
+by pygame.mixer.music through a file object limited to its entry, reading
+the bundle file a block at a time: nothing is copied up front, and those
+reads come from the OS page cache shared by every game instance on the
+host. When the bundle is missing or was built for a different mixer
+format, callers fall back to the loose files.
+
+    python -m rps.asset_bundle build [--rate 44100 --channels 2]
+"""
+import argparse
+import io
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+
+import pygame
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rps import synth
+
+ASSET_DIR = ROOT / 'assets' / 'audio'
+BUNDLE_PATH = ASSET_DIR / 'audio.rpsb'
+
+MAGIC = b'RPSA'
+VERSION = 2
+ALIGN = 4096
+HEADER = struct.Struct('<4sHHIhH')  # magic, version, count, rate, size, channels
+NAME_SIZE = 32
+ENTRY = struct.Struct(f'<{NAME_SIZE}sQQ')  # name, offset, length
+
+# sound name -> (loose file under assets/audio, synth.sine parameters if it is missing)
+SFX = {
+    'dramatic': ('sfx_dramatic.wav', {'freq': 120.0, 'duration': 0.8, 'volume': 0.9}),
+    'click': ('sfx_click.wav', {'freq': 880.0, 'duration': 0.06, 'volume': 0.5}),
+    'win': ('sfx_win.wav', {'freq': 660.0, 'duration': 0.18, 'volume': 0.6}),
+}
+MUSIC = 'music'
+
+
+def find_music(asset_dir=ASSET_DIR):
+    """Music file to use, or None if there is none.
+
+    Drop "lotr_battle.mp3" (or any MP3 with 'lotr'/'lord' in its name) into
+    assets/audio to prefer it over bg_battle.wav.
+    """
+    asset_dir = Path(asset_dir)
+    try:
+        names = os.listdir(asset_dir)
+    except OSError:
+        return None
+    for name in names:
+        lower = name.lower()
+        if lower.endswith('.mp3') and ('lotr' in lower or 'lord' in lower):
+            return asset_dir / name
+    fallback = asset_dir / 'bg_battle.wav'
+    return fallback if fallback.exists() else None
+
+
+def load_sfx(name, asset_dir=ASSET_DIR):
+    """Sound for an SFX entry from its loose WAV, synthesized if the file is missing."""
+    filename, params = SFX[name]
+    path = Path(asset_dir) / filename
+    if path.exists():
+        return pygame.mixer.Sound(str(path))
+    return synth.make_sound('sine', **params)
+
+
+def _aligned(offset):
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def write_bundle(path, fmt, payloads):
+    """Write `payloads` ({name: PCM bytes}) for mixer format `fmt` = (rate, size, channels)."""
+    path = Path(path)
+    names = list(payloads)
+    offset = _aligned(HEADER.size + ENTRY.size * len(names))
+    index = []
+    for name in names:
+        encoded = name.encode('utf-8')
+        if len(encoded) > NAME_SIZE:
+            raise ValueError(f'asset name too long: {name!r}')
+        index.append((encoded, offset, len(payloads[name])))
+        offset = _aligned(offset + len(payloads[name]))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(names), *fmt))
+        for entry in index:
+            f.write(ENTRY.pack(*entry))
+        for (encoded, start, length), name in zip(index, names):
+            f.seek(start)
+            f.write(payloads[name])
+        f.truncate(_aligned(f.tell()))
+    os.replace(tmp, path)
+    return path
+
+
+class EntryReader(io.RawIOBase):
+    """Read-only, seekable view of `length` bytes at `offset` in a file."""
+
+    def __init__(self, path, offset, length):
+        super().__init__()
+        self._file = open(path, 'rb')
+        self._start = offset
+        self._length = length
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = min(len(buffer), self._length - self._pos)
+        if n <= 0:
+            return 0
+        self._file.seek(self._start + self._pos)
+        n = self._file.readinto(memoryview(buffer)[:n])
+        self._pos += n
+        return n
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._length}[whence]
+        self._pos = max(0, base + pos)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        if not self.closed:
+            self._file.close()
+        super().close()
+
+
+class AssetBundle:
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, count, rate, size, channels = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f'{self.path} is not a version {VERSION} audio bundle')
+            self.format = (rate, size, channels)
+            self.index = {}
+            for i in range(count):
+                name, offset, length = ENTRY.unpack_from(self._map, HEADER.size + i * ENTRY.size)
+                if offset + length > len(self._map):
+                    raise ValueError(f'{self.path} is truncated')
+                self.index[name.rstrip(b'\0').decode('utf-8')] = (offset, length)
+        except (struct.error, ValueError):
+            self._map.close()
+            raise
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def payload(self, name):
+        """Zero-copy memoryview of an entry's PCM; release() it before close()."""
+        offset, length = self.index[name]
+        with memoryview(self._map) as whole:
+            return whole[offset:offset + length]
+
+    def sound(self, name):
+        with self.payload(name) as view:
+            return pygame.mixer.Sound(buffer=view)
+
+    def music_entry(self):
+        """Name of the music entry ('music.<ext>'), or None if there is none."""
+        for name in self.index:
+            if name.startswith(MUSIC + '.'):
+                return name
+        return None
+
+    def music(self):
+        """(file object, namehint) for pygame.mixer.music.load, or None.
+
+        The file object reads the entry straight from the bundle file (its own
+        handle, so mixer.music can keep streaming after close()).
+        """
+        name = self.music_entry()
+        if name is None:
+            return None
+        offset, length = self.index[name]
+        return EntryReader(self.path, offset, length), name.split('.', 1)[1]
+
+    def close(self):
+        self._map.close()
+
+
+def open_bundle(path=BUNDLE_PATH, mixer_format=None):
+    """Open the bundle if it exists, is valid and matches `mixer_format`; else None."""
+    try:
+        bundle = AssetBundle(path)
+    except (OSError, ValueError, struct.error):
+        return None
+    if mixer_format is not None and tuple(mixer_format) != bundle.format:
+        bundle.close()
+        return None
+    return bundle
+
+
+def build(output=BUNDLE_PATH, rate=synth.RATE, channels=2, asset_dir=ASSET_DIR):
+    """Decode every SFX through SDL into the mixer format and pack them with the music file."""
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')  # read by SDL at mixer.init
+    pygame.mixer.init(frequency=rate, size=-16, channels=channels)
+    try:
+        fmt = pygame.mixer.get_init()
+        payloads = {name: load_sfx(name, asset_dir).get_raw() for name in SFX}
+        music = Path(find_music(asset_dir) or synth.cached_wav('battle_music', rate=fmt[0]))
+        payloads[MUSIC + music.suffix.lower()] = music.read_bytes()
+        return write_bundle(output, fmt, payloads)
+    finally:
+        pygame.mixer.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Pack the game audio into a memory-mapped bundle.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    build_cmd = sub.add_parser('build', help='decode assets/audio into a bundle')
+    build_cmd.add_argument('--output', default=str(BUNDLE_PATH))
+    build_cmd.add_argument('--rate', type=int, default=synth.RATE, help='mixer frequency the game uses')
+    build_cmd.add_argument('--channels', type=int, default=2, help='mixer channels the game uses')
+    build_cmd.add_argument('--assets', default=str(ASSET_DIR), help='directory with the source audio')
+    args = parser.parse_args(argv)
+
+    path = build(args.output, args.rate, args.channels, args.assets)
+    bundle = AssetBundle(path)
+    try:
+        for name, (offset, length) in bundle.index.items():
+            print(f'{name:<10} {length / 1024:9.1f} KiB @ {offset}')
+        print(f'wrote {path} ({path.stat().st_size / 1024:.1f} KiB, format {bundle.format})')
+    finally:
+        bundle.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
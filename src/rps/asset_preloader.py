@@ -0,0 +1,66 @@
+"""Background asset loading so the first frame is not held up by audio.
+
+Jobs run in order on one daemon thread. The game loop polls get()/ready()
+each frame and simply plays nothing until a sound has arrived; a job that
+raises leaves its result as None (the error is kept in `errors`). cancel()
+skips the jobs that have not started yet, e.g. at shutdown.
+"""
+import threading
+
+
+class AssetPreloader:
+    def __init__(self):
+        self._jobs = []
+        self._results = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self.errors = {}
+        self.done = threading.Event()
+        self._cancelled = threading.Event()
+
+    def add(self, name, fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs); its return value becomes get(name)."""
+        if self._thread is not None:
+            raise RuntimeError('cannot add jobs after start()')
+        self._jobs.append((name, fn, args, kwargs))
+        return self
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='rps-preload', daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            for name, fn, args, kwargs in self._jobs:
+                if self._cancelled.is_set():
+                    break
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as exc:
+                    result = None
+                    self.errors[name] = exc
+                with self._lock:
+                    self._results[name] = result
+        finally:
+            self.done.set()
+
+    def ready(self, name):
+        with self._lock:
+            return name in self._results
+
+    def get(self, name, default=None):
+        """Loaded value, or `default` if the job has not finished (never blocks)."""
+        with self._lock:
+            result = self._results.get(name)
+        return default if result is None else result
+
+    def cancel(self):
+        """Drop the jobs that have not started; the running one still finishes."""
+        self._cancelled.set()
+
+    def wait(self, timeout=None):
+        """Block until every job has run (or was cancelled); returns False on timeout."""
+        if self._thread is None:
+            return True
+        return self.done.wait(timeout)
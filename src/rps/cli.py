@@ -9,6 +9,7 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 from rps.logic import get_computer_move, winner_decider
+from rps.replay import ReplayWriter
 
 
 def main():
@@ -27,42 +28,55 @@ def main():
         "\033[33;1m However, press enter to have the best duel you will ever experience in your life \033[0m \n"
     ).lower()
 
-    is_true = True
-    while is_true:
-        if quit_yes == "quit":
-            break
-
-        player_move = input("Pick your move - Rock, Paper or Scissors - ").lower()
-
-        if player_move == "quit":
-            break
-        if player_move not in moves:
-            print("invalid move, try again :)")
-            continue
-
-        computer_move = get_computer_move()
-
-        print("Computer chose", computer_move)
-
-        result = winner_decider(player_move, computer_move)
-
-        if result == "tie":
-            print("It is a tie! Let's go again \n")
-            print("Your score:", player_score)
-            print("Computer's score:", computer_score)
-            continue
-        elif result == "player":
-            print("YOU WIN!! \n")
-            player_score = player_score + 1
-            print("Your score:", player_score)
-            print("Computer's score:", computer_score)
-            continue
-        else:
-            print("Computer wins! \n")
-            computer_score = computer_score + 1
-            print("Your score:", player_score)
-            print("Computer's score:", computer_score)
-            continue
+    # the whole session counts as one match in the replay log
+    try:
+        replay = ReplayWriter.for_player(player_name)
+    except (OSError, ValueError):
+        replay = None
+
+    try:
+        is_true = True
+        while is_true:
+            if quit_yes == "quit":
+                break
+
+            player_move = input("Pick your move - Rock, Paper or Scissors - ").lower()
+
+            if player_move == "quit":
+                break
+            if player_move not in moves:
+                print("invalid move, try again :)")
+                continue
+
+            computer_move = get_computer_move()
+
+            print("Computer chose", computer_move)
+
+            result = winner_decider(player_move, computer_move)
+            if replay:
+                replay.record(player_move, computer_move, result)
+
+            if result == "tie":
+                print("It is a tie! Let's go again \n")
+                print("Your score:", player_score)
+                print("Computer's score:", computer_score)
+                continue
+            elif result == "player":
+                print("YOU WIN!! \n")
+                player_score = player_score + 1
+                print("Your score:", player_score)
+                print("Computer's score:", computer_score)
+                continue
+            else:
+                print("Computer wins! \n")
+                computer_score = computer_score + 1
+                print("Your score:", player_score)
+                print("Computer's score:", computer_score)
+                continue
+    finally:
+        # Ctrl+C or EOF at input() must not drop the buffered rounds
+        if replay:
+            replay.close()
 
     if player_score == computer_score == 0:
         print("\033[1;31m Just try the game once and I am sure you will love it!! \033[0m")
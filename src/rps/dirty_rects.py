@@ -0,0 +1,46 @@
+"""Dirty-rectangle bookkeeping for the Pygame UI.
+
+Each frame the UI describes its screen regions as (rect, signature) pairs,
+where the signature is any hashable value capturing what the region shows.
+DirtyTracker compares them with the previous frame and returns only the
+rects whose content changed, for pygame.display.update(rects). A change of
+layout (screen state, theme) marks the whole window dirty.
+"""
+import pygame
+
+
+class DirtyTracker:
+    def __init__(self, screen_rect):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self._layout = None
+        self._regions = {}  # name -> (rect, signature)
+        self.frames = 0
+        self.full_frames = 0
+        self.skipped_frames = 0
+
+    def invalidate(self):
+        """Force the next diff to report the whole window (e.g. after an expose event)."""
+        self._layout = None
+
+    def diff(self, layout, regions):
+        """Return the rects to redraw for `regions` ({name: (rect, signature)})."""
+        self.frames += 1
+        previous = self._regions
+        self._regions = {name: (pygame.Rect(rect), sig) for name, (rect, sig) in regions.items()}
+        if layout != self._layout:
+            self._layout = layout
+            self.full_frames += 1
+            return [self.screen_rect]
+        dirty = []
+        for name, (rect, sig) in self._regions.items():
+            old = previous.get(name)
+            if old is None or old[1] != sig:
+                dirty.append(rect)
+            if old is not None and old[0] != rect:
+                dirty.append(old[0])
+        for name, (rect, _) in previous.items():
+            if name not in self._regions:
+                dirty.append(rect)
+        if not dirty:
+            self.skipped_frames += 1
+        return dirty
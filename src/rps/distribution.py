@@ -0,0 +1,140 @@
+"""Population summary for "top X%" ranks without downloading the board.
+
+The backend answers GET /distribution with fixed-bucket histograms of every
+player's best streak and win percentage. A histogram is a few hundred
+integers whatever the player count, merges by adding counts, and answers
+"what share of players are at or above this value" from a cached suffix sum,
+so a player outside the top-10 window can still be told where they stand.
+"""
+from itertools import accumulate
+
+from rps.leaderboard import win_pct as record_win_pct
+
+STREAK_BINS = 64  # streaks 0..62 exactly, 63 and up share the last bin
+WIN_PCT_BINS = 101  # whole percentages 0..100
+
+
+class Histogram:
+    """Counts of values in `bins` buckets of `width`; the last bucket is open-ended."""
+
+    def __init__(self, bins, width=1, counts=None):
+        self.bins = bins
+        self.width = width
+        self.counts = [0] * bins
+        for i, n in enumerate(list(counts or [])[:bins]):
+            self.counts[i] = int(n)
+        self._at_or_above = None
+
+    @property
+    def total(self):
+        return self.at_or_above_bin(0)
+
+    def bin(self, value):
+        return min(self.bins - 1, max(0, int(value // self.width)))
+
+    def add(self, value, n=1):
+        self.counts[self.bin(value)] += n
+        self._at_or_above = None
+
+    def remove(self, value, n=1):
+        i = self.bin(value)
+        self.counts[i] = max(0, self.counts[i] - n)
+        self._at_or_above = None
+
+    def merge(self, other):
+        if (other.bins, other.width) != (self.bins, self.width):
+            raise ValueError("histograms have different buckets")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self._at_or_above = None
+        return self
+
+    def at_or_above_bin(self, i):
+        if self._at_or_above is None:
+            # suffix sums, rebuilt only after a change: O(bins) once, then O(1) per query
+            self._at_or_above = list(accumulate(reversed(self.counts)))[::-1] + [0]
+        return self._at_or_above[i]
+
+    def top_fraction(self, value):
+        """Share of the population whose value falls in this bucket or above (0..1)."""
+        total = self.total
+        return self.at_or_above_bin(self.bin(value)) / total if total else None
+
+    def quantile(self, q):
+        """Lower edge of the bucket holding the q-th quantile (0 <= q <= 1)."""
+        total = self.total
+        if not total:
+            return None
+        target = q * total
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= target:
+                return i * self.width
+        return (self.bins - 1) * self.width
+
+    def to_dict(self):
+        counts = list(self.counts)
+        while counts and not counts[-1]:
+            counts.pop()  # trailing zeros are implied; keeps the payload small
+        return {"width": self.width, "counts": counts}
+
+    @classmethod
+    def from_dict(cls, data, bins):
+        return cls(bins, data.get("width", 1), data.get("counts"))
+
+
+class Distribution:
+    """best_streak and win_pct histograms for the whole player population."""
+
+    def __init__(self, best_streak=None, win_pct=None):
+        self.best_streak = best_streak or Histogram(STREAK_BINS)
+        self.win_pct = win_pct or Histogram(WIN_PCT_BINS)
+        self.version = 0  # bumped on every change, like LeaderboardIndex.version
+
+    @property
+    def total(self):
+        return self.best_streak.total
+
+    @classmethod
+    def from_payload(cls, payload):
+        """Build from a GET /distribution body; None if it is missing or malformed."""
+        try:
+            return cls(
+                Histogram.from_dict(payload["best_streak"], STREAK_BINS),
+                Histogram.from_dict(payload["win_pct"], WIN_PCT_BINS),
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+
+    def to_payload(self):
+        return {"total": self.total, "best_streak": self.best_streak.to_dict(),
+                "win_pct": self.win_pct.to_dict()}
+
+    def merge(self, other):
+        self.best_streak.merge(other.best_streak)
+        self.win_pct.merge(other.win_pct)
+        self.version += 1
+        return self
+
+    def update_player(self, old, new):
+        """Move one player from their `old` record (None if unseen) to `new`."""
+        if old:
+            self.best_streak.remove(int(old.get("best_streak") or 0))
+            self.win_pct.remove(record_win_pct(old))
+        if new:
+            self.best_streak.add(int(new.get("best_streak") or 0))
+            self.win_pct.add(record_win_pct(new))
+        self.version += 1
+
+    def top_percent(self, rec):
+        """Approximate "top X%" for a record's best streak (win_pct breaks ties), or None."""
+        streak = int(rec.get("best_streak") or 0)
+        frac = self.best_streak.top_fraction(streak)
+        if frac is None:
+            return None
+        bin_share = self.best_streak.counts[self.best_streak.bin(streak)]
+        if bin_share > 1 and self.win_pct.total:
+            # place the player inside their streak bucket by win rate
+            within = self.win_pct.top_fraction(record_win_pct(rec))
+            frac -= bin_share / self.total * (1 - within)
+        return max(1, min(100, round(frac * 100)))
@@ -0,0 +1,52 @@
+"""Adaptive frame pacing for the Pygame loops.
+
+While something animates (the 3-2-1 countdown, a blinking cursor due to
+flip) the loop runs at the full frame rate. Otherwise it blocks in
+pygame.event.wait until input arrives or the next scheduled change, so a
+static screen costs almost no CPU.
+"""
+import pygame
+
+# High-frequency events none of the screens react to. Dropping them at the
+# SDL queue keeps them from waking an idle loop (e.g. every mouse move).
+NOISY_EVENTS = [
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONUP,
+    pygame.KEYUP,
+    pygame.JOYAXISMOTION,
+    pygame.JOYBALLMOTION,
+    pygame.JOYHATMOTION,
+    pygame.FINGERMOTION,
+]
+
+
+def block_noisy_events(extra_allowed=()):
+    """Stop queueing NOISY_EVENTS, except those a caller still needs."""
+    pygame.event.set_blocked([t for t in NOISY_EVENTS if t not in extra_allowed])
+
+
+class FramePacer:
+    def __init__(self, fps=60, idle_timeout_ms=1000):
+        self.fps = fps
+        self.idle_timeout_ms = idle_timeout_ms
+        self.clock = pygame.time.Clock()
+        self.idle_waits = 0
+
+    def next_frame(self, animating, wake_in_ms=None):
+        """Wait for the next frame and return (dt_seconds, events).
+
+        animating: run at `fps` and return whatever events are queued.
+        Otherwise block until an event arrives or `wake_in_ms` (default
+        idle_timeout_ms) passes. Time spent idle is not reported in dt, so
+        an animation started by the waking event begins from zero.
+        """
+        if animating:
+            dt = self.clock.tick(self.fps) / 1000.0
+            return dt, pygame.event.get()
+        timeout = self.idle_timeout_ms if wake_in_ms is None else max(1, int(wake_in_ms))
+        self.idle_waits += 1
+        first = pygame.event.wait(timeout)
+        self.clock.tick()
+        if first.type == pygame.NOEVENT:
+            return 0.0, []
+        return 0.0, [first] + pygame.event.get()
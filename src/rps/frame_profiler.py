@@ -0,0 +1,98 @@
+"""Opt-in per-phase frame timing for the Pygame loop.
+
+Set RPS_PROFILE=1 (or RPS_PROFILE=<path.json|path.csv>) to record how long
+each frame spends handling events, resolving rounds, drawing, presenting and
+waiting on shared_scores calls. Samples live in fixed-size ring buffers; F3
+shows a HUD with rolling p50/p95/p99 and the summary is written on exit.
+"""
+import csv
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+
+from rps.render_cache import render_text
+
+PHASES = ('events', 'logic', 'draw', 'present', 'network')
+DEFAULT_EXPORT = 'frame_metrics.json'
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round((len(sorted_values) - 1) * pct / 100.0)))
+    return sorted_values[idx]
+
+
+class FrameProfiler:
+    def __init__(self, capacity=600, export_path=None, hud_refresh_s=0.5):
+        self.buffers = {phase: deque(maxlen=capacity) for phase in PHASES}
+        self.export_path = export_path
+        self.hud_visible = False
+        self.hud_refresh_s = hud_refresh_s
+        self._hud_lines = ()
+        self._hud_at = 0.0
+
+    @classmethod
+    def from_env(cls, data_dir):
+        """Build a profiler if RPS_PROFILE is set, else return None."""
+        value = os.getenv('RPS_PROFILE', '')
+        if not value or value == '0':
+            return None
+        path = Path(data_dir) / DEFAULT_EXPORT if value == '1' else Path(value)
+        return cls(export_path=path)
+
+    def add(self, phase, seconds):
+        # deque.append is atomic, so worker threads may record 'network' directly
+        self.buffers[phase].append(seconds * 1000.0)
+
+    def summary(self):
+        out = {}
+        for phase, buf in self.buffers.items():
+            values = sorted(buf)
+            out[phase] = {
+                'samples': len(values),
+                'p50_ms': _percentile(values, 50),
+                'p95_ms': _percentile(values, 95),
+                'p99_ms': _percentile(values, 99),
+            }
+        return out
+
+    def hud_lines(self):
+        """Summary lines for the HUD, recomputed at most every hud_refresh_s."""
+        now = time.monotonic()
+        if now - self._hud_at >= self.hud_refresh_s:
+            self._hud_at = now
+            self._hud_lines = tuple(
+                f"{phase:<8}{s['p50_ms']:6.2f}{s['p95_ms']:7.2f}{s['p99_ms']:7.2f}"
+                for phase, s in self.summary().items()
+            )
+        return self._hud_lines
+
+    def draw_hud(self, surface, font, pos=(8, 8), color=(120, 255, 120)):
+        """Draw the HUD; returns the rect it covers."""
+        x, y = pos
+        lines = ('phase     p50    p95    p99',) + self.hud_lines()
+        width = 0
+        for line in lines:
+            txt = render_text(font, line, color)
+            surface.blit(txt, (x, y))
+            width = max(width, txt.get_width())
+            y += font.get_linesize()
+        return x, pos[1], width, y - pos[1]
+
+    def export(self, path=None):
+        path = Path(path or self.export_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        summary = self.summary()
+        if path.suffix.lower() == '.csv':
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['phase', 'samples', 'p50_ms', 'p95_ms', 'p99_ms'])
+                for phase, s in summary.items():
+                    writer.writerow([phase, s['samples'], f"{s['p50_ms']:.3f}",
+                                     f"{s['p95_ms']:.3f}", f"{s['p99_ms']:.3f}"])
+        else:
+            path.write_text(json.dumps(summary, indent=2), encoding='utf-8')
+        return path
@@ -8,7 +8,10 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
+from rps.asset_preloader import AssetPreloader
+from rps.frame_pacer import FramePacer, block_noisy_events
 from rps.logic import get_computer_move, winner_decider
+from rps.render_cache import overlay_layer, render_text
 
 WIDTH, HEIGHT = 800, 480
 BG_COLOR = (18, 18, 30)
@@ -16,25 +19,38 @@ PANEL_COLOR = (26, 26, 40)
 ACCENT = (255, 168, 0)
 TEXT_COLOR = (230, 230, 230)
 
-pygame.init()
-pygame.mixer.init()
-
 ASSET_DIR = Path(__file__).resolve().parents[2] / "assets" / "audio"
 
-# --- LOAD SOUNDS (now under assets/audio) ---
-try:
-    pygame.mixer.music.load(str(ASSET_DIR / "bg_battle.wav"))
-    pygame.mixer.music.set_volume(0.3)
-    pygame.mixer.music.play(-1)  # loop forever
-except pygame.error:
-    pygame.mixer.music.stop()
-
-try:
-    SND_WIN = pygame.mixer.Sound(str(ASSET_DIR / "sfx_win.wav"))
-    SND_LOSE = pygame.mixer.Sound(str(ASSET_DIR / "sfx_dramatic.wav"))
-    SND_TIE = pygame.mixer.Sound(str(ASSET_DIR / "sfx_click.wav"))
-except pygame.error:
-    SND_WIN = SND_LOSE = SND_TIE = None
+
+def start_audio():
+    """Initialise the mixer and preload music/SFX in the background.
+
+    Returns the AssetPreloader; sounds are looked up by name ('win', 'lose',
+    'tie') once loaded, and the music starts as soon as it has been decoded.
+    """
+    assets = AssetPreloader()
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        return assets.start()
+
+    def load_music():
+        pygame.mixer.music.load(str(ASSET_DIR / "bg_battle.wav"))
+        pygame.mixer.music.set_volume(0.3)
+        pygame.mixer.music.play(-1)  # loop forever
+        return True
+
+    assets.add("music", load_music)
+    assets.add("win", pygame.mixer.Sound, str(ASSET_DIR / "sfx_win.wav"))
+    assets.add("lose", pygame.mixer.Sound, str(ASSET_DIR / "sfx_dramatic.wav"))
+    assets.add("tie", pygame.mixer.Sound, str(ASSET_DIR / "sfx_click.wav"))
+    return assets.start()
+
+
+def play_sound(assets, name):
+    sound = assets.get(name)
+    if sound:
+        sound.play()
 
 class Button:
     def __init__(self, rect, text, color, key=None):
@@ -45,42 +61,38 @@ class Button:
 
     def draw(self, surf, font):
         pygame.draw.rect(surf, self.color, self.rect, border_radius=8)
-        txt = font.render(self.text, True, (0, 0, 0))
+        txt = render_text(font, self.text, (0, 0, 0))
         surf.blit(txt, txt.get_rect(center=self.rect.center))
 
     def is_clicked(self, pos):
         return self.rect.collidepoint(pos)
 
 def draw_text_center(surf, text, font, y, color=TEXT_COLOR):
-    txt = font.render(text, True, color)
+    txt = render_text(font, text, color)
     surf.blit(txt, txt.get_rect(center=(WIDTH // 2, y)))
 
 def show_quit_dialog(screen, font_mid, font_small):
     """Return True if user confirms quit, False otherwise."""
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    screen.blit(overlay, (0, 0))
-
     box_w, box_h = 500, 220
     box_rect = pygame.Rect((WIDTH - box_w) // 2, (HEIGHT - box_h) // 2, box_w, box_h)
-    pygame.draw.rect(screen, PANEL_COLOR, box_rect, border_radius=12)
-    pygame.draw.rect(screen, ACCENT, box_rect, 2, border_radius=12)
+    layer = overlay_layer((WIDTH, HEIGHT), (0, 0, 0, 180), box_rect, PANEL_COLOR, border=(ACCENT, 2))
+    screen.blit(layer, (0, 0))
 
     draw_text_center(screen, "Are you sure you want to quit?", font_mid, box_rect.y + 50)
     draw_text_center(screen, "Press Y to quit, N to stay", font_small, box_rect.y + 110)
 
     pygame.display.flip()
 
-    waiting = True
-    while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+    # block on the queue instead of spinning while the dialog is up
+    while True:
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            return True
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_y, pygame.K_RETURN):
                 return True
-            if event.type == pygame.KEYDOWN:
-                if event.key in (pygame.K_y, pygame.K_RETURN):
-                    return True
-                if event.key in (pygame.K_n, pygame.K_ESCAPE):
-                    return False
+            if event.key in (pygame.K_n, pygame.K_ESCAPE):
+                return False
 
 def show_final_message(screen, font_mid, font_small, player_name, player_score, computer_score):
     if player_score == computer_score == 0:
@@ -109,17 +121,18 @@ def show_final_message(screen, font_mid, font_small, player_name, player_score,
 
     waiting = True
     while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                waiting = False
-            elif event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
-                waiting = False
+        event = pygame.event.wait()
+        if event.type in (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+            waiting = False
 
 def main():
+    pygame.init()
+    assets = start_audio()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Rock · Paper · Scissors — Retro Duel")
 
-    clock = pygame.time.Clock()
+    pacer = FramePacer(fps=60)
+    block_noisy_events()
     large = pygame.font.SysFont("couriernew", 48, bold=True)
     mid = pygame.font.SysFont("couriernew", 28)
     small = pygame.font.SysFont("couriernew", 20)
@@ -144,8 +157,8 @@ def main():
 
     running = True
     while running:
-        dt = clock.tick(60) / 1000.0
-        for event in pygame.event.get():
+        dt, events = pacer.next_frame(countdown > 0)
+        for event in events:
             if event.type == pygame.QUIT:
                 if show_quit_dialog(screen, mid, small):
                     running = False
@@ -168,17 +181,14 @@ def main():
                 if result == "player":
                     player_score += 1
                     round_result = "YOU WIN!"
-                    if SND_WIN:
-                        SND_WIN.play()
+                    play_sound(assets, "win")
                 elif result == "computer":
                     computer_score += 1
                     round_result = "COMPUTER WINS"
-                    if SND_LOSE:
-                        SND_LOSE.play()
+                    play_sound(assets, "lose")
                 else:
                     round_result = "IT'S A TIE"
-                    if SND_TIE:
-                        SND_TIE.play()
+                    play_sound(assets, "tie")
                 show_move = (pending_player, computer_move)
                 pending_player = None
 
@@ -215,12 +225,13 @@ def main():
         for b in buttons:
             b.draw(screen, mid)
 
-        footer = small.render("Press ESC to quit — Built with Pygame", True, (150, 150, 150))
+        footer = render_text(small, "Press ESC to quit — Built with Pygame", (150, 150, 150))
         screen.blit(footer, (20, HEIGHT - 30))
 
         pygame.display.flip()
 
     show_final_message(screen, mid, small, player_name, player_score, computer_score)
+    assets.wait(timeout=5)
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,258 @@
+"""Client-side leaderboard ordered by (best_streak, win_pct, name).
+
+Sort keys are kept in a bisect-maintained list, so a player's rank is a
+binary search and an update is a binary search plus one list shift (a
+memmove, cheap even at 100k+ names). The Pygame UI keeps the backend's top
+window in one index instead of re-sorting the list on each frame: a
+leaderboard fetch replaces the window, and upsert results and player
+lookups are merged into it.
+"""
+from bisect import bisect_left, insort
+
+
+def normalize_name(name):
+    return (name or "").strip().lower()
+
+
+def win_pct(rec):
+    """Backend-computed win_pct when present, else derived from the match counts."""
+    pct = rec.get("win_pct")
+    if pct is not None:
+        try:
+            return float(pct)
+        except (TypeError, ValueError):
+            pass
+    won = int(rec.get("matches_won") or 0)
+    total = won + int(rec.get("matches_lost") or 0)
+    return 100.0 * won / total if total else 0.0
+
+
+def sort_key(rec):
+    # ascending order of this key is best-first
+    return -int(rec.get("best_streak") or 0), -win_pct(rec), normalize_name(rec.get("name"))
+
+
+class LeaderboardIndex:
+    def __init__(self, records=()):
+        self._keys = []
+        self._records = {}
+        self.version = 0  # bumped on every change; cheap "did the board change" signature
+        self.merge(records)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, name):
+        return normalize_name(name) in self._records
+
+    def update(self, rec):
+        """Insert or replace one player's record. Returns True if the board changed."""
+        if not rec or not rec.get("name"):
+            return False
+        name = normalize_name(rec["name"])
+        rec = dict(rec, name=name)
+        old = self._records.get(name)
+        if old == rec:
+            return False
+        if old is not None:
+            del self._keys[bisect_left(self._keys, sort_key(old))]
+        insort(self._keys, sort_key(rec))
+        self._records[name] = rec
+        self.version += 1
+        return True
+
+    def merge(self, records):
+        """update() each record of a list (e.g. a fetch_leaderboard page) or a single dict.
+
+        Large batches (an initial load, a big page) skip the per-record
+        inserts and re-sort the keys once instead.
+        """
+        if isinstance(records, dict):
+            records = [records]
+        records = [rec for rec in records or () if rec and rec.get("name")]
+        if len(records) <= max(64, len(self._keys) // 4):
+            changed = False
+            for rec in records:
+                changed = self.update(rec) or changed
+            return changed
+        changed = False
+        for rec in records:
+            name = normalize_name(rec["name"])
+            rec = dict(rec, name=name)
+            if self._records.get(name) != rec:
+                self._records[name] = rec
+                changed = True
+        if changed:
+            self._keys = sorted(sort_key(rec) for rec in self._records.values())
+            self.version += 1
+        return changed
+
+    def replace(self, records, keep=()):
+        """Make a freshly fetched window the board's contents.
+
+        Players missing from `records` are dropped, so ones who fell out of
+        the top window stop ranking with stale totals. Names in `keep` (the
+        local player, known from a lookup) survive. Returns True on change.
+        """
+        if isinstance(records, dict):
+            records = [records]
+        fresh = {}
+        for rec in records or ():
+            if rec and rec.get("name"):
+                name = normalize_name(rec["name"])
+                fresh[name] = dict(rec, name=name)
+        for name in keep:
+            name = normalize_name(name)
+            if name and name not in fresh and name in self._records:
+                fresh[name] = self._records[name]
+        if fresh == self._records:
+            return False
+        self._records = fresh
+        self._keys = sorted(sort_key(rec) for rec in fresh.values())
+        self.version += 1
+        return True
+
+    def remove(self, name):
+        old = self._records.pop(normalize_name(name), None)
+        if old is not None:
+            del self._keys[bisect_left(self._keys, sort_key(old))]
+            self.version += 1
+
+    def get(self, name):
+        return self._records.get(normalize_name(name))
+
+    def rank(self, name):
+        """0-based position of a player, or None if they are not on the board."""
+        rec = self.get(name)
+        return None if rec is None else bisect_left(self._keys, sort_key(rec))
+
+    def position(self, rec):
+        """0-based place a (possibly unlisted) record would take on the board."""
+        return bisect_left(self._keys, sort_key(rec))
+
+    def _at(self, start, stop):
+        return [self._records[key[2]] for key in self._keys[start:stop]]
+
+    def top(self, k=10):
+        return self._at(0, k)
+
+    def around(self, name, radius=2):
+        """(first_rank, records) for the players within `radius` places of `name`."""
+        rank = self.rank(name)
+        if rank is None:
+            return None, []
+        start = max(0, rank - radius)
+        return start, self._at(start, rank + radius + 1)
+
+
+class LeaderboardPager:
+    """Scrollable window over the backend's paginated board.
+
+    Pages are fetched through `submit(fn, *args)` (the ScoreWorker in the
+    game) and handed back with receive(). Visible pages and the one after
+    them are requested ahead of time, so scrolling does not stall at page
+    boundaries, and at most `max_pages` pages are kept, dropping those
+    farthest from the view.
+
+    Paging needs a backend that honours `offset`. One that ignores it
+    returns the top rows for every page; that shows up as two pages
+    starting with the same player, after which only the first page is kept.
+    """
+
+    def __init__(self, fetch_page, submit, page_size=20, max_pages=5):
+        self.fetch_page = fetch_page  # (offset, limit) -> rows, or None on failure
+        self.submit = submit
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.pages = {}
+        self.pending = set()
+        self.failed = set()  # not retried until the view moves, so errors don't spin
+        self.total = None  # known once a short (last) page arrives
+        self.top = 0  # first visible row
+        self.version = 0
+        self.offset_ignored = False  # backend returned the same rows for different offsets
+        self._first_rows = {}  # page -> name of its first row, kept across eviction
+        self._generation = 0  # bumped by reset() so in-flight pages are dropped
+
+    def load(self, page, generation):
+        """Fetch one page; runs on the worker thread."""
+        try:
+            rows = self.fetch_page(page * self.page_size, self.page_size)
+        except Exception:
+            rows = None
+        return page, generation, rows
+
+    def request(self, page):
+        if page < 0 or (page and self.offset_ignored) or page in self.pages or page in self.pending or page in self.failed:
+            return
+        if self.total is not None and page * self.page_size >= self.total:
+            return
+        self.pending.add(page)
+        self.submit(self.load, page, self._generation)
+
+    def receive(self, result):
+        page, generation, rows = result
+        if generation != self._generation:
+            return
+        self.pending.discard(page)
+        if rows is None:
+            self.failed.add(page)
+            self.version += 1
+            return
+        if rows:
+            first = rows[0].get("name")
+            if first in self._first_rows.values() and self._first_rows.get(page) != first:
+                self.offset_ignored = True
+            self._first_rows[page] = first
+        if self.offset_ignored:
+            # whatever page was asked for, these are the top rows
+            self.pages = {0: rows} if rows else {}
+            self.pending.clear()
+            self.total = len(rows)
+            self.top = 0
+        else:
+            if len(rows) < self.page_size:
+                self.total = page * self.page_size + len(rows)
+            if rows:
+                self.pages[page] = rows
+            self._evict()
+        self.version += 1
+
+    def _evict(self):
+        current = self.top // self.page_size
+        while len(self.pages) > self.max_pages:
+            del self.pages[max(self.pages, key=lambda p: abs(p - current))]
+
+    def scroll(self, delta, visible):
+        top = max(0, self.top + delta)
+        if self.total is not None:
+            top = min(top, max(0, self.total - visible))
+        if top != self.top:
+            self.top = top
+            self.failed.clear()
+            self.version += 1
+
+    def rows(self, count):
+        """(rank, record) for `count` rows from the top of the view; record is None while loading."""
+        first = self.top // self.page_size
+        last = (self.top + count - 1) // self.page_size
+        for page in range(first, last + 2):
+            self.request(page)
+        end = self.top + count if self.total is None else min(self.top + count, self.total)
+        out = []
+        for rank in range(self.top, end):
+            rows = self.pages.get(rank // self.page_size)
+            idx = rank % self.page_size
+            out.append((rank, rows[idx] if rows and idx < len(rows) else None))
+        return out
+
+    def reset(self):
+        """Forget cached pages (e.g. after a score upsert changed the order)."""
+        self.pages.clear()
+        self.pending.clear()
+        self.failed.clear()
+        self.total = None
+        self.offset_ignored = False  # checked again from the next pages
+        self._first_rows.clear()
+        self._generation += 1
+        self.version += 1
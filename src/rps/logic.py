@@ -1,13 +1,77 @@
 import random
+from array import array
+from enum import IntEnum
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; batch helpers fall back to array('b')
+    np = None
+
 moves = ['rock', 'paper', 'scissors']
 
+
+class Move(IntEnum):
+    """Integer move encoding: each move beats the one just before it (mod 3)."""
+    ROCK = 0
+    PAPER = 1
+    SCISSORS = 2
+
+
+class Outcome(IntEnum):
+    TIE = 0
+    PLAYER = 1
+    COMPUTER = 2
+
+
+# OUTCOME_TABLE[(player - computer) % 3] -> Outcome
+OUTCOME_TABLE = (Outcome.TIE, Outcome.PLAYER, Outcome.COMPUTER)
+OUTCOME_NAMES = ('tie', 'player', 'computer')
+MOVE_IDS = {name: Move(i) for i, name in enumerate(moves)}
+
+
+def move_id(name):
+    """Map a move name ('rock'/'paper'/'scissors') to its Move."""
+    return MOVE_IDS[name]
+
+
+def move_name(move):
+    return moves[move]
+
+
+def get_computer_move_id():
+    return random.randrange(3)
+
+
+def decide(player_move, computer_move):
+    """Resolve one round from integer moves with a single table lookup."""
+    return OUTCOME_TABLE[(player_move - computer_move) % 3]
+
+
 def get_computer_move():
-    return random.choice (moves)
+    return moves[get_computer_move_id()]
+
 
 def winner_decider(player_move, computer_move):
-    if player_move == computer_move:
-        return 'tie'
-    elif (player_move == 'rock' and computer_move == 'scissors') or (player_move == 'paper' and computer_move == 'rock') or (player_move == 'scissors' and computer_move == 'paper'):
-        return 'player'
-    else:
-        return 'computer'
\ No newline at end of file
+    return OUTCOME_NAMES[decide(MOVE_IDS[player_move], MOVE_IDS[computer_move])]
+
+
+def decide_many(player_moves, computer_moves):
+    """Resolve many rounds at once from integer move sequences.
+
+    Accepts NumPy arrays (or any buffer/sequence of ints). Returns
+    (outcomes, counts) where outcomes holds one Outcome value per round and
+    counts maps 'player'/'computer'/'tie' to totals. Uses NumPy when it is
+    installed and an array('b') buffer otherwise.
+    """
+    if len(player_moves) != len(computer_moves):
+        raise ValueError('player_moves and computer_moves must be the same length')
+    if np is not None:
+        diff = np.asarray(player_moves, dtype=np.int8) - np.asarray(computer_moves, dtype=np.int8)
+        outcomes = np.remainder(diff, 3).astype(np.int8)
+        totals = np.bincount(outcomes, minlength=3)
+        counts = {name: int(totals[i]) for i, name in enumerate(OUTCOME_NAMES)}
+        return outcomes, counts
+    # (p - c) % 3 is already the Outcome value, so the table lookup is implicit
+    outcomes = array('b', [(p - c) % 3 for p, c in zip(player_moves, computer_moves)])
+    counts = {name: outcomes.count(i) for i, name in enumerate(OUTCOME_NAMES)}
+    return outcomes, counts
@@ -0,0 +1,139 @@
+"""Best-of match rules and a headless match simulator.
+
+The Pygame UI and the simulator share MatchState so the race-to-N rules,
+match win/loss counting and streak tracking live in one place.
+"""
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from rps.logic import OUTCOME_NAMES, Outcome
+
+
+class MatchState:
+    """Round and match counters for a race to `best_of_goal` round wins."""
+
+    def __init__(self, best_of_goal=3, matches_won=0, matches_lost=0, best_streak=0):
+        self.best_of_goal = best_of_goal
+        self.matches_won = matches_won
+        self.matches_lost = matches_lost
+        self.win_streak = 0
+        self.best_streak = best_streak
+        self.in_progress = False
+        self.reset_round_scores()
+
+    def reset_round_scores(self):
+        self.player_score = 0
+        self.computer_score = 0
+        self.ties = 0
+        self.games = 0
+
+    def record_round(self, outcome):
+        """Apply one round outcome ('player'/'computer'/'tie' or an Outcome).
+
+        Returns 'player' or 'computer' when the round decides the match (round
+        scores are reset at that point), otherwise None.
+        """
+        if isinstance(outcome, str):
+            outcome = OUTCOME_NAMES.index(outcome)
+        if outcome == Outcome.PLAYER:
+            self.player_score += 1
+        elif outcome == Outcome.COMPUTER:
+            self.computer_score += 1
+        else:
+            self.ties += 1
+        self.games += 1
+        self.in_progress = True
+        if self.player_score < self.best_of_goal and self.computer_score < self.best_of_goal:
+            return None
+
+        self.in_progress = False
+        if self.player_score > self.computer_score:
+            winner = 'player'
+            self.matches_won += 1
+            self.win_streak += 1
+            self.best_streak = max(self.best_streak, self.win_streak)
+        else:
+            winner = 'computer'
+            self.matches_lost += 1
+            self.win_streak = 0
+        self.reset_round_scores()
+        return winner
+
+    def abandon_match(self):
+        """Drop an unfinished match without counting it."""
+        self.in_progress = False
+        self.reset_round_scores()
+
+
+def _simulate_chunk(n_matches, best_of_goal, seed):
+    rng = random.Random(seed)
+    randrange = rng.randrange
+    state = MatchState(best_of_goal)
+    rounds = 0
+    round_hist = Counter()
+    streak_hist = Counter()
+    for _ in range(n_matches):
+        start = rounds
+        streak_before = state.win_streak
+        winner = None
+        while winner is None:
+            # random vs random: every (player - computer) % 3 is equally likely
+            winner = state.record_round(randrange(3))
+            rounds += 1
+        round_hist[rounds - start] += 1
+        if winner == 'computer' and streak_before:
+            streak_hist[streak_before] += 1
+    if state.win_streak:
+        streak_hist[state.win_streak] += 1
+    return {
+        'matches': n_matches,
+        'matches_won': state.matches_won,
+        'rounds': rounds,
+        'best_streak': state.best_streak,
+        'round_hist': round_hist,
+        'streak_hist': streak_hist,
+    }
+
+
+def simulate_matches(n_matches, best_of_goal=3, workers=None, chunk_size=50_000, seed=None):
+    """Play `n_matches` random-vs-random matches headlessly and aggregate stats.
+
+    Chunks are spread over a ProcessPoolExecutor (`workers=1` runs inline).
+    Streaks are counted per chunk, so a run spanning a chunk boundary is
+    recorded as two shorter runs.
+    """
+    if n_matches <= 0:
+        raise ValueError('n_matches must be positive')
+    rng = random.Random(seed)
+    chunks = []
+    remaining = n_matches
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        chunks.append((size, best_of_goal, rng.getrandbits(64)))
+        remaining -= size
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) == 1:
+        results = [_simulate_chunk(*args) for args in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = list(pool.map(_simulate_chunk, *zip(*chunks)))
+
+    matches_won = sum(r['matches_won'] for r in results)
+    rounds = sum(r['rounds'] for r in results)
+    round_hist = Counter()
+    streak_hist = Counter()
+    for r in results:
+        round_hist.update(r['round_hist'])
+        streak_hist.update(r['streak_hist'])
+    return {
+        'matches': n_matches,
+        'best_of_goal': best_of_goal,
+        'match_win_rate': matches_won / n_matches,
+        'avg_rounds_per_match': rounds / n_matches,
+        'best_streak': max(r['best_streak'] for r in results),
+        'rounds_per_match': dict(sorted(round_hist.items())),
+        'streak_lengths': dict(sorted(streak_hist.items())),
+    }
@@ -1,10 +1,9 @@
 import sys
 import pygame
-import wave
-import struct
 import math
 import os
 import json
+import time
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -12,8 +11,24 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from rps.logic import get_computer_move, winner_decider
-from rps.shared_scores import fetch_leaderboard, fetch_player, upsert_score
+from rps.logic import move_id, move_name, winner_decider
+from rps.dirty_rects import DirtyTracker
+from rps.frame_pacer import FramePacer, block_noisy_events
+from rps.frame_profiler import FrameProfiler
+from rps.render_cache import overlay_layer, render_text
+from rps.distribution import Distribution
+from rps.leaderboard import LeaderboardIndex, LeaderboardPager, win_pct
+from rps.match import MatchState
+from rps.replay import ReplayWriter
+from rps.strategies import STRATEGIES, make_strategy
+from rps import synth
+from rps.asset_bundle import SFX, find_music, load_sfx, open_bundle
+from rps.asset_preloader import AssetPreloader
+from rps.text_layout import text_layout
+from rps.score_journal import DATA_DIR, SCORES_PATH, ScoreJournal, load_scores, save_scores
+from rps.score_worker import SCORES_EVENT, ScoreWorker
+from rps.shared_scores import (fetch_distribution, fetch_leaderboard_page, fetch_player,
+                                upsert_score)
 
 # Retro / arcade themed Rock-Paper-Scissors using pygame
 WIDTH, HEIGHT = 1100, 720
@@ -22,6 +37,23 @@ PANEL_COLOR = (26, 26, 40)
 ACCENT = (255, 168, 0)
 TEXT_COLOR = (230, 230, 230)
 
+# Screen regions tracked for dirty-rect updates (x, y, w, h)
+HEADER_REGION = (0, 0, WIDTH, 195)
+STATS_REGION = (0, 195, WIDTH, 125)
+SCORE_REGION = (0, 320, WIDTH, 190)
+NAME_REGION = (0, 300, WIDTH, 140)
+BUTTONS_REGION = (0, HEIGHT - 145, WIDTH, 80)
+FOOTER_REGION = (0, HEIGHT - 40, WIDTH, 40)
+HUD_REGION = (0, 0, 400, 150)
+OVERLAY_DIM = (0, 0, 0, 200)
+OVERLAY_STATES = ('tutorial', 'best_of_choice', 'confirm_identity', 'post_match_choice', 'confirm_quit', 'quit_stats',
+                  'leaderboard')
+# rows requested from the backend and shown on the quit screen
+LEADERBOARD_LIMIT = 10
+# leaderboard browser (L): rows on screen, rows per backend page
+BROWSER_ROWS = 12
+BROWSER_PAGE_SIZE = 25
+
 
 class Button:
     def __init__(self, rect, text, color, key):
@@ -32,7 +64,7 @@ class Button:
 
     def draw(self, surf, font):
         pygame.draw.rect(surf, self.color, self.rect, border_radius=8)
-        txt = font.render(self.text, True, (0, 0, 0))
+        txt = render_text(font, self.text, (0, 0, 0))
         surf.blit(txt, txt.get_rect(center=self.rect.center))
 
     def is_clicked(self, pos):
@@ -40,55 +72,41 @@ class Button:
 
 
 def draw_text_center(surf, text, font, y, color=TEXT_COLOR):
-    txt = font.render(text, True, color)
+    txt = render_text(font, text, color)
     surf.blit(txt, txt.get_rect(center=(WIDTH // 2, y)))
 
 
 def wrap_lines(text, font, max_width):
     """Wrap a string into multiple lines so each rendered line stays within max_width."""
-    words = text.split()
-    lines = []
-    current = ''
-    for w in words:
-        test = w if current == '' else current + ' ' + w
-        if font.size(test)[0] <= max_width:
-            current = test
-        else:
-            if current:
-                lines.append(current)
-            current = w
-    if current:
-        lines.append(current)
-    return lines
+    return list(text_layout.wrap(text, font, max_width))
 
 
 def draw_wrapped_center(surf, text, font, start_y, max_width, color=TEXT_COLOR, line_gap=6):
     """Draw multi-line wrapped text centered horizontally starting at start_y."""
-    lines = wrap_lines(text, font, max_width)
-    y = start_y
-    for ln in lines:
-        draw_text_center(surf, ln, font, y, color)
-        y += font.get_linesize() + line_gap
-    return y
+    block, line_count = text_layout.block(text, font, max_width, color, line_gap)
+    if block is not None:
+        # the first line is centered on start_y, as draw_text_center would place it
+        surf.blit(block, (WIDTH // 2 - block.get_width() // 2, start_y - font.get_height() // 2))
+    return start_y + line_count * (font.get_linesize() + line_gap)
 
 
 def build_summary_msgs(player_name, player_score, computer_score):
     return []
 
 
-def load_scores(path):
-    return {}
-
-
-def save_scores(path, data):
-    return
-
-
 def default_record():
     return {'player': 0, 'computer': 0, 'ties': 0, 'games': 0, 'win_streak': 0, 'best_streak': 0, 'matches': 0, 'matches_won': 0, 'matches_lost': 0}
 
 
-def main():
+def main(frame_hook=None, fps=60, pacer=None):
+    """Run the game.
+
+    frame_hook, if given, is called as frame_hook(state, targets) at the start
+    of every frame, where targets maps 'confirm'/'cancel' to the current
+    overlay button rects; scripted drivers (benchmarks) use it to post input.
+    fps=0 removes the frame cap. pacer replaces the FramePacer (anything with
+    next_frame(animating, wake_in_ms)), e.g. a fixed-timestep one.
+    """
     pygame.init()
     # try to initialize mixer
     try:
@@ -98,7 +116,8 @@ def main():
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption('Rock - Paper - Scissors - Retro Duel')
 
-    clock = pygame.time.Clock()
+    pacer = pacer or FramePacer(fps=fps)
+    block_noisy_events()
     large = pygame.font.SysFont('couriernew', 48, bold=True)
     mid = pygame.font.SysFont('couriernew', 28)
     mid_bold = pygame.font.SysFont('couriernew', 28, bold=True)
@@ -146,12 +165,7 @@ def main():
 
     buttons = build_buttons()
 
-    player_score = 0
-    computer_score = 0
-    current_ties = 0
-    current_games = 0
-    win_streak = 0
-    best_streak = 0
+    match = MatchState(best_of_goal=3)
     round_result = ''
     show_move = None
     countdown = 0
@@ -160,120 +174,75 @@ def main():
     state = 'enter_name'
     player_name = ''
     confirm_user_name = None
+    confirm_user_record = None
+    name_lookup_pending = None
     is_new_user = False
-    music_loaded = False
     music_playing = False
+    music_wanted = False  # start_music() ran before the track finished preloading
     sfx_enabled = True  # always on
     music_enabled = True
-    best_of_goal = 3
-    difficulty_modes = ['random']
+    difficulty_modes = list(STRATEGIES)
     difficulty_idx = 0
+    strategy = make_strategy(difficulty_modes[difficulty_idx])
     last_player_move = None
     option_rects = []
-    matches_won = 0
-    matches_lost = 0
-    match_in_progress = False
     match_winner_announced = False
     last_match_winner = ''
     quit_rank_note = ''
-    remote_leaderboard = []
-
-    # prepare simple sound effects (generate small WAV files)
-    def make_sine_wav(path, freq=440.0, duration=0.5, volume=0.5):
-        framerate = 44100
-        amp = int(32767 * volume)
-        nframes = int(duration * framerate)
-        with wave.open(path, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(framerate)
-            for i in range(nframes):
-                t = float(i) / framerate
-                val = int(amp * math.sin(2 * math.pi * freq * t))
-                data = struct.pack('<h', val)
-                wf.writeframesraw(data)
-
-    def make_battle_music(path):
-        # create a short looping chiptune-style track
-        framerate = 44100
-        duration = 6.0
-        amp = 26000
-        nframes = int(duration * framerate)
-        with wave.open(path, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(framerate)
-            for i in range(nframes):
-                t = float(i) / framerate
-                bass = math.sin(2 * math.pi * 110 * t) * 0.55
-                lead = math.sin(2 * math.pi * 330 * t + math.sin(2 * math.pi * 2 * t) * 2.5) * 0.35
-                beat = (1 if (i // (framerate // 2)) % 2 == 0 else -1) * 0.15
-                val = int(amp * (bass + lead + beat))
-                data = struct.pack('<h', max(-32768, min(32767, val)))
-                wf.writeframesraw(data)
-
-    asset_dir = Path(__file__).resolve().parents[2] / "assets" / "audio"
-    asset_dir.mkdir(parents=True, exist_ok=True)
-    dramatic_path = asset_dir / 'sfx_dramatic.wav'
-    click_path = asset_dir / 'sfx_click.wav'
-    win_path = asset_dir / 'sfx_win.wav'
-    # If you have Alan Walker PS5 Fortnite track, drop it under assets/audio with this name:
-    # Preferred track: drop "lotr_battle.mp3" (or any MP3 with 'lotr' in the name) in this folder to share the same music with others.
-    def find_lotr_track():
-        mp3s = [f for f in os.listdir(asset_dir) if f.lower().endswith('.mp3')]
-        for name in mp3s:
-            if 'lotr' in name.lower() or 'lord' in name.lower():
-                return asset_dir / name
-        return asset_dir / 'lotr_battle.mp3'
-
-    music_preferred = find_lotr_track()
-    if os.path.exists(music_preferred):
-        music_path = music_preferred
-    else:
-        music_path = asset_dir / 'bg_battle.wav'
-    if not os.path.exists(dramatic_path):
-        try:
-            asset_dir.mkdir(parents=True, exist_ok=True)
-            make_sine_wav(str(dramatic_path), freq=120.0, duration=0.8, volume=0.9)
-        except Exception:
-            pass
-    if not os.path.exists(click_path):
-        try:
-            asset_dir.mkdir(parents=True, exist_ok=True)
-            make_sine_wav(str(click_path), freq=880.0, duration=0.06, volume=0.5)
-        except Exception:
-            pass
-    if not os.path.exists(win_path):
-        try:
-            asset_dir.mkdir(parents=True, exist_ok=True)
-            make_sine_wav(str(win_path), freq=660.0, duration=0.18, volume=0.6)
-        except Exception:
-            pass
-    if not os.path.exists(music_path):
-        try:
-            asset_dir.mkdir(parents=True, exist_ok=True)
-            make_battle_music(str(music_path))
-        except Exception:
-            pass
-
+    # every backend record we see, kept ranked (replaces per-frame sorts/scans)
+    leaderboard = LeaderboardIndex()
+    distribution = None  # population histograms for "top X%" outside the top window
+    # opt-in phase timing (RPS_PROFILE); F3 toggles the on-screen HUD
+    profiler = FrameProfiler.from_env(DATA_DIR)
+    score_worker = ScoreWorker(timer=(lambda secs: profiler.add('network', secs)) if profiler else None)
+    local_scores = load_scores(SCORES_PATH)
     try:
-        sfx_dramatic = pygame.mixer.Sound(str(dramatic_path))
-        sfx_click = pygame.mixer.Sound(str(click_path))
-        sfx_win = pygame.mixer.Sound(str(win_path))
-    except Exception:
-        sfx_dramatic = sfx_click = sfx_win = None
+        # compacts the journal and refreshes data/scores.json before loading it
+        journal = ScoreJournal().open()
+        journal.start_flusher()
+        local_scores = load_scores(SCORES_PATH)
+    except OSError:
+        journal = None
+
+    # one mmap'd bundle (python -m rps.asset_bundle build) when it matches the
+    # mixer format; otherwise the loose files under assets/audio
+    mixer_format = pygame.mixer.get_init()
+    bundle = open_bundle(mixer_format=mixer_format) if mixer_format else None
+
+    def load_music():
+        # streamed by mixer.music from the compressed bytes, never decoded up front
+        music = bundle.music() if bundle else None
+        if music:
+            pygame.mixer.music.load(*music)
+        else:
+            # mixer.music streams from a file, so a synthesized track goes through the WAV cache
+            music_path = find_music() or synth.cached_wav('battle_music', rate=mixer_format[0])
+            pygame.mixer.music.load(str(music_path))
+        pygame.mixer.music.set_volume(0.35)
+        return True
+
+    # decode audio off the main thread so the first frame is not held up;
+    # until a sound arrives, play_sfx/start_music quietly do nothing
+    assets = AssetPreloader()
+    if mixer_format:
+        for name in SFX:
+            if bundle and name in bundle:
+                assets.add(name, bundle.sound, name)
+            else:
+                assets.add(name, load_sfx, name)
+        assets.add('music', load_music)
+    assets.start()
 
-    if pygame.mixer.get_init():
-        try:
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(0.35)
-            music_loaded = True
-        except Exception:
-            music_loaded = False
+    def play_sfx(name):
+        sound = assets.get(name)
+        if sound and sfx_enabled:
+            sound.play()
 
     def start_music():
-        nonlocal music_playing
-        if music_enabled and music_loaded and not music_playing and pygame.mixer.get_init():
+        nonlocal music_playing, music_wanted
+        music_wanted = True
+        music = assets.get('music')
+        if music_enabled and music and not music_playing and pygame.mixer.get_init():
             try:
                 pygame.mixer.music.play(-1)
                 music_playing = True
@@ -281,7 +250,8 @@ def main():
                 music_playing = False
 
     def stop_music():
-        nonlocal music_playing
+        nonlocal music_playing, music_wanted
+        music_wanted = False
         if music_playing and pygame.mixer.get_init():
             try:
                 pygame.mixer.music.stop()
@@ -289,47 +259,142 @@ def main():
                 music_playing = False
 
     def choose_computer_move():
-        return get_computer_move()
+        return move_name(strategy.choose())
 
     def persist_scores():
-        return
+        """Journal current totals locally; the journal flusher syncs them to the backend.
+
+        Returns the journaled record, or None if nothing new was written.
+        """
+        if journal and player_name:
+            return journal.append(player_name, match.matches_won, match.matches_lost, match.best_streak)
+        return None
+
+    def board_rank():
+        """Player's 0-based rank if it falls inside the fetched top window, else None."""
+        # the index also holds the player's own record; below the top window
+        # we only know the players above them partially, so don't claim a rank
+        rank = leaderboard.rank(player_name) if player_name else None
+        return rank if rank is not None and rank < LEADERBOARD_LIMIT else None
+
+    top_percent_memo = (None, None)  # (inputs, result): recomputed only when they change
+
+    def player_top_percent():
+        """Approximate "top X%" among all players from the distribution, or None."""
+        nonlocal top_percent_memo
+        key = (id(distribution), distribution and distribution.version, player_name,
+               match.best_streak, match.matches_won, match.matches_lost)
+        if top_percent_memo[0] == key:
+            return top_percent_memo[1]
+        if not distribution or not player_name or not (match.matches_won or match.matches_lost):
+            result = None
+        else:
+            result = distribution.top_percent({'best_streak': match.best_streak,
+                                               'matches_won': match.matches_won,
+                                               'matches_lost': match.matches_lost})
+        top_percent_memo = (key, result)
+        return result
+
+    # the L screen pages through the whole board; pages arrive as SCORES_EVENTs
+    pager = LeaderboardPager(fetch_leaderboard_page,
+                             lambda fn, *args: score_worker.submit('leaderboard_page', fn, *args),
+                             page_size=BROWSER_PAGE_SIZE)
 
     def refresh_remote_leaderboard():
-        nonlocal remote_leaderboard
-        remote_leaderboard = fetch_leaderboard(10)
+        # the page call returns None on failure, so an error never empties the board
+        score_worker.submit('leaderboard', fetch_leaderboard_page, 0, LEADERBOARD_LIMIT)
+        # cached for minutes by shared_scores, so repeat refreshes stay local
+        score_worker.submit('distribution', fetch_distribution)
+
+    def push_and_refresh(name, won, lost, streak, seq=None):
+        # runs on the worker thread; bundles the upsert with the follow-up reads
+        if journal:
+            journal.drain()
+            if seq is None:
+                # nothing new was journaled: just re-read the board and the player
+                saved = fetch_player(name)
+            else:
+                # the flusher may have sent the record first; its ack is kept per seq
+                saved = journal.saved(name, seq)
+        else:
+            saved = upsert_score(name, won, lost, streak)
+        if not saved:
+            return None
+        return saved, fetch_leaderboard_page(0, LEADERBOARD_LIMIT), fetch_player(name)
 
     def push_scores():
         """Persist current scores to backend and refresh local/leaderboard."""
-        nonlocal matches_won, matches_lost, best_streak
-        total_played = matches_won + matches_lost
         # win_pct computed in DB; only send fields that are writable
-        saved = upsert_score(player_name or 'PLAYER', matches_won, matches_lost, best_streak)
-        if saved:
-            matches_won = int(saved.get('matches_won', matches_won))
-            matches_lost = int(saved.get('matches_lost', matches_lost))
-            best_streak = int(saved.get('best_streak', best_streak))
-            refresh_remote_leaderboard()
-            refresh_player_record()
-
-    def refresh_player_record():
-        """Reload player stats from backend so UI stays in sync."""
-        nonlocal best_streak, matches_won, matches_lost, win_streak
-        if not player_name:
-            return
-        rec = fetch_player(player_name)
+        rec = persist_scores()
+        score_worker.submit('push', push_and_refresh, player_name or 'PLAYER',
+                            match.matches_won, match.matches_lost, match.best_streak,
+                            rec['seq'] if rec else None)
+
+    def apply_player_record(rec):
+        """Copy backend player stats into the match so UI stays in sync."""
         if isinstance(rec, list):  # backend may return a list
             rec = rec[0] if rec else None
         if rec:
-            best_streak = int(rec.get('best_streak', best_streak))
-            matches_won = int(rec.get('matches_won', matches_won))
-            matches_lost = int(rec.get('matches_lost', matches_lost))
+            match.best_streak = int(rec.get('best_streak', match.best_streak))
+            match.matches_won = int(rec.get('matches_won', match.matches_won))
+            match.matches_lost = int(rec.get('matches_lost', match.matches_lost))
             # keep current streak locally; best_streak is persisted
 
+    replay = None  # ReplayWriter for the current player, opened on their first round
+
+    def record_replay(player_move, computer_move, result, match_over):
+        """Append the round to data/replays/<player>.rpsr (best-effort)."""
+        nonlocal replay
+        name = player_name or 'PLAYER'
+        try:
+            if replay is None or replay.name != name:
+                if replay:
+                    replay.close()
+                replay = ReplayWriter.for_player(name)
+            replay.record(player_move, computer_move, result)
+            if match_over:
+                replay.end_match()
+        except (OSError, ValueError):
+            replay = None
+
+    def start_new_player(name):
+        nonlocal player_name, match, is_new_user, state
+        player_name = name
+        match = MatchState(best_of_goal=match.best_of_goal)
+        is_new_user = True
+        refresh_remote_leaderboard()
+        state = 'tutorial'
+
+    # Dirty-rect mode pushes only changed regions to the display and skips
+    # frames where nothing changed; RPS_DIRTY_RECTS=0 restores full flips.
+    dirty_rects_enabled = os.getenv('RPS_DIRTY_RECTS', '1') != '0'
+    dirty_tracker = DirtyTracker(screen.get_rect())
+    static_layer = None
+    static_layer_theme = None
+
+    def build_static_layer():
+        """Background and header panel, composited once per theme."""
+        layer = pygame.Surface((WIDTH, HEIGHT)).convert()
+        layer.fill(current_theme()['bg'])
+        pygame.draw.rect(layer, current_theme()['panel'], (20, 20, WIDTH - 40, 170), border_radius=10)
+        draw_text_center(layer, 'Rock - Paper - Scissors', large, 100, current_theme()['accent'])
+        draw_text_center(layer, 'ROYAL RUMBLE', mid_bold, 140, (220, 70, 70))
+        return layer
+
+    confirm_rect = pygame.Rect(0,0,0,0)
+    cancel_rect = pygame.Rect(0,0,0,0)
     running = True
     refresh_remote_leaderboard()
-    refresh_player_record()
     while running:
-        dt = clock.tick(60) / 1000.0
+        if frame_hook:
+            frame_hook(state, {'confirm': confirm_rect, 'cancel': cancel_rect})
+        # full frame rate only while the countdown runs; otherwise sleep until
+        # input, a score result, or the name cursor's next blink
+        wake_in = 400 - pygame.time.get_ticks() % 400 if state == 'enter_name' else None
+        dt, events = pacer.next_frame(countdown > 0, wake_in)
+        phase_start = time.perf_counter()
+        if music_wanted and music_enabled and not music_playing and assets.ready('music'):
+            start_music()
         panel_w_pre = min(760, WIDTH - 100)
         panel_h_pre = 300
         panel_x_pre = (WIDTH - panel_w_pre) // 2
@@ -339,16 +404,52 @@ def main():
             pygame.Rect(panel_x_pre + 60 + 190, panel_y_pre + panel_h_pre - 110, 180, 64),
             pygame.Rect(panel_x_pre + 60 + 190*2, panel_y_pre + panel_h_pre - 110, 180, 64),
         ]
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for event in events:
+            if event.type == pygame.VIDEOEXPOSE:
+                dirty_tracker.invalidate()
+            elif event.type == pygame.QUIT:
                 # trigger quit confirm
                 if state == 'playing':
                     state = 'confirm_quit'
-                    if sfx_dramatic and sfx_enabled:
-                        sfx_dramatic.play()
+                    play_sfx('dramatic')
                 else:
                     stop_music()
                     running = False
+            elif event.type == SCORES_EVENT:
+                if event.tag == 'leaderboard':
+                    if event.result is not None:  # None: fetch failed, keep what we have
+                        leaderboard.replace(event.result, keep=(player_name,))
+                elif event.tag == 'leaderboard_page' and event.result:
+                    pager.receive(event.result)
+                elif event.tag == 'distribution':
+                    distribution = Distribution.from_payload(event.result) or distribution
+                elif event.tag == 'push' and event.result:
+                    saved, board, rec = event.result
+                    if distribution:
+                        # move the player between buckets locally; everyone else's
+                        # changes arrive with the next refresh once the cache expires
+                        distribution.update_player(leaderboard.get(saved.get('name')), saved)
+                    apply_player_record(saved)
+                    pager.reset()
+                    if board is not None:
+                        leaderboard.replace(board, keep=(player_name,))
+                    leaderboard.update(saved)
+                    leaderboard.update(rec)
+                    apply_player_record(rec)
+                elif event.tag == 'lookup_name':
+                    chosen = name_lookup_pending
+                    name_lookup_pending = None
+                    # the player may have moved on (e.g. quit) while the lookup ran
+                    if state == 'enter_name' and chosen:
+                        # fall back to the local cache when the backend is unreachable
+                        known = event.result or local_scores.get(chosen)
+                        leaderboard.update(event.result)
+                        if known:
+                            confirm_user_name = chosen
+                            confirm_user_record = known
+                            state = 'confirm_identity'
+                        else:
+                            start_new_player(chosen)
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 pos = event.pos
                 if state == 'enter_name':
@@ -360,77 +461,68 @@ def main():
                 elif state == 'best_of_choice':
                     for idx, rect in enumerate(option_rects):
                         if rect.collidepoint(pos):
-                            best_of_goal = [3,5,10][idx]
+                            match.best_of_goal = [3,5,10][idx]
                             state = 'playing'
                             start_music()
                             break
                 elif state == 'post_match_choice':
                     for idx, rect in enumerate(option_rects):
                         if rect.collidepoint(pos):
-                            best_of_goal = [3,5,10][idx]
+                            match.best_of_goal = [3,5,10][idx]
                             state = 'playing'
                             start_music()
                             break
                 elif state == 'confirm_identity':
                     if confirm_rect.collidepoint(pos):
-                        rec = fetch_player(confirm_user_name)
+                        # reuse the record fetched when the name was entered
+                        rec = confirm_user_record
                         if isinstance(rec, list):  # backend may return a list
                             rec = rec[0] if rec else None
-                        player_score = 0
-                        computer_score = 0
-                        current_ties = 0
-                        current_games = 0
-                        win_streak = 0
-                        best_streak = int(rec.get('best_streak', 0)) if rec else 0
-                        matches_won = int(rec.get('matches_won', 0)) if rec else 0
-                        matches_lost = int(rec.get('matches_lost', 0)) if rec else 0
+                        match.reset_round_scores()
+                        match.win_streak = 0
+                        match.best_streak = int(rec.get('best_streak', 0)) if rec else 0
+                        match.matches_won = int(rec.get('matches_won', 0)) if rec else 0
+                        match.matches_lost = int(rec.get('matches_lost', 0)) if rec else 0
                         player_name = confirm_user_name or player_name
                         confirm_user_name = None
+                        confirm_user_record = None
                         is_new_user = False
                         state = 'best_of_choice'
                     elif cancel_rect.collidepoint(pos):
                         # try another name
                         player_name = ''
                         confirm_user_name = None
+                        confirm_user_record = None
                         state = 'enter_name'
                 elif state == 'confirm_quit':
                     # check confirm buttons (confirm_rect/cancel_rect defined in draw)
                     if confirm_rect.collidepoint(pos):
-                        if sfx_click and sfx_enabled:
-                            sfx_click.play()
+                        play_sfx('click')
                         # build rank note based on remote leaderboard
-                        leaderboard = sorted(remote_leaderboard, key=lambda rec: rec.get('best_streak',0), reverse=True)
-                        rank = None
-                        if player_name:
-                            for idx_lb, rec in enumerate(leaderboard):
-                                if rec.get('name') == player_name:
-                                    rank = idx_lb
-                                    break
+                        rank = board_rank()
+                        top_pct = player_top_percent()
                         if rank == 0:
                             quit_rank_note = 'You are #1. Play to maintain the top spot.'
                         elif rank is not None:
                             quit_rank_note = f'You are #{rank+1} on the leaderboard. Play more to reach the top.'
+                        elif top_pct:
+                            quit_rank_note = (f'You are in the top {top_pct}% of '
+                                              f'{distribution.total} players. Climb the board!')
                         else:
-                            top_streak = leaderboard[0].get('best_streak',0) if leaderboard else 0
+                            top_streak = leaderboard.top(1)[0].get('best_streak', 0) if leaderboard else 0
                             quit_rank_note = f'Top streak is {top_streak}. Climb the board!'
-                        if match_in_progress:
+                        if match.in_progress:
                             quit_rank_note = 'Match not recorded. ' + quit_rank_note
                         state = 'quit_stats'
                     elif cancel_rect.collidepoint(pos):
-                        if sfx_click and sfx_enabled:
-                            sfx_click.play()
+                        play_sfx('click')
                         state = 'playing'
                 elif state == 'quit_stats':
                     if confirm_rect.collidepoint(pos):
-                        if sfx_click and sfx_enabled:
-                            sfx_click.play()
+                        play_sfx('click')
                         # If quitting mid-match, clear in-progress round scores
-                        if match_in_progress:
-                            player_score = 0
-                            computer_score = 0
-                            current_ties = 0
-                            current_games = 0
-                            match_in_progress = False
+                        if match.in_progress:
+                            match.abandon_match()
                             show_move = None
                             round_result = ''
                             persist_scores()
@@ -439,14 +531,12 @@ def main():
                         stop_music()
                         running = False
                     elif cancel_rect.collidepoint(pos):
-                        if sfx_click and sfx_enabled:
-                            sfx_click.play()
+                        play_sfx('click')
                         state = 'playing'
                 elif state == 'playing':
                     for b in buttons:
                         if b.is_clicked(pos) and countdown <= 0:
-                            if sfx_click and sfx_enabled:
-                                sfx_click.play()
+                            play_sfx('click')
                             # start countdown animation
                             player_move = b.key
                             show_move = None
@@ -454,30 +544,20 @@ def main():
                             anim_timer = 0
                             pending_player = player_move
                             last_player_move = player_move
+            elif event.type == pygame.MOUSEWHEEL and state == 'leaderboard':
+                pager.scroll(-3 * event.y, BROWSER_ROWS)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and profiler:
+                profiler.hud_visible = not profiler.hud_visible
             elif event.type == pygame.KEYDOWN:
                 if state == 'enter_name':
                     if event.key == pygame.K_BACKSPACE:
                         player_name = player_name[:-1]
                     elif event.key == pygame.K_RETURN:
-                        chosen = player_name.strip() or 'PLAYER'
-                        # if user exists remotely, confirm identity; else create fresh
-                        existing = fetch_player(chosen)
-                        if existing:
-                            confirm_user_name = chosen
-                            state = 'confirm_identity'
-                        else:
-                            player_name = chosen
-                            player_score = 0
-                            computer_score = 0
-                            current_ties = 0
-                            current_games = 0
-                            win_streak = 0
-                            best_streak = 0
-                            matches_won = 0
-                            matches_lost = 0
-                            is_new_user = True
-                            refresh_remote_leaderboard()
-                            state = 'tutorial'
+                        if name_lookup_pending is None:
+                            chosen = player_name.strip() or 'PLAYER'
+                            # if user exists remotely, confirm identity; else create fresh
+                            name_lookup_pending = chosen
+                            score_worker.submit('lookup_name', fetch_player, chosen)
                     else:
                         if len(player_name) < 20 and event.unicode.isprintable():
                             player_name += event.unicode
@@ -488,12 +568,11 @@ def main():
                             start_music()
                         elif state == 'playing':
                             state = 'confirm_quit'
-                            if sfx_dramatic and sfx_enabled:
-                                sfx_dramatic.play()
+                            play_sfx('dramatic')
                         elif state == 'confirm_quit':
                             stop_music()
                             running = False
-                        elif state == 'quit_stats':
+                        elif state in ('quit_stats', 'leaderboard'):
                             state = 'playing'
                         elif state == 'confirm_quit':
                             stop_music()
@@ -507,22 +586,30 @@ def main():
                     elif state == 'best_of_choice':
                         if event.key in (pygame.K_3, pygame.K_5, pygame.K_0, pygame.K_KP3, pygame.K_KP5, pygame.K_KP0):
                             key_to_goal = {pygame.K_3:3, pygame.K_KP3:3, pygame.K_5:5, pygame.K_KP5:5, pygame.K_0:10, pygame.K_KP0:10}
-                            best_of_goal = key_to_goal.get(event.key, best_of_goal)
+                            match.best_of_goal = key_to_goal.get(event.key, match.best_of_goal)
                             state = 'playing'
                             start_music()
                     elif state == 'post_match_choice':
                         if event.key in (pygame.K_3, pygame.K_5, pygame.K_0, pygame.K_KP3, pygame.K_KP5, pygame.K_KP0):
                             key_to_goal = {pygame.K_3:3, pygame.K_KP3:3, pygame.K_5:5, pygame.K_KP5:5, pygame.K_0:10, pygame.K_KP0:10}
-                            best_of_goal = key_to_goal.get(event.key, best_of_goal)
+                            match.best_of_goal = key_to_goal.get(event.key, match.best_of_goal)
                             state = 'playing'
                         elif event.key == pygame.K_q:
                             stop_music()
                             running = False
+                    elif state == 'leaderboard':
+                        steps = {pygame.K_UP: -1, pygame.K_DOWN: 1,
+                                 pygame.K_PAGEUP: -BROWSER_ROWS, pygame.K_PAGEDOWN: BROWSER_ROWS}
+                        if event.key in steps:
+                            pager.scroll(steps[event.key], BROWSER_ROWS)
+                        elif event.key == pygame.K_HOME:
+                            pager.scroll(-pager.top, BROWSER_ROWS)
+                        elif event.key == pygame.K_l:
+                            state = 'playing'
                     elif state == 'playing' and countdown <= 0:
                         if event.key in (pygame.K_r, pygame.K_p, pygame.K_s):
                             move_key = {pygame.K_r: 'rock', pygame.K_p: 'paper', pygame.K_s: 'scissors'}[event.key]
-                            if sfx_click and sfx_enabled:
-                                sfx_click.play()
+                            play_sfx('click')
                             show_move = None
                             countdown = 1.8
                             anim_timer = 0
@@ -534,12 +621,23 @@ def main():
                                 start_music()
                             else:
                                 stop_music()
+                        elif event.key == pygame.K_l:
+                            state = 'leaderboard'
+                        elif event.key == pygame.K_d:
+                            # cycle difficulty; a fresh predictor starts with empty counts
+                            difficulty_idx = (difficulty_idx + 1) % len(difficulty_modes)
+                            strategy = make_strategy(difficulty_modes[difficulty_idx])
                     elif state == 'post_match_choice':
                         if event.key in (pygame.K_3, pygame.K_5, pygame.K_0, pygame.K_KP3, pygame.K_KP5, pygame.K_KP0):
                             key_to_goal = {pygame.K_3:3, pygame.K_KP3:3, pygame.K_5:5, pygame.K_KP5:5, pygame.K_0:10, pygame.K_KP0:10}
-                            best_of_goal = key_to_goal.get(event.key, best_of_goal)
+                            match.best_of_goal = key_to_goal.get(event.key, match.best_of_goal)
                             state = 'playing'
 
+        if profiler:
+            now = time.perf_counter()
+            profiler.add('events', now - phase_start)
+            phase_start = now
+
         if countdown > 0:
             countdown -= dt
             anim_timer += dt
@@ -548,43 +646,34 @@ def main():
                 computer_move = choose_computer_move()
                 result = winner_decider(pending_player, computer_move)
                 if result == 'player':
-                    player_score += 1
                     round_result = 'YOU WIN!'
-                    if sfx_win and sfx_enabled:
-                        sfx_win.play()
+                    play_sfx('win')
                 elif result == 'computer':
-                    computer_score += 1
                     round_result = 'COMPUTER WINS'
                 else:
-                    current_ties += 1
                     round_result = "IT'S A TIE"
-                current_games += 1
-                match_in_progress = True
+                strategy.observe(move_id(pending_player))
                 show_move = (pending_player, computer_move)
-                if player_score >= best_of_goal or computer_score >= best_of_goal:
-                    match_in_progress = False
+                match_winner = match.record_round(result)
+                record_replay(pending_player, computer_move, result, bool(match_winner))
+                if match_winner:
                     match_winner_announced = True
-                    if player_score > computer_score:
-                        matches_won += 1
-                        round_result = f'MATCH WINNER! Race to {best_of_goal}'
+                    if match_winner == 'player':
+                        round_result = f'MATCH WINNER! Race to {match.best_of_goal}'
                         last_match_winner = 'You won the match!'
-                        win_streak += 1  # match win streak
-                        best_streak = max(best_streak, win_streak)
                     else:
-                        matches_lost += 1
-                        round_result = f'COMPUTER TAKES THE MATCH ({best_of_goal})'
+                        round_result = f'COMPUTER TAKES THE MATCH ({match.best_of_goal})'
                         last_match_winner = 'Computer won the match.'
-                        win_streak = 0  # reset match streak on loss
-                    # reset round scores for next match
-                    player_score = 0
-                    computer_score = 0
-                    current_ties = 0
-                    current_games = 0
                     show_move = None
                     push_scores()
                     state = 'post_match_choice'
                 persist_scores()
 
+        if profiler:
+            now = time.perf_counter()
+            profiler.add('logic', now - phase_start)
+            phase_start = now
+
         # draw
         # refresh theme colors (for dynamic toggle)
         bg_color = current_theme()['bg']
@@ -592,58 +681,86 @@ def main():
         accent_color = current_theme()['accent']
         text_color = current_theme()['text']
 
-        screen.fill(bg_color)
-        # header panel
-        pygame.draw.rect(screen, panel_color, (20, 20, WIDTH - 40, 170), border_radius=10)
-        draw_text_center(screen, 'Rock - Paper - Scissors', large, 100, accent_color)
-        draw_text_center(screen, 'ROYAL RUMBLE', mid_bold, 140, (220, 70, 70))
+        # values shared by the dirty-region signatures and the drawing below
+        countdown_digit = None
+        if countdown > 0:
+            # show animated 3-2-1
+            secs = max(0, countdown)
+            if secs > 1.2:
+                countdown_digit = '3'
+            elif secs > 0.6:
+                countdown_digit = '2'
+            else:
+                countdown_digit = '1'
+        glow = 40 + int(40 * abs(math.sin(anim_timer * 4)))
+        blink_on = (pygame.time.get_ticks() // 400) % 2 == 0
+        prompt = 'Checking name...' if name_lookup_pending else 'Enter your name and press Enter'
+        footer_text = f"ESC: quit | R/P/S: play | M: music {'on' if music_enabled else 'off'} | D: AI | L: board | 3/5/0: best-of"
+
+        stats_sig = (match.matches_won, match.matches_lost, match.win_streak, match.best_streak,
+                     match.best_of_goal, difficulty_idx,
+                     leaderboard.version)
+        score_sig = (match.player_score, match.computer_score, countdown_digit, show_move,
+                     round_result, glow if show_move else None)
+        regions = {'footer': (FOOTER_REGION, footer_text)}
         if state == 'enter_name':
-            draw_text_center(screen, 'Enter your name and press Enter', small, HEIGHT // 2 - 40, text_color)
+            regions['name'] = (NAME_REGION, (prompt, player_name, blink_on))
+        elif state in OVERLAY_STATES:
+            # overlays dim the whole window; any change repaints all of it
+            regions['overlay'] = (screen.get_rect(), (
+                stats_sig, score_sig, player_name, confirm_user_name, last_match_winner,
+                quit_rank_note, music_enabled, player_top_percent(), pager.version))
+        else:
+            regions['stats'] = (STATS_REGION, stats_sig)
+            regions['score'] = (SCORE_REGION, score_sig)
+            regions['buttons'] = (BUTTONS_REGION, None)
+        if profiler and profiler.hud_visible:
+            regions['hud'] = (HUD_REGION, profiler.hud_lines())
+        dirty = dirty_tracker.diff((state, theme_mode), regions)
+        if dirty_rects_enabled and not dirty:
+            continue
+
+        if static_layer is None or static_layer_theme != theme_mode:
+            static_layer = build_static_layer()
+            static_layer_theme = theme_mode
+        screen.blit(static_layer, (0, 0))
+        if state == 'enter_name':
+            draw_text_center(screen, prompt, small, HEIGHT // 2 - 40, text_color)
 
         # Stats and score panels (hide until onboarding is done)
         if state not in ('enter_name','tutorial','best_of_choice'):
             stats_rect = pygame.Rect(20, 200, WIDTH - 40, 110)
             pygame.draw.rect(screen, panel_color, stats_rect, border_radius=10)
             stats_padding = 24
-            total_played = matches_won + matches_lost
-            win_rate = (matches_won / total_played * 100) if total_played else 0
+            total_played = match.matches_won + match.matches_lost
+            win_rate = (match.matches_won / total_played * 100) if total_played else 0
             stats_lines = [
                 f'Matches: {total_played}    Win%: {win_rate:.0f}%',
-                f'Streak: {win_streak} (Best {best_streak})    Race to {best_of_goal}',
+                f'Streak: {match.win_streak} (Best {match.best_streak})    Race to {match.best_of_goal}',
+                f'AI: {difficulty_modes[difficulty_idx]}',
             ]
             for i, line in enumerate(stats_lines):
-                txt = small.render(line, True, text_color)
+                txt = render_text(small, line, text_color)
                 screen.blit(txt, (stats_rect.left + stats_padding, stats_rect.top + 16 + i * 22))
 
-            leaderboard = [(rec.get('name','?'), rec) for rec in remote_leaderboard][:3]
-            lb_title = small.render('Leaderboard (streaks)', True, accent_color)
+            lb_title = render_text(small, 'Leaderboard (streaks)', accent_color)
             lb_x = stats_rect.right - stats_padding - lb_title.get_width()
             lb_y = stats_rect.top + 12
             screen.blit(lb_title, (lb_x, lb_y))
-            for idx, (name, rec) in enumerate(leaderboard):
-                line = f"{idx+1}. {name}: {rec.get('best_streak',0)}"
-                txt = small.render(line, True, text_color)
+            for idx, rec in enumerate(leaderboard.top(3)):
+                line = f"{idx+1}. {rec.get('name','?')}: {rec.get('best_streak',0)}"
+                txt = render_text(small, line, text_color)
                 screen.blit(txt, (lb_x, lb_y + 18 + idx * 18))
 
             pygame.draw.rect(screen, panel_color, (20, 330, WIDTH - 40, 170), border_radius=10)
-            draw_text_center(screen, f'Player: {player_score}   -   Computer: {computer_score}', mid, 370, text_color)
-            if countdown > 0:
-                # show animated 3-2-1
-                # compute which number to show
-                secs = max(0, countdown)
-                if secs > 1.2:
-                    num = '3'
-                elif secs > 0.6:
-                    num = '2'
-                else:
-                    num = '1'
-                draw_text_center(screen, num, large, 430, accent_color)
+            draw_text_center(screen, f'Player: {match.player_score}   -   Computer: {match.computer_score}', mid, 370, text_color)
+            if countdown_digit:
+                draw_text_center(screen, countdown_digit, large, 430, accent_color)
             elif show_move:
                 # display moves
                 p, c = show_move
                 draw_text_center(screen, f'You: {p.upper()}   -   Computer: {c.upper()}', mid, 410, text_color)
                 # animate result glow
-                glow = 40 + int(40 * abs(math.sin(anim_timer * 4)))
                 glow_color = (min(255, accent_color[0] + glow//2), min(255, accent_color[1] + glow//3), min(255, accent_color[2] + glow//4))
                 draw_text_center(screen, round_result, large, 450, glow_color)
             else:
@@ -654,11 +771,10 @@ def main():
             box_w, box_h = 520, 60
             box_rect = pygame.Rect(WIDTH//2 - box_w//2, HEIGHT//2 + 10, box_w, box_h)
             pygame.draw.rect(screen, panel_color, box_rect, border_radius=8)
-            blink_on = (pygame.time.get_ticks() // 400) % 2 == 0
             display_name = player_name
             if blink_on:
                 display_name += '|'
-            name_txt = mid.render(display_name, True, text_color)
+            name_txt = render_text(mid, display_name, text_color)
             screen.blit(name_txt, (WIDTH//2 - name_txt.get_width()//2, box_rect.y + (box_h - name_txt.get_height())//2))
 
         # draw buttons (only in playing state)
@@ -670,15 +786,12 @@ def main():
         confirm_rect = pygame.Rect(0,0,0,0)
         cancel_rect = pygame.Rect(0,0,0,0)
         if state == 'tutorial':
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0,0,0,200))
-            screen.blit(overlay, (0,0))
             panel_w = min(700, WIDTH - 80)
             panel_h = 420
             panel_x = (WIDTH - panel_w) // 2
             panel_y = (HEIGHT - panel_h) // 2
             panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-            pygame.draw.rect(screen, panel_color, panel_rect, border_radius=12)
+            screen.blit(overlay_layer((WIDTH, HEIGHT), OVERLAY_DIM, panel_rect, panel_color), (0, 0))
 
             wrap_width = panel_w - 60
             y = panel_rect.top + 30
@@ -687,6 +800,7 @@ def main():
                 'Play with keys R / P / S or click the icons.',
                 'Match length: best of 3, 5, or 10 (choose next).',
                 'Music: press M to toggle on/off.',
+                'Difficulty: press D to switch the computer AI.',
                 'Stats: win%, streaks, and leaderboard show top streaks (top 3).',
             ]
             for line in tutorial_lines:
@@ -700,19 +814,16 @@ def main():
             confirm_rect = pygame.Rect(btn_x, btn_y, btn_w, btn_h)
             cancel_rect = pygame.Rect(0,0,0,0)
             pygame.draw.rect(screen, (80,180,90), confirm_rect, border_radius=8)
-            confirm_txt = mid.render('Continue', True, (0,0,0))
+            confirm_txt = render_text(mid, 'Continue', (0,0,0))
             screen.blit(confirm_txt, confirm_txt.get_rect(center=confirm_rect.center))
 
         elif state == 'best_of_choice':
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0,0,0,200))
-            screen.blit(overlay, (0,0))
             panel_w = panel_w_pre
             panel_h = panel_h_pre
             panel_x = panel_x_pre
             panel_y = panel_y_pre
             panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-            pygame.draw.rect(screen, panel_color, panel_rect, border_radius=12)
+            screen.blit(overlay_layer((WIDTH, HEIGHT), OVERLAY_DIM, panel_rect, panel_color), (0, 0))
 
             wrap_width = panel_w - 60
             y = panel_rect.top + 34
@@ -720,19 +831,16 @@ def main():
             labels = ['Best of 3', 'Best of 5', 'Best of 10']
             for rect, label in zip(option_rects, labels):
                 pygame.draw.rect(screen, accent_color, rect, border_radius=10)
-                lbl = mid.render(label, True, (0,0,0))
+                lbl = render_text(mid, label, (0,0,0))
                 screen.blit(lbl, lbl.get_rect(center=rect.center))
 
         elif state == 'confirm_identity':
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0,0,0,200))
-            screen.blit(overlay, (0,0))
             panel_w = min(620, WIDTH - 80)
             panel_h = 240
             panel_x = (WIDTH - panel_w) // 2
             panel_y = (HEIGHT - panel_h) // 2
             panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-            pygame.draw.rect(screen, panel_color, panel_rect, border_radius=12)
+            screen.blit(overlay_layer((WIDTH, HEIGHT), OVERLAY_DIM, panel_rect, panel_color), (0, 0))
 
             wrap_width = panel_w - 60
             y = panel_rect.top + 32
@@ -747,21 +855,18 @@ def main():
             cancel_rect = pygame.Rect(panel_rect.right - btn_w - 30, btn_y, btn_w, btn_h)
             pygame.draw.rect(screen, (80,180,90), confirm_rect, border_radius=8)
             pygame.draw.rect(screen, (180,60,60), cancel_rect, border_radius=8)
-            confirm_txt = mid.render('Yes, that is me', True, (0,0,0))
-            cancel_txt = mid.render('Try another', True, (0,0,0))
+            confirm_txt = render_text(mid, 'Yes, that is me', (0,0,0))
+            cancel_txt = render_text(mid, 'Try another', (0,0,0))
             screen.blit(confirm_txt, confirm_txt.get_rect(center=confirm_rect.center))
             screen.blit(cancel_txt, cancel_txt.get_rect(center=cancel_rect.center))
 
         elif state == 'post_match_choice':
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0,0,0,200))
-            screen.blit(overlay, (0,0))
             panel_w = min(760, WIDTH - 80)
             panel_h = 300
             panel_x = (WIDTH - panel_w) // 2
             panel_y = (HEIGHT - panel_h) // 2
             panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-            pygame.draw.rect(screen, panel_color, panel_rect, border_radius=12)
+            screen.blit(overlay_layer((WIDTH, HEIGHT), OVERLAY_DIM, panel_rect, panel_color), (0, 0))
 
             wrap_width = panel_w - 60
             y = panel_rect.top + 32
@@ -778,40 +883,35 @@ def main():
             ]
             for rect, label in zip(option_rects, labels):
                 pygame.draw.rect(screen, accent_color, rect, border_radius=10)
-                lbl = mid.render(label, True, (0,0,0))
+                lbl = render_text(mid, label, (0,0,0))
                 screen.blit(lbl, lbl.get_rect(center=rect.center))
 
         elif state == 'confirm_quit':
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0,0,0,200))
-            screen.blit(overlay, (0,0))
             panel_w = min(680, WIDTH - 80)
             panel_h = 460
             panel_x = (WIDTH - panel_w) // 2
             panel_y = (HEIGHT - panel_h) // 2
             panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-            pygame.draw.rect(screen, panel_color, panel_rect, border_radius=12)
+            screen.blit(overlay_layer((WIDTH, HEIGHT), OVERLAY_DIM, panel_rect, panel_color), (0, 0))
 
             wrap_width = panel_w - 60
             y = panel_rect.top + 30
             # Motivation based on leaderboard standing for existing users
-            leaderboard = sorted(remote_leaderboard, key=lambda rec: rec.get('best_streak',0), reverse=True)
             if player_name:
-                rank = None
-                for idx_lb, rec in enumerate(leaderboard):
-                    if rec.get('name') == player_name:
-                        rank = idx_lb
-                        break
-                top_streak = leaderboard[0].get('best_streak', 0) if leaderboard else 0
+                rank = board_rank()
+                top_streak = leaderboard.top(1)[0].get('best_streak', 0) if leaderboard else 0
+                top_pct = player_top_percent()
                 if rank == 0:
                     msg = 'You are #1. Keep the crown!'
                 elif rank is not None:
                     msg = f'You are #{rank+1}. Top streak is {top_streak}. Climb to #1!'
+                elif top_pct:
+                    msg = f'Top {top_pct}% of players. Top streak is {top_streak}. Climb the board!'
                 else:
                     msg = f'Top streak is {top_streak}. Play to get on the board!'
                 y = draw_wrapped_center(screen, msg, mid, y, wrap_width, (200, 200, 255), line_gap=6) + 10
 
-            summary_msgs = build_summary_msgs(player_name or 'PLAYER', player_score, computer_score)
+            summary_msgs = build_summary_msgs(player_name or 'PLAYER', match.player_score, match.computer_score)
             for text, col in summary_msgs:
                 y = draw_wrapped_center(screen, text, mid, y, wrap_width, col, line_gap=8) + 6
             y += 20
@@ -820,11 +920,11 @@ def main():
             if quit_rank_note:
                 y = draw_wrapped_center(screen, quit_rank_note, mid, y, wrap_width, (200, 200, 255), line_gap=6) + 10
 
-            total_played = matches_won + matches_lost
+            total_played = match.matches_won + match.matches_lost
             stats_block = [
-                f"Matches: {total_played} (W {matches_won} / L {matches_lost})",
-                f"Current streak: {win_streak}   Best streak: {best_streak}",
-                f"Best-of target: {best_of_goal}",
+                f"Matches: {total_played} (W {match.matches_won} / L {match.matches_lost})",
+                f"Current streak: {match.win_streak}   Best streak: {match.best_streak}",
+                f"Best-of target: {match.best_of_goal}",
             ]
             for line in stats_block:
                 y = draw_wrapped_center(screen, line, small, y, wrap_width, text_color, line_gap=4) + 4
@@ -837,29 +937,25 @@ def main():
             cancel_rect = pygame.Rect(panel_rect.right - btn_w - 30, btn_y, btn_w, btn_h)
             pygame.draw.rect(screen, (180,60,60), confirm_rect, border_radius=8)
             pygame.draw.rect(screen, (80,180,90), cancel_rect, border_radius=8)
-            confirm_txt = mid.render('Quit', True, (0,0,0))
-            cancel_txt = mid.render('Cancel', True, (0,0,0))
+            confirm_txt = render_text(mid, 'Quit', (0,0,0))
+            cancel_txt = render_text(mid, 'Cancel', (0,0,0))
             screen.blit(confirm_txt, confirm_txt.get_rect(center=confirm_rect.center))
             screen.blit(cancel_txt, cancel_txt.get_rect(center=cancel_rect.center))
 
         elif state == 'quit_stats':
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0,0,0,200))
-            screen.blit(overlay, (0,0))
             panel_w = min(760, WIDTH - 80)
             panel_h = 520
             panel_x = (WIDTH - panel_w) // 2
             panel_y = (HEIGHT - panel_h) // 2
             panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-            pygame.draw.rect(screen, panel_color, panel_rect, border_radius=12)
+            screen.blit(overlay_layer((WIDTH, HEIGHT), OVERLAY_DIM, panel_rect, panel_color), (0, 0))
 
             wrap_width = panel_w - 60
             y = panel_rect.top + 28
             y = draw_wrapped_center(screen, 'Leaderboard (top streaks)', mid, y, wrap_width, accent_color, line_gap=6) + 10
 
-            leaderboard = [(rec.get('name','?'), rec) for rec in remote_leaderboard][:10]
-            for idx, (name, rec) in enumerate(leaderboard):
-                line = f"{idx+1}. {name}: {rec.get('best_streak',0)}"
+            for idx, rec in enumerate(leaderboard.top(LEADERBOARD_LIMIT)):
+                line = f"{idx+1}. {rec.get('name','?')}: {rec.get('best_streak',0)}"
                 y = draw_wrapped_center(screen, line, mid, y, wrap_width, text_color, line_gap=4) + 4
             y += 14
 
@@ -870,19 +966,70 @@ def main():
             cancel_rect = pygame.Rect(panel_rect.right - btn_w - 30, btn_y, btn_w, btn_h)
             pygame.draw.rect(screen, (180,60,60), confirm_rect, border_radius=8)
             pygame.draw.rect(screen, (80,180,90), cancel_rect, border_radius=8)
-            confirm_txt = mid.render('Quit', True, (0,0,0))
-            cancel_txt = mid.render('Cancel', True, (0,0,0))
+            confirm_txt = render_text(mid, 'Quit', (0,0,0))
+            cancel_txt = render_text(mid, 'Cancel', (0,0,0))
             screen.blit(confirm_txt, confirm_txt.get_rect(center=confirm_rect.center))
             screen.blit(cancel_txt, cancel_txt.get_rect(center=cancel_rect.center))
 
+        elif state == 'leaderboard':
+            panel_w = min(760, WIDTH - 80)
+            panel_h = 560
+            panel_rect = pygame.Rect((WIDTH - panel_w) // 2, (HEIGHT - panel_h) // 2, panel_w, panel_h)
+            screen.blit(overlay_layer((WIDTH, HEIGHT), OVERLAY_DIM, panel_rect, panel_color), (0, 0))
+
+            y = panel_rect.top + 24
+            draw_text_center(screen, 'Leaderboard', mid_bold, y + 14, accent_color)
+            y += 52
+            header = render_text(small, f"{'#':>6}  {'name':<20}{'streak':>7}{'win%':>7}", accent_color)
+            screen.blit(header, (panel_rect.left + 40, y))
+            y += 30
+            me = (player_name or '').strip().lower()
+            for rank, rec in pager.rows(BROWSER_ROWS):
+                if rec is None:
+                    line, color = f'{rank + 1:>6}  ...', (150, 150, 150)
+                else:
+                    line = (f"{rank + 1:>6}  {str(rec.get('name', '?'))[:19]:<20}"
+                            f"{rec.get('best_streak', 0):>7}{win_pct(rec):>6.0f}%")
+                    color = accent_color if rec.get('name') == me else text_color
+                screen.blit(render_text(small, line, color), (panel_rect.left + 40, y))
+                y += 34
+            if pager.total == 0:
+                draw_text_center(screen, 'No scores yet.', mid, y + 20, text_color)
+            hint = 'Up/Down, PgUp/PgDn, wheel: scroll   Home: top   L/ESC: back'
+            draw_text_center(screen, hint, small, panel_rect.bottom - 28, (150, 150, 150))
+
         # footer
-        footer_text = f"ESC: quit  |  R/P/S: play  |  M: music {'on' if music_enabled else 'off'}  |  3/5/0: best-of"
-        footer = small.render(footer_text, True, (150, 150, 150))
+        footer = render_text(small, footer_text, (150, 150, 150))
         screen.blit(footer, (20, HEIGHT - 30))
 
-        pygame.display.flip()
+        if profiler:
+            if profiler.hud_visible:
+                profiler.draw_hud(screen, small)
+            now = time.perf_counter()
+            profiler.add('draw', now - phase_start)
+            phase_start = now
+
+        if dirty_rects_enabled:
+            pygame.display.update(dirty)
+        else:
+            pygame.display.flip()
+        if profiler:
+            profiler.add('present', time.perf_counter() - phase_start)
 
     stop_music()
+    # don't tear the mixer down under a sound that is still decoding, and
+    # only unmap the bundle once no job can be reading from it
+    assets.cancel()
+    if assets.wait(timeout=5) and bundle:
+        bundle.close()
+    if replay:
+        replay.close()
+    # let a final push_scores finish before the display goes away
+    score_worker.shutdown(wait=True)
+    if journal:
+        journal.close()
+    if profiler:
+        profiler.export()
     pygame.quit()
 
 
@@ -0,0 +1,93 @@
+"""Caches for rendered Pygame surfaces.
+
+Most on-screen text (titles, labels, footer, score line) changes rarely, so
+rasterizing it with font.render every frame is wasted work. TextCache keeps
+the rendered surfaces in a bounded LRU keyed by what affects the pixels.
+"""
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """LRU of font.render results keyed by (text, font, color, antialias)."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Drop-in for font.render(text, antialias, color). Treat the result as read-only."""
+        key = (text, font, tuple(color), antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._surfaces)}
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    """Render text through the shared cache."""
+    return text_cache.render(font, text, antialias, color)
+
+
+class OverlayCache:
+    """Pre-built overlay layers: a dimmed full-window fill plus its panel.
+
+    Overlay screens used to allocate and fill a window-sized SRCALPHA surface
+    every frame. Layers are keyed by everything that affects their pixels
+    (size, dim color, panel rect/color, border), which in practice means one
+    entry per overlay state and theme, so drawing an overlay is one blit.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._layers = OrderedDict()
+
+    def layer(self, size, dim, panel_rect, panel_color, border_radius=12, border=None):
+        """Return the cached layer; `border` is an optional (color, width) outline."""
+        key = (tuple(size), tuple(dim), tuple(panel_rect), tuple(panel_color), border_radius, border)
+        surf = self._layers.get(key)
+        if surf is not None:
+            self._layers.move_to_end(key)
+            return surf
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(dim)
+        pygame.draw.rect(surf, panel_color, panel_rect, border_radius=border_radius)
+        if border:
+            color, width = border
+            pygame.draw.rect(surf, color, panel_rect, width, border_radius=border_radius)
+        self._layers[key] = surf
+        if len(self._layers) > self.maxsize:
+            self._layers.popitem(last=False)
+        return surf
+
+    def __len__(self):
+        return len(self._layers)
+
+    def clear(self):
+        self._layers.clear()
+
+
+overlay_cache = OverlayCache()
+
+
+def overlay_layer(size, dim, panel_rect, panel_color, border_radius=12, border=None):
+    return overlay_cache.layer(size, dim, panel_rect, panel_color, border_radius, border)
@@ -0,0 +1,226 @@
+"""Append-only binary replay log, one file per player.
+
+    data/replays/<player>.rpsr
+
+    header  magic b'RPSR', version, record size, base time (f64 epoch seconds)
+    record  two little-endian uint32 words per round (8 bytes):
+            [0] time since the base time, in TICK (0.1 s) units (~13 years)
+            [1] match_id << 6 | player_move << 4 | computer_move << 2 | outcome
+
+Moves use logic.MOVE_IDS (0 rock, 1 paper, 2 scissors) and outcomes
+logic.Outcome (0 tie, 1 player, 2 computer). Writers buffer rounds in memory
+and append them in one write; a torn final record left by a crash is
+dropped on the next open. Readers mmap the file and, with NumPy installed,
+hand out zero-copy (n, 2) uint32 views of the records.
+"""
+import mmap
+import os
+import re
+import struct
+import time
+from collections import namedtuple
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; readers fall back to tuples
+    np = None
+
+from rps.logic import Outcome, move_id
+from rps.score_journal import DATA_DIR
+
+REPLAY_DIR = DATA_DIR / "replays"
+SUFFIX = ".rpsr"
+MAGIC = b"RPSR"
+VERSION = 1
+TICK = 0.1  # seconds per time unit
+HEADER = struct.Struct("<4sHHd")  # magic, version, record size, base time
+RECORD = struct.Struct("<II")
+MAX_TICKS = 2 ** 32 - 1
+MAX_MATCH_ID = 2 ** 26 - 1
+
+Round = namedtuple("Round", "time player computer outcome match")
+
+
+def pack_round(player, computer, outcome, match):
+    return (match << 6) | (player << 4) | (computer << 2) | outcome
+
+
+def replay_path(name, directory=None):
+    """File for a player; the name is normalized and reduced to [a-z0-9_-]."""
+    slug = re.sub(r"[^a-z0-9_-]+", "_", (name or "").strip().lower()).strip("_") or "player"
+    return Path(directory or REPLAY_DIR) / (slug + SUFFIX)
+
+
+class ReplayWriter:
+    """Buffered appender. Rounds are held in memory until `flush_every` have
+    accumulated, a match ends, or the writer is closed."""
+
+    def __init__(self, path, flush_every=256, clock=time.time):
+        self.path = Path(path)
+        self.name = None  # player name, when opened through for_player()
+        self.flush_every = flush_every
+        self._clock = clock
+        self._buffer = bytearray()
+        self._pending = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a+b")
+        self._file.seek(0, os.SEEK_END)
+        size = self._file.tell()
+        if size < HEADER.size:
+            self._file.truncate(0)
+            self.base_time = self._clock()
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, self.base_time))
+            self._file.flush()
+            self.match_id = 0
+            return
+        self._file.seek(0)
+        magic, version, record_size, self.base_time = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self._file.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} replay log")
+        torn = (size - HEADER.size) % RECORD.size
+        if torn:
+            self._file.truncate(size - torn)
+            size -= torn
+        self.match_id = 0
+        if size > HEADER.size:
+            # a new session always starts a new match
+            self._file.seek(size - RECORD.size)
+            _, packed = RECORD.unpack(self._file.read(RECORD.size))
+            self.match_id = min(MAX_MATCH_ID, (packed >> 6) + 1)
+        self._file.seek(0, os.SEEK_END)
+
+    @classmethod
+    def for_player(cls, name, directory=None, **kwargs):
+        writer = cls(replay_path(name, directory), **kwargs)
+        writer.name = name
+        return writer
+
+    def record(self, player_move, computer_move, outcome, when=None):
+        """Append one round; moves are names or ids, outcome a name or Outcome."""
+        if isinstance(player_move, str):
+            player_move = move_id(player_move)
+        if isinstance(computer_move, str):
+            computer_move = move_id(computer_move)
+        if isinstance(outcome, str):
+            outcome = Outcome[outcome.upper()]
+        elapsed = (self._clock() if when is None else when) - self.base_time
+        ticks = min(MAX_TICKS, max(0, int(elapsed / TICK)))
+        self._buffer += RECORD.pack(ticks, pack_round(int(player_move), int(computer_move),
+                                                      int(outcome), self.match_id))
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def end_match(self):
+        """Close the current match: later rounds get the next match id."""
+        self.match_id = min(MAX_MATCH_ID, self.match_id + 1)
+        self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self._buffer.clear()
+            self._pending = 0
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def decode(words):
+    """Split packed records into columns.
+
+    `words` is an (n, 2) uint32 array (NumPy) or a sequence of (ticks, packed)
+    pairs; returns a dict of arrays or lists: ticks, player, computer,
+    outcome, match.
+    """
+    if np is not None and isinstance(words, np.ndarray):
+        ticks = words[:, 0]
+        packed = words[:, 1]
+        return {
+            "ticks": ticks,
+            "player": (packed >> 4) & 3,
+            "computer": (packed >> 2) & 3,
+            "outcome": packed & 3,
+            "match": packed >> 6,
+        }
+    ticks = [w[0] for w in words]
+    packed = [w[1] for w in words]
+    return {
+        "ticks": ticks,
+        "player": [(p >> 4) & 3 for p in packed],
+        "computer": [(p >> 2) & 3 for p in packed],
+        "outcome": [p & 3 for p in packed],
+        "match": [p >> 6 for p in packed],
+    }
+
+
+class ReplayReader:
+    """Read-only mmap over a replay log.
+
+    Arrays returned by records()/chunks() borrow the mapping; drop them
+    before close() (close() leaves the map to the garbage collector if any
+    are still alive).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"{self.path} is not a replay log")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, self.base_time = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self._map.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} replay log")
+        # a torn final record (crash mid-append) is ignored
+        self.count = (size - HEADER.size) // RECORD.size
+
+    def __len__(self):
+        return self.count
+
+    def records(self, start=0, stop=None):
+        """Packed records [start, stop) as a zero-copy (n, 2) uint32 view, or a list of tuples without NumPy."""
+        stop = self.count if stop is None else min(stop, self.count)
+        start = min(start, stop)
+        offset = HEADER.size + start * RECORD.size
+        if np is not None:
+            return np.frombuffer(self._map, dtype="<u4", count=(stop - start) * 2,
+                                 offset=offset).reshape(-1, 2)
+        return list(RECORD.iter_unpack(self._map[offset:HEADER.size + stop * RECORD.size]))
+
+    def chunks(self, size=1 << 20):
+        """Decoded columns for successive windows of `size` rounds (constant memory)."""
+        for start in range(0, self.count, size):
+            yield decode(self.records(start, start + size))
+
+    def __iter__(self):
+        for start in range(0, self.count, 4096):
+            for ticks, packed in RECORD.iter_unpack(
+                    self._map[HEADER.size + start * RECORD.size:
+                              HEADER.size + min(self.count, start + 4096) * RECORD.size]):
+                yield Round(self.base_time + ticks * TICK, (packed >> 4) & 3,
+                            (packed >> 2) & 3, packed & 3, packed >> 6)
+
+    def close(self):
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # views still alive; the map is released with them
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,265 @@
+"""Local write-behind journal for match results.
+
+Game-loop writes only append a JSON line to `data/score_journal.jsonl`;
+a background flusher fsyncs in batches and drains pending records to the
+backend. Records carry absolute totals (wins, losses, best streak), so
+replaying one is idempotent and only the newest record per player matters.
+On open the journal is compacted down to records the backend has not yet
+acknowledged, and the latest known record per player is written to the
+`data/scores.json` local cache.
+
+Several game instances on one host share the journal. Each open() picks a
+random writer id that is stored with its records and their acks, so seq
+numbers handed out independently by two instances never collide: an ack
+names exactly one (writer, seq) record. Each instance also holds a shared
+lock on a sidecar `.lock` file while it has the journal open, and compaction
+(which replaces the file) only runs under an exclusive lock, i.e. when no
+other instance is appending. Without fcntl (Windows) the replace itself
+fails while another process has the file open, and compaction is skipped.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from rps.leaderboard import normalize_name
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks; see the module docstring
+    fcntl = None
+
+DATA_DIR = Path(os.getenv("RPS_DATA_DIR") or Path(__file__).resolve().parents[2] / "data")
+JOURNAL_PATH = DATA_DIR / "score_journal.jsonl"
+SCORES_PATH = DATA_DIR / "scores.json"
+
+SCORE_FIELDS = ("matches_won", "matches_lost", "best_streak")
+
+
+def load_scores(path):
+    """Read the local score cache ({name: record}); empty if missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_scores(path, data):
+    """Atomically replace the local score cache."""
+    _atomic_write(path, json.dumps(data, indent=2, sort_keys=True))
+
+
+def _atomic_write(path, text):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _record_key(entry):
+    """Identity of a record or of the record an ack refers to: (writer id, seq)."""
+    return entry.get("w"), entry["seq"]
+
+
+def _order(rec):
+    return rec.get("ts", 0.0), rec["seq"]
+
+
+def _upsert_batch(records):
+    from rps.shared_scores import upsert_scores
+
+    return upsert_scores(records)
+
+
+class ScoreJournal:
+    """Append-only journal of player totals with a background drain to the backend.
+
+    `sink` takes a list of records and returns a same-length list of saved
+    rows (None where a record was not stored).
+    """
+
+    def __init__(self, path=JOURNAL_PATH, cache_path=SCORES_PATH, sink=_upsert_batch,
+                 flush_interval=0.5, retry_interval=30.0, batch_size=50):
+        self.path = Path(path)
+        self.cache_path = Path(cache_path)
+        self.sink = sink
+        self.flush_interval = flush_interval
+        self.retry_interval = retry_interval
+        self.batch_size = batch_size
+        self._file = None
+        self._lock = threading.Lock()  # guards the file handle and _pending
+        self._drain_lock = threading.Lock()
+        # both keyed by normalize_name(): 'Ash' and 'ash' are one backend row
+        self._pending = {}  # name -> newest unacknowledged record
+        self._acked = {}  # name -> (seq, saved row) of this writer's newest acknowledged record
+        self._lock_file = None
+        self.writer = None  # random id for this instance's records, set by open()
+        self._next_seq = 1
+        self._unsynced = 0
+        self._retry_at = 0.0
+        self._stop = threading.Event()
+        self._flusher = None
+
+    def open(self):
+        """Compact the journal, refresh the local cache and open for appending."""
+        exclusive = self._acquire_lock()
+        self.writer = uuid.uuid4().hex[:12]
+        records, acked = self._read()
+        latest = {}
+        for rec in records:  # file order is append order, across every writer
+            latest[normalize_name(rec["name"])] = rec
+        self._pending = {name: rec for name, rec in latest.items() if _record_key(rec) not in acked}
+        # seqs only need to be unique per writer; continuing past the file keeps them readable
+        self._next_seq = max((r["seq"] for r in records), default=0) + 1
+
+        if latest:
+            cache = load_scores(self.cache_path)
+            for rec in latest.values():
+                cache[rec["name"]] = {k: rec[k] for k in SCORE_FIELDS}
+            save_scores(self.cache_path, cache)
+
+        if exclusive:
+            pending = sorted(self._pending.values(), key=_order)
+            try:
+                _atomic_write(self.path, "".join(json.dumps(r) + "\n" for r in pending))
+            except OSError:
+                pass  # still open elsewhere (Windows); compact on a later start
+            if fcntl:
+                fcntl.flock(self._lock_file, fcntl.LOCK_SH)
+        self._file = open(self.path, "a", encoding="utf-8")
+        return self
+
+    def _acquire_lock(self):
+        """Take the journal lock; True if this instance may compact."""
+        if fcntl is None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_file = open(self.path.with_name(self.path.name + ".lock"), "a")
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            # another instance has the journal open: share it, don't replace it
+            fcntl.flock(self._lock_file, fcntl.LOCK_SH)
+            return False
+
+    def _read(self):
+        records, acked = [], set()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn write from a crash; everything before it is intact
+                    if entry.get("op") == "ack":
+                        acked.add(_record_key(entry))
+                    elif "name" in entry:
+                        records.append(entry)
+        except OSError:
+            pass
+        return records, acked
+
+    def _write_line(self, entry):
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()  # hand to the OS now; fsync is batched by sync()
+        self._unsynced += 1
+
+    def append(self, name, matches_won, matches_lost, best_streak):
+        """Journal a player's totals. Returns the record, or None if unchanged."""
+        rec = {"name": name, "matches_won": matches_won, "matches_lost": matches_lost,
+               "best_streak": best_streak}
+        with self._lock:
+            key = normalize_name(name)
+            prev = self._pending.get(key)
+            if prev and all(prev[k] == rec[k] for k in SCORE_FIELDS):
+                return None
+            rec["seq"] = self._next_seq
+            rec["w"] = self.writer
+            rec["ts"] = time.time()
+            self._next_seq += 1
+            self._write_line(rec)
+            self._pending[key] = rec
+        return rec
+
+    def pending(self):
+        with self._lock:
+            return sorted(self._pending.values(), key=_order)
+
+    def sync(self):
+        """fsync everything appended since the last sync."""
+        with self._lock:
+            if self._file and self._unsynced:
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+
+    def drain(self):
+        """Send pending records to the backend. Returns {name: saved row} for successes."""
+        saved_rows = {}
+        with self._drain_lock:
+            pending = self.pending()
+            for start in range(0, len(pending), self.batch_size):
+                batch = pending[start:start + self.batch_size]
+                try:
+                    results = self.sink(batch)
+                except Exception:
+                    results = [None] * len(batch)
+                with self._lock:
+                    for rec, saved in zip(batch, results):
+                        if not saved:
+                            continue
+                        saved_rows[rec["name"]] = saved
+                        if rec.get("w") == self.writer:
+                            self._acked[normalize_name(rec["name"])] = (rec["seq"], saved)
+                        if self._file:
+                            self._write_line({"op": "ack", "w": rec.get("w"), "seq": rec["seq"]})
+                        key = normalize_name(rec["name"])
+                        if self._pending.get(key) is rec:
+                            del self._pending[key]
+                if not all(results):
+                    self._retry_at = time.monotonic() + self.retry_interval
+                    break
+        self.sync()
+        return saved_rows
+
+    def saved(self, name, seq):
+        """Backend row for this writer's record `seq` of `name`, or None if it is not acknowledged.
+
+        A newer record for the same player supersedes `seq`, so its row is
+        returned instead. Call after drain(): drains are serialized, so a
+        record the flusher sent concurrently is acknowledged by then.
+        """
+        with self._lock:
+            acked_seq, row = self._acked.get(normalize_name(name), (0, None))
+        return row if acked_seq >= seq else None
+
+    def start_flusher(self):
+        self._flusher = threading.Thread(target=self._flush_loop, name="rps-journal", daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.sync()
+            if self._pending and time.monotonic() >= self._retry_at:
+                self.drain()
+
+    def close(self):
+        self._stop.set()
+        if self._flusher:
+            self._flusher.join()
+        self.sync()
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+            if self._lock_file:
+                self._lock_file.close()  # releases the flock
+                self._lock_file = None
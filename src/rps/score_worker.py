@@ -0,0 +1,61 @@
+"""Background worker for leaderboard/player calls.
+
+The shared_scores functions block on the network. ScoreWorker runs them on a
+single background thread (so calls keep their submission order) and hands
+each result back to the Pygame loop as a SCORES_EVENT, keeping the UI
+rendering while a request is in flight. A job that raises still produces
+its event (result None, error set) and the exception is logged, since the
+shared_scores calls themselves swallow network errors and anything that
+escapes is a real fault.
+"""
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+# reserved through custom_type so other user events (e.g. scripted drivers) cannot collide
+SCORES_EVENT = pygame.event.custom_type()
+
+log = logging.getLogger(__name__)
+
+
+def post_scores_event(tag, result, error):
+    pygame.event.post(pygame.event.Event(SCORES_EVENT, tag=tag, result=result, error=error))
+
+
+class ScoreWorker:
+    """`timer`, if given, is called with each call's duration in seconds (on the worker thread)."""
+
+    def __init__(self, post=post_scores_event, timer=None):
+        self._post = post
+        self.timer = timer
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rps-scores')
+
+    def submit(self, tag, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) off the main thread; its result arrives as an event tagged `tag`."""
+        future = self._executor.submit(self._timed, fn, args, kwargs)
+        future.add_done_callback(lambda f: self._deliver(tag, f))
+        return future
+
+    def _timed(self, fn, args, kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            if self.timer:
+                self.timer(time.perf_counter() - start)
+
+    def _deliver(self, tag, future):
+        error = future.exception()
+        result = None if error else future.result()
+        if error:
+            log.warning('scores job %r failed', tag, exc_info=error)
+        try:
+            self._post(tag, result, error)
+        except pygame.error:
+            # display already torn down during shutdown; nothing left to notify
+            pass
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
@@ -1,6 +1,8 @@
 import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-import requests
 
 
 def _load_dotenv():
@@ -22,35 +24,221 @@ def _load_dotenv():
         pass
 
 
-_load_dotenv()
-
 # Public-facing backend API that proxies to Supabase securely (no keys in client)
 # Default to the shared Worker so users don't need to set anything.
-BACKEND_API_BASE = os.getenv(
-    "BACKEND_API_BASE",
-    "https://floral-frog-3f5f.sriashwinsridharan.workers.dev",
-).rstrip("/")
+DEFAULT_BACKEND_API_BASE = "https://floral-frog-3f5f.sriashwinsridharan.workers.dev"
+
+# Resolved (env / .env / default) on first use so importing this module has no
+# side effects; assign a string to override.
+BACKEND_API_BASE = None
+
+
+def backend_api_base():
+    global BACKEND_API_BASE
+    if BACKEND_API_BASE is None:
+        _load_dotenv()
+        BACKEND_API_BASE = os.getenv("BACKEND_API_BASE", DEFAULT_BACKEND_API_BASE).rstrip("/")
+    return BACKEND_API_BASE
+
+
+# Connection pooling / retry tuning for the shared keep-alive session.
+POOL_CONNECTIONS = 2
+POOL_MAXSIZE = 4
+GET_RETRIES = 3
+RETRY_BACKOFF = 0.3  # seconds; doubles per attempt
+RETRY_JITTER = 0.2  # seconds of random jitter added to each backoff
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_retry():
+    from urllib3.util.retry import Retry
+
+    # Only GETs are retried; POST /score is left to the caller so a timed-out
+    # upsert is never replayed blindly.
+    kwargs = dict(
+        total=GET_RETRIES,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_jitter=RETRY_JITTER, **kwargs)
+    except TypeError:  # urllib3 < 2 has no jitter option
+        return Retry(**kwargs)
+
+
+def _build_session():
+    # requests is imported here rather than at module level; it is the
+    # slowest import on the startup path and only the worker thread needs it
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=_build_retry(),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    """Return the shared keep-alive session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def set_session(session):
+    """Swap the HTTP client (any object with requests.Session's get/post), e.g. for tests.
+
+    Pass None to drop the current session; a fresh pooled one is built on next use.
+    """
+    global _session
+    with _session_lock:
+        _session = session
+
+
+# Response cache: per-endpoint freshness window (seconds) and total entry cap.
+CACHE_TTLS = {"leaderboard": 15.0, "player": 30.0, "distribution": 300.0}
+CACHE_MAXSIZE = 128
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of decoded GET responses with per-entry expiry.
+
+    Expired entries are kept (until evicted) so their ETag can be used to
+    revalidate with If-None-Match instead of downloading the body again.
+    """
+
+    def __init__(self, maxsize=CACHE_MAXSIZE, clock=time.monotonic):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> [expires_at, etag, data]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def lookup(self, key):
+        """Return (fresh, etag, data) for key, or None if nothing is cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            fresh = entry[0] > self._clock()
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return fresh, entry[1], entry[2]
+
+    def store(self, key, data, ttl, etag=None):
+        with self._lock:
+            self._entries[key] = [self._clock() + ttl, etag, data]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def touch(self, key, ttl):
+        """Extend a revalidated (304 Not Modified) entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[0] = self._clock() + ttl
+                self.revalidated += 1
+
+    def invalidate(self, endpoint=None, **params):
+        """Drop entries for an endpoint (all of them, or only those matching params)."""
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            wanted = set(params.items())
+            for key in [k for k in self._entries if k[0] == endpoint]:
+                if wanted <= set(key[1]):
+                    del self._entries[key]
+
+
+_cache = ResponseCache()
+
+
+def get_cache():
+    return _cache
+
+
+def clear_cache():
+    _cache.invalidate()
+
+
+def _cache_key(endpoint, params):
+    return endpoint, tuple(sorted(params.items()))
+
+
+def _cached_get(endpoint, params):
+    """GET {BACKEND_API_BASE}/{endpoint} through the response cache.
+
+    Raises on transport errors and HTTP error statuses, like requests does.
+    """
+    key = _cache_key(endpoint, params)
+    ttl = CACHE_TTLS.get(endpoint, 0.0)
+    cached = _cache.lookup(key)
+    if cached and cached[0]:
+        return cached[2]
+    headers = {}
+    if cached and cached[1]:
+        headers["If-None-Match"] = cached[1]
+    resp = get_session().get(
+        f"{backend_api_base()}/{endpoint}", params=params, headers=headers, timeout=5
+    )
+    if resp.status_code == 304 and cached:
+        _cache.touch(key, ttl)
+        return cached[2]
+    resp.raise_for_status()
+    data = resp.json()
+    _cache.store(key, data, ttl, resp.headers.get("ETag"))
+    return data
 
 
 def _has_backend():
-    return bool(BACKEND_API_BASE)
+    return bool(backend_api_base())
 
 
 def _normalize_name(name: str) -> str:
     return (name or "").strip().lower()
 
 
-def fetch_leaderboard(limit=10):
+def fetch_leaderboard(limit=10, offset=0):
     """Fetch top streaks from a secure backend. Returns list of dicts or empty list on failure."""
+    return fetch_leaderboard_page(offset, limit) or []
+
+
+def fetch_leaderboard_page(offset=0, limit=10):
+    """One page of the board (best first), starting at rank `offset` (0-based).
+
+    Returns a list, shorter than `limit` on the last page, or None on failure
+    so callers paging through the board can tell an error from the end.
+    """
     if not _has_backend():
         return []
-    url = f"{BACKEND_API_BASE}/leaderboard"
+    params = {"limit": limit}
+    if offset:
+        params["offset"] = offset
     try:
-        resp = requests.get(url, params={"limit": limit}, timeout=5)
-        resp.raise_for_status()
-        return resp.json()
+        data = _cached_get("leaderboard", params)
     except Exception:
-        return []
+        return None
+    return data if isinstance(data, list) else None
 
 
 def fetch_player(name):
@@ -58,12 +246,8 @@ def fetch_player(name):
     if not _has_backend() or not name:
         return None
     name = _normalize_name(name)
-    url = f"{BACKEND_API_BASE}/player"
     try:
-        resp = requests.get(url, params={"name": name}, timeout=5)
-        if resp.status_code >= 400:
-            return None
-        data = resp.json()
+        data = _cached_get("player", {"name": name})
         if isinstance(data, list):
             return data[0] if data else None
         return data or None
@@ -71,29 +255,97 @@ def fetch_player(name):
         return None
 
 
-def upsert_score(name, matches_won, matches_lost, best_streak):
-    """Upsert a player's record via backend. Returns the saved record or None.
+def fetch_distribution():
+    """Fetch population histograms (see rps.distribution). Returns the payload dict or None.
 
-    Note: win_pct/total_matches are computed in the DB, so we do not send them.
+    The body is a few hundred integers regardless of player count and changes
+    slowly, so it is cached for several minutes.
     """
     if not _has_backend():
         return None
-    name = _normalize_name(name)
-    url = f"{BACKEND_API_BASE}/score"
-    payload = {
-        "name": name,
+    try:
+        data = _cached_get("distribution", {})
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _score_payload(name, matches_won, matches_lost, best_streak):
+    return {
+        "name": _normalize_name(name),
         "matches_won": matches_won,
         "matches_lost": matches_lost,
         "best_streak": best_streak,
     }
+
+
+def upsert_score(name, matches_won, matches_lost, best_streak):
+    """Upsert a player's record via backend. Returns the saved record or None.
+
+    Note: win_pct/total_matches are computed in the DB, so we do not send them.
+    """
+    if not _has_backend():
+        return None
+    payload = _score_payload(name, matches_won, matches_lost, best_streak)
+    name = payload["name"]
+    url = f"{backend_api_base()}/score"
     try:
-        resp = requests.post(url, json=payload, timeout=5)
+        resp = get_session().post(url, json=payload, timeout=5)
         if resp.status_code >= 400:
             return None
         # try to parse json; if not available, treat as success with no body
         data = resp.json()
         if isinstance(data, list):
-            return data[0] if data else None
-        return data or None
+            data = data[0] if data else None
     except Exception:
         return None
+    # the write changed this player's row and possibly the board order; the
+    # distribution is updated locally by the caller and refetched on its TTL
+    _cache.invalidate("leaderboard")
+    _cache.invalidate("player", name=name)
+    if data:
+        # the saved row is what a follow-up fetch_player would return
+        _cache.store(_cache_key("player", {"name": name}), data, CACHE_TTLS["player"])
+    return data or None
+
+
+def upsert_scores(records):
+    """Upsert many players in one request. Returns saved records aligned with `records`.
+
+    Each record is a dict with name, matches_won, matches_lost and best_streak
+    (extra keys are ignored). POSTs a JSON array to /score, which the Worker
+    passes to Supabase as one on_conflict=name upsert. Entries the backend did
+    not return come back as None; on failure every entry is None.
+
+    Names that normalize to the same player are sent once, with the last of
+    their records: one upsert statement cannot touch a row twice, so a
+    duplicate would fail the whole batch. Every duplicate gets the saved row.
+    """
+    if not records:
+        return []
+    if not _has_backend():
+        return [None] * len(records)
+    newest = {}
+    for r in records:
+        newest[_normalize_name(r["name"])] = r  # later records win
+    payload = [
+        _score_payload(r["name"], r["matches_won"], r["matches_lost"], r["best_streak"])
+        for r in newest.values()
+    ]
+    url = f"{backend_api_base()}/score"
+    try:
+        resp = get_session().post(url, json=payload, timeout=5)
+        if resp.status_code >= 400:
+            return [None] * len(records)
+        data = resp.json()
+    except Exception:
+        return [None] * len(records)
+    if isinstance(data, dict):
+        data = [data]
+    saved_by_name = {_normalize_name(row.get("name")): row for row in data or [] if isinstance(row, dict)}
+    _cache.invalidate("leaderboard")
+    for row in payload:
+        _cache.invalidate("player", name=row["name"])
+    for name, row in saved_by_name.items():
+        _cache.store(_cache_key("player", {"name": name}), row, CACHE_TTLS["player"])
+    return [saved_by_name.get(_normalize_name(r["name"])) for r in records]
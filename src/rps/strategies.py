@@ -0,0 +1,132 @@
+"""Computer move strategies (difficulty modes).
+
+Each strategy predicts the opponent's next move from fixed-size count tables
+that are updated in O(1) per round, then plays the move that beats the
+prediction. Nothing rescans history, so decision time stays flat however long
+a session runs.
+"""
+import random
+
+from rps.logic import Move
+
+
+def counter_move(move):
+    """Return the move that beats `move`."""
+    return (move + 1) % 3
+
+
+def _argmax(counts, offset, rng):
+    a, b, c = counts[offset], counts[offset + 1], counts[offset + 2]
+    best = max(a, b, c)
+    if best == 0:
+        return None
+    picks = [i for i, n in enumerate((a, b, c)) if n == best]
+    return picks[0] if len(picks) == 1 else rng.choice(picks)
+
+
+class Strategy:
+    """Base strategy: plays uniformly at random and ignores observations."""
+    name = 'random'
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+
+    def predict(self):
+        """Return the predicted next opponent Move, or None without a guess."""
+        return None
+
+    def choose(self):
+        predicted = self.predict()
+        if predicted is None:
+            return Move(self.rng.randrange(3))
+        return Move(counter_move(predicted))
+
+    def observe(self, opponent_move):
+        """Record the opponent's move for the round that just finished."""
+
+
+class FrequencyStrategy(Strategy):
+    """Counter the opponent's most frequent move overall."""
+    name = 'frequency'
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
+        self.counts = [0, 0, 0]
+
+    def predict(self):
+        return _argmax(self.counts, 0, self.rng)
+
+    def observe(self, opponent_move):
+        self.counts[opponent_move] += 1
+
+
+class MarkovStrategy(Strategy):
+    """First-order Markov: counts[prev * 3 + next] transition table."""
+    name = 'markov'
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
+        self.counts = [0] * 9
+        self.last = None
+
+    def predict(self):
+        if self.last is None:
+            return None
+        return _argmax(self.counts, self.last * 3, self.rng)
+
+    def observe(self, opponent_move):
+        if self.last is not None:
+            self.counts[self.last * 3 + opponent_move] += 1
+        self.last = opponent_move
+
+
+class NGramStrategy(Strategy):
+    """Variable-order n-gram predictor with back-off to shorter contexts.
+
+    For every order k in 1..max_order there is a flat table of 3**k contexts x
+    3 next-move counts. The last k moves are kept as a rolling base-3 integer,
+    so an update touches max_order cells and prediction reads at most
+    max_order rows.
+    """
+    name = 'ngram'
+
+    def __init__(self, max_order=4, rng=None):
+        super().__init__(rng)
+        if max_order < 1:
+            raise ValueError('max_order must be at least 1')
+        self.max_order = max_order
+        self.tables = [[0] * (3 ** k * 3) for k in range(1, max_order + 1)]
+        self.context = 0  # last max_order moves, most recent in the lowest digit
+        self.seen = 0
+
+    def _ctx(self, k):
+        return self.context % (3 ** k)
+
+    def predict(self):
+        for k in range(min(self.seen, self.max_order), 0, -1):
+            guess = _argmax(self.tables[k - 1], self._ctx(k) * 3, self.rng)
+            if guess is not None:
+                return guess
+        return None
+
+    def observe(self, opponent_move):
+        for k in range(1, min(self.seen, self.max_order) + 1):
+            self.tables[k - 1][self._ctx(k) * 3 + opponent_move] += 1
+        self.context = (self.context * 3 + opponent_move) % (3 ** self.max_order)
+        self.seen += 1
+
+
+STRATEGIES = {
+    'random': Strategy,
+    'frequency': FrequencyStrategy,
+    'markov': MarkovStrategy,
+    'ngram': NGramStrategy,
+}
+
+
+def make_strategy(name, rng=None):
+    try:
+        cls = STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f'unknown strategy: {name!r}') from None
+    return cls(rng=rng)
@@ -0,0 +1,154 @@
+"""Procedural sound effects and battle music.
+
+Whole buffers are synthesized in one vectorized pass with NumPy when it is
+installed. Without it, one period of the waveform is computed sample by
+sample and then repeated with array multiplication, so the cost follows the
+period rather than the duration. Either way the buffer can be handed straight to
+pygame.mixer.Sound(buffer=...). Generated tracks are kept in a
+content-hashed WAV cache under data/audio_cache so later launches just load
+a file.
+"""
+import hashlib
+import json
+import math
+import os
+import wave
+from array import array
+from pathlib import Path
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; fall back to array('h')
+    np = None
+
+RATE = 44100
+# bump when the formulas change so stale cache entries are not reused
+SYNTH_VERSION = 1
+CACHE_DIR = Path(os.getenv('RPS_DATA_DIR') or Path(__file__).resolve().parents[2] / 'data') / 'audio_cache'
+
+
+def _tile(period, n):
+    """Repeat an array('h') period out to n samples."""
+    if len(period) >= n:
+        return period[:n]
+    out = period * (n // len(period) + 1)
+    del out[n:]
+    return out
+
+
+def sine(freq, duration, volume=0.5, rate=RATE):
+    """Mono 16-bit sine tone."""
+    amp = int(32767 * volume)
+    n = int(duration * rate)
+    if np is not None:
+        t = np.arange(n, dtype=np.float64) / rate
+        return np.trunc(amp * np.sin(2 * np.pi * freq * t)).astype(np.int16)
+    # a whole-number frequency repeats exactly every rate / gcd(rate, freq) samples
+    period = rate // math.gcd(rate, int(freq)) if freq == int(freq) and freq > 0 else n
+    w = 2 * math.pi * freq / rate
+    sin = math.sin
+    return _tile(array('h', [int(amp * sin(w * i)) for i in range(min(n, period))]), n)
+
+
+def battle_music(duration=6.0, rate=RATE):
+    """Short looping chiptune-style track: bass, wobbling lead and a square beat."""
+    amp = 26000
+    n = int(duration * rate)
+    half = rate // 2
+    if np is not None:
+        i = np.arange(n)
+        t = i / rate
+        bass = np.sin(2 * np.pi * 110 * t) * 0.55
+        lead = np.sin(2 * np.pi * 330 * t + np.sin(2 * np.pi * 2 * t) * 2.5) * 0.35
+        beat = np.where((i // half) % 2 == 0, 0.15, -0.15)
+        return np.clip(np.trunc(amp * (bass + lead + beat)), -32768, 32767).astype(np.int16)
+    sin = math.sin
+    two_pi = 2 * math.pi
+    # with an even rate the tones repeat every half second (55, 165 and 1
+    # cycles), so one beat (a +0.15 half then a -0.15 half) is the period
+    m = min(n, half) if rate % 2 == 0 else n
+    tone = [amp * (sin(two_pi * 110 * t) * 0.55 + sin(two_pi * 330 * t + sin(two_pi * 2 * t) * 2.5) * 0.35)
+            for t in (i / rate for i in range(m))]
+    if m == n:
+        return array('h', [max(-32768, min(32767, int(v + amp * (0.15 if (i // half) % 2 == 0 else -0.15))))
+                           for i, v in enumerate(tone)])
+    up, down = amp * 0.15, amp * -0.15
+    beat = array('h', [max(-32768, min(32767, int(v + up))) for v in tone])
+    beat.extend(max(-32768, min(32767, int(v + down))) for v in tone)
+    return _tile(beat, n)
+
+
+def pcm_bytes(samples, channels=1):
+    """Raw little-endian int16 PCM, duplicating the mono signal across `channels`."""
+    if np is not None and isinstance(samples, np.ndarray):
+        if channels > 1:
+            samples = np.repeat(samples[:, None], channels, axis=1)
+        return samples.astype('<i2').tobytes()
+    if channels > 1:
+        mono = samples
+        samples = array('h', bytes(2 * len(mono) * channels))
+        for c in range(channels):
+            samples[c::channels] = mono
+    if array('h', [1]).tobytes() != b'\x01\x00':  # big-endian host
+        samples = array('h', samples)
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def write_wav(path, samples, rate=RATE):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    with wave.open(str(tmp), 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(pcm_bytes(samples))
+    os.replace(tmp, path)
+    return path
+
+
+def cache_path(kind, rate=RATE, cache_dir=None, **params):
+    """Content-addressed cache file for a generator and its parameters."""
+    key = json.dumps({'kind': kind, 'rate': rate, 'v': SYNTH_VERSION, **params}, sort_keys=True)
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    return Path(cache_dir or CACHE_DIR) / f'{kind}-{digest}.wav'
+
+
+GENERATORS = {'sine': sine, 'battle_music': battle_music}
+
+
+def cached_wav(kind, rate=RATE, cache_dir=None, **params):
+    """Return a WAV path for the generated sound, synthesizing it on a cache miss."""
+    path = cache_path(kind, rate, cache_dir, **params)
+    if not path.exists():
+        write_wav(path, GENERATORS[kind](rate=rate, **params), rate)
+    return path
+
+
+def make_sound(kind, cache_dir=None, **params):
+    """Build a pygame Sound for a generated effect without a file round trip.
+
+    Cache hits load the stored WAV. On a miss the buffer is synthesized at
+    the mixer's rate, handed to Sound(buffer=...) directly and then written
+    to the cache for next time.
+    """
+    freq, size, channels = pygame.mixer.get_init()
+    path = cache_path(kind, freq, cache_dir, **params)
+    if path.exists():
+        return pygame.mixer.Sound(str(path))
+    samples = GENERATORS[kind](rate=freq, **params)
+    if size == -16:
+        sound = pygame.mixer.Sound(buffer=pcm_bytes(samples, channels))
+    else:
+        sound = None
+    try:
+        write_wav(path, samples, freq)
+    except OSError:
+        pass
+    if sound is None:
+        # mixer wants another sample format; let SDL convert from the file
+        sound = pygame.mixer.Sound(str(path))
+    return sound
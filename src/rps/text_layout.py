@@ -0,0 +1,100 @@
+"""Memoized word-wrap layout for multi-line overlay text.
+
+Line breaks are computed once per (text, font, max_width) from cached
+per-word widths instead of measuring a growing string word by word, and
+finished paragraphs are kept as pre-rendered surfaces so drawing one is a
+single blit.
+"""
+from collections import OrderedDict
+
+import pygame
+
+from rps.render_cache import render_text
+
+
+class TextLayout:
+    def __init__(self, maxsize=128, max_words=4096):
+        self.maxsize = maxsize
+        self.max_words = max_words
+        self._word_widths = {}
+        self._lines = OrderedDict()
+        self._blocks = OrderedDict()
+
+    def _width(self, font, word):
+        key = (font, word)
+        width = self._word_widths.get(key)
+        if width is None:
+            if len(self._word_widths) >= self.max_words:
+                self._word_widths.clear()
+            width = self._word_widths[key] = font.size(word)[0]
+        return width
+
+    def wrap(self, text, font, max_width):
+        """Split text into lines no wider than max_width (a single long word may overflow).
+
+        Widths are summed per word plus a space, which is exact for the
+        monospace fonts the UI uses and ignores kerning for others.
+        """
+        key = (text, font, max_width)
+        lines = self._lines.get(key)
+        if lines is not None:
+            self._lines.move_to_end(key)
+            return lines
+        space = self._width(font, ' ')
+        lines = []
+        current = []
+        current_w = 0
+        for word in text.split():
+            w = self._width(font, word)
+            test_w = w if not current else current_w + space + w
+            if test_w <= max_width:
+                current.append(word)
+                current_w = test_w
+            else:
+                if current:
+                    lines.append(' '.join(current))
+                current = [word]
+                current_w = w
+        if current:
+            lines.append(' '.join(current))
+        lines = tuple(lines)
+        self._remember(self._lines, key, lines)
+        return lines
+
+    def block(self, text, font, max_width, color, line_gap=6):
+        """Return (surface, line_count) with the wrapped lines centered horizontally.
+
+        Line i sits at i * (font.get_linesize() + line_gap) from the top.
+        The surface is None for empty text.
+        """
+        key = (text, font, max_width, tuple(color), line_gap)
+        cached = self._blocks.get(key)
+        if cached is not None:
+            self._blocks.move_to_end(key)
+            return cached
+        lines = self.wrap(text, font, max_width)
+        surf = None
+        if lines:
+            rendered = [render_text(font, ln, color) for ln in lines]
+            step = font.get_linesize() + line_gap
+            width = max(r.get_width() for r in rendered)
+            height = step * (len(rendered) - 1) + max(r.get_height() for r in rendered)
+            surf = pygame.Surface((width, height), pygame.SRCALPHA)
+            for i, r in enumerate(rendered):
+                surf.blit(r, (width // 2 - r.get_width() // 2, i * step))
+        cached = (surf, len(lines))
+        self._remember(self._blocks, key, cached)
+        return cached
+
+    def _remember(self, cache, key, value):
+        cache[key] = value
+        if len(cache) > self.maxsize:
+            cache.popitem(last=False)
+
+    def clear(self):
+        self._word_widths.clear()
+        self._lines.clear()
+        self._blocks.clear()
+
+
+text_layout = TextLayout()
@@ -0,0 +1,141 @@
+"""Round-robin tournament between computer strategies with Elo ratings.
+
+Run from the repo root with `python -m rps.tournament` (PYTHONPATH=src).
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rps.logic import decide
+from rps.match import MatchState
+from rps.strategies import STRATEGIES, make_strategy
+
+# A match that runs this long without either side reaching the goal (two
+# deterministic predictors can lock into endless ties) is scored as a draw.
+MAX_ROUNDS_PER_MATCH = 1000
+
+
+def play_match(strat_a, strat_b, best_of_goal=3, max_rounds=MAX_ROUNDS_PER_MATCH):
+    """Play one race-to-`best_of_goal` match. Returns 1.0, 0.0 or 0.5 for a draw."""
+    match = MatchState(best_of_goal)
+    for _ in range(max_rounds):
+        move_a = strat_a.choose()
+        move_b = strat_b.choose()
+        strat_a.observe(move_b)
+        strat_b.observe(move_a)
+        winner = match.record_round(decide(move_a, move_b))
+        if winner:
+            return 1.0 if winner == 'player' else 0.0
+    match.abandon_match()
+    return 0.5
+
+
+def play_pairing(name_a, name_b, n_matches, best_of_goal, seed):
+    """Play `n_matches` between two strategies; returns (a, b, scores)."""
+    rng = random.Random(seed)
+    strat_a = make_strategy(name_a, rng=random.Random(rng.getrandbits(64)))
+    strat_b = make_strategy(name_b, rng=random.Random(rng.getrandbits(64)))
+    scores = [play_match(strat_a, strat_b, best_of_goal) for _ in range(n_matches)]
+    return name_a, name_b, scores
+
+
+def expected_score(rating_a, rating_b):
+    return 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / 400.0))
+
+
+def run_tournament(names=None, n_matches=100, best_of_goal=3, workers=None,
+                   seed=None, k_factor=16, initial_rating=1500.0):
+    """Play every pairing of `names` and rate the strategies.
+
+    Pairings run in a process pool; Elo is then applied match by match in a
+    fixed pairing order so results are reproducible for a given seed.
+    Returns {'ratings': {name: elo}, 'matrix': {a: {b: a's win rate vs b}},
+    'records': {name: [wins, losses, draws]}}.
+    """
+    names = list(names or STRATEGIES)
+    for name in names:
+        if name not in STRATEGIES:
+            raise ValueError(f'unknown strategy: {name!r}')
+    if len(names) < 2:
+        raise ValueError('a tournament needs at least two strategies')
+    rng = random.Random(seed)
+    pairings = [(a, b, n_matches, best_of_goal, rng.getrandbits(64))
+                for a, b in itertools.combinations(names, 2)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [play_pairing(*args) for args in pairings]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pairings))) as pool:
+            results = list(pool.map(play_pairing, *zip(*pairings)))
+
+    ratings = {name: initial_rating for name in names}
+    matrix = {a: {b: None for b in names if b != a} for a in names}
+    records = {name: [0, 0, 0] for name in names}
+    for a, b, scores in results:
+        for score in scores:
+            exp_a = expected_score(ratings[a], ratings[b])
+            ratings[a] += k_factor * (score - exp_a)
+            ratings[b] += k_factor * ((1.0 - score) - (1.0 - exp_a))
+            if score == 1.0:
+                records[a][0] += 1
+                records[b][1] += 1
+            elif score == 0.0:
+                records[a][1] += 1
+                records[b][0] += 1
+            else:
+                records[a][2] += 1
+                records[b][2] += 1
+        rate = sum(scores) / len(scores) if scores else 0.0
+        matrix[a][b] = rate
+        matrix[b][a] = 1.0 - rate
+    return {'ratings': ratings, 'matrix': matrix, 'records': records}
+
+
+def format_report(result):
+    ratings = result['ratings']
+    order = sorted(ratings, key=ratings.get, reverse=True)
+    width = max(len(n) for n in order)
+    lines = [f"{'#':>2}  {'strategy':<{width}}  {'elo':>7}  {'W':>5} {'L':>5} {'D':>5}"]
+    for i, name in enumerate(order, 1):
+        w, l, d = result['records'][name]
+        lines.append(f'{i:>2}  {name:<{width}}  {ratings[name]:7.1f}  {w:5d} {l:5d} {d:5d}')
+    lines.append('')
+    lines.append('Win rate (row vs column)')
+    lines.append(' ' * width + ''.join(f'  {n[:8]:>8}' for n in order))
+    for a in order:
+        cells = ''.join(
+            f"  {'-':>8}" if a == b else f'  {result["matrix"][a][b]:8.2f}' for b in order
+        )
+        lines.append(f'{a:<{width}}{cells}')
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Round-robin tournament between computer strategies.')
+    parser.add_argument('strategies', nargs='*', help=f"strategies to enter (default: {' '.join(STRATEGIES)})")
+    parser.add_argument('-n', '--matches', type=int, default=200, help='matches per pairing')
+    parser.add_argument('--best-of', type=int, default=3, help='round wins needed to take a match')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        result = run_tournament(args.strategies or None, args.matches, args.best_of,
+                                args.workers, args.seed)
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(format_report(result))
+
+
+if __name__ == '__main__':
+    main()
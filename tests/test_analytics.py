@@ -0,0 +1,138 @@
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pytest
+
+from rps import analytics, replay
+from rps.analytics import analyze_file, run_lengths
+from rps.replay import HEADER, RECORD, ReplayWriter
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run a test on the vectorized path and on the pure-Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy", reason="NumPy path: numpy is not installed")
+    else:
+        monkeypatch.setattr(analytics, "np", None)
+        monkeypatch.setattr(replay, "np", None)
+    return request.param
+
+
+def write_log(path, matches, start=0.0):
+    """matches: list of lists of (player, computer, outcome) rounds."""
+    clock = [start]
+    with ReplayWriter(path, clock=lambda: clock[0]) as writer:
+        for rounds in matches:
+            for p, c, o in rounds:
+                writer.record(p, c, o)
+                clock[0] += 600  # ten minutes per round
+            writer.end_match()
+
+
+def random_matches(rng, n):
+    matches = []
+    for _ in range(n):
+        rounds = []
+        for _ in range(rng.randint(1, 7)):
+            p, c = rng.randrange(3), rng.randrange(3)
+            rounds.append((p, c, (p - c) % 3))
+        matches.append(rounds)
+    return matches
+
+
+def test_run_lengths():
+    assert run_lengths([1, 1, 0, 2, 2, 2]) == ([1, 0, 2], [2, 1, 3], [0, 2, 3])
+    assert run_lengths([]) == ([], [], [])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1 << 16])
+def test_stats_match_a_round_by_round_count(tmp_path, chunk_size, backend):
+    rng = random.Random(5)
+    matches = random_matches(rng, 60)
+    path = tmp_path / "ash.rpsr"
+    write_log(path, matches)
+
+    outcomes = [o for rounds in matches for _, _, o in rounds]
+    streaks = Counter()
+    run = 0
+    for o in outcomes + [0]:
+        if o == 1:
+            run += 1
+        elif run:
+            streaks[run] += 1
+            run = 0
+    won = lost = best = current = 0
+    for rounds in matches:
+        w = sum(o == 1 for _, _, o in rounds)
+        l = sum(o == 2 for _, _, o in rounds)
+        if w > l:
+            won += 1
+            current += 1
+            best = max(best, current)
+        elif l > w:
+            lost += 1
+            current = 0
+
+    stats = analyze_file(path, chunk_size, utc_offset=0)
+    assert stats.name == "ash"
+    assert stats.rounds == len(outcomes)
+    assert stats.outcomes == [outcomes.count(i) for i in range(3)]
+    assert stats.player_moves == [sum(p == i for r in matches for p, _, _ in r) for i in range(3)]
+    assert stats.win_streaks == streaks
+    assert stats.match_lengths == Counter(len(r) for r in matches)
+    assert (stats.matches_won, stats.matches_lost, stats.best_streak) == (won, lost, best)
+    assert sum(stats.hours) == len(outcomes)
+
+
+def test_hours_of_day(tmp_path, backend):
+    path = tmp_path / "bo.rpsr"
+    # 6 rounds, ten minutes apart, from 23:30 UTC: three before midnight
+    write_log(path, [[(0, 2, 1)] * 6], start=23.5 * 3600)
+    stats = analyze_file(path, utc_offset=0)
+    assert stats.hours[23] == 3 and stats.hours[0] == 3
+
+
+def test_corrupt_fields_are_skipped(tmp_path, backend):
+    path = tmp_path / "dee.rpsr"
+    write_log(path, [[(0, 2, 1), (1, 0, 1), (2, 1, 1)]])
+    data = bytearray(path.read_bytes())
+    ticks, packed = RECORD.unpack_from(data, HEADER.size + RECORD.size)
+    RECORD.pack_into(data, HEADER.size + RECORD.size, ticks, packed | 3)  # outcome field = 3
+    path.write_bytes(bytes(data))
+    stats = analyze_file(path, utc_offset=0)
+    assert (stats.rounds, stats.invalid) == (2, 1)
+    assert stats.outcomes == [0, 2, 0]
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset to switch zones")
+def test_hours_follow_a_dst_change_inside_one_window(tmp_path, monkeypatch, backend):
+    monkeypatch.setenv("TZ", "EST5EDT,M3.2.0,M11.1.0")
+    time.tzset()
+    analytics.utc_offset_at.cache_clear()
+    try:
+        path = tmp_path / "eve.rpsr"
+        # 06:30-07:30 UTC on 2026-03-08, ten minutes apart: 01:30-01:50 EST, then 03:00-03:30 EDT
+        write_log(path, [[(0, 2, 1)] * 7], start=1772951400.0)
+        stats = analyze_file(path)
+        assert (stats.hours[1], stats.hours[2], stats.hours[3]) == (3, 0, 4)
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+        analytics.utc_offset_at.cache_clear()
+
+
+def test_report_command(tmp_path, capsys):
+    write_log(tmp_path / "cy.rpsr", random_matches(random.Random(1), 5))
+    assert analytics.main(["report", "--dir", str(tmp_path), "--utc", "--chunk-size", "4"]) == 0
+    out = capsys.readouterr().out
+    assert out.splitlines()[0].startswith("player")
+    assert "cy" in out and "rounds per match" in out
@@ -0,0 +1,83 @@
+import io
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pytest
+
+from rps import asset_bundle
+from rps.asset_bundle import ALIGN, AssetBundle, open_bundle, write_bundle
+
+FMT = (44100, -16, 2)
+
+
+def test_round_trip_with_aligned_payloads(tmp_path):
+    payloads = {"click": b"\x01\x02" * 10, "music": bytes(range(256)) * 40}
+    path = write_bundle(tmp_path / "audio.rpsb", FMT, payloads)
+    bundle = AssetBundle(path)
+    try:
+        assert bundle.format == FMT
+        assert set(bundle.index) == {"click", "music"}
+        for name, data in payloads.items():
+            offset, length = bundle.index[name]
+            assert offset % ALIGN == 0
+            with bundle.payload(name) as view:
+                assert bytes(view) == data
+    finally:
+        bundle.close()
+
+
+def test_open_bundle_rejects_mismatch_and_garbage(tmp_path):
+    path = write_bundle(tmp_path / "audio.rpsb", FMT, {"click": b"\0\0"})
+    assert open_bundle(tmp_path / "missing.rpsb") is None
+    assert open_bundle(path, mixer_format=(22050, -16, 2)) is None
+    bundle = open_bundle(path, mixer_format=list(FMT))
+    assert bundle is not None
+    bundle.close()
+    bad = tmp_path / "bad.rpsb"
+    bad.write_bytes(b"RIFF" + bytes(64))
+    assert open_bundle(bad) is None
+
+
+def test_find_music_prefers_lotr_mp3(tmp_path):
+    assert asset_bundle.find_music(tmp_path) is None
+    (tmp_path / "bg_battle.wav").write_bytes(b"")
+    assert asset_bundle.find_music(tmp_path).name == "bg_battle.wav"
+    (tmp_path / "The_LOTR_Theme.mp3").write_bytes(b"")
+    assert asset_bundle.find_music(tmp_path).name == "The_LOTR_Theme.mp3"
+
+
+def test_write_bundle_rejects_long_names(tmp_path):
+    with pytest.raises(ValueError):
+        write_bundle(tmp_path / "audio.rpsb", FMT, {"x" * 40: b""})
+
+
+def test_music_stays_in_its_file_encoding(tmp_path):
+    track = b"ID3\x04" + bytes(range(256)) * 8  # stands in for an MP3
+    path = write_bundle(tmp_path / "audio.rpsb", FMT, {"click": b"\0\0", "music.mp3": track})
+    bundle = AssetBundle(path)
+    fileobj, namehint = bundle.music()
+    bundle.close()  # the file object no longer depends on the map
+    assert namehint == "mp3"
+    assert fileobj.read() == track
+    assert fileobj.seek(-4, io.SEEK_END) == len(track) - 4
+    assert fileobj.read(100) == track[-4:]  # stops at the end of the entry
+    fileobj.close()
+
+
+def test_build_packs_the_music_file_as_is(tmp_path, monkeypatch):
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    wav = asset_bundle.synth.write_wav(tmp_path / "bg_battle.wav", asset_bundle.synth.sine(220.0, 0.05))
+    path = asset_bundle.build(tmp_path / "audio.rpsb", asset_dir=tmp_path)
+    bundle = AssetBundle(path)
+    try:
+        assert bundle.music_entry() == "music.wav"
+        with bundle.payload("music.wav") as view:
+            assert bytes(view) == wav.read_bytes()
+        assert set(asset_bundle.SFX) <= set(bundle.index)
+    finally:
+        bundle.close()
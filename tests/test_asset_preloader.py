@@ -0,0 +1,46 @@
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rps.asset_preloader import AssetPreloader
+
+
+def test_results_arrive_in_background():
+    gate = threading.Event()
+    assets = AssetPreloader()
+    assets.add("slow", lambda: gate.wait(5) and "ready")
+    assets.start()
+    assert assets.get("slow") is None
+    assert not assets.ready("slow")
+    gate.set()
+    assert assets.wait(5)
+    assert assets.get("slow") == "ready"
+
+
+def test_failed_job_does_not_stop_the_rest():
+    def boom():
+        raise OSError("missing file")
+
+    assets = AssetPreloader().add("bad", boom).add("good", str, 7).start()
+    assert assets.wait(5)
+    assert assets.ready("bad") and assets.get("bad", "fallback") == "fallback"
+    assert isinstance(assets.errors["bad"], OSError)
+    assert assets.get("good") == "7"
+
+
+def test_cancel_skips_jobs_not_yet_started():
+    gate = threading.Event()
+    ran = []
+    assets = AssetPreloader()
+    assets.add("first", lambda: gate.wait(5) and ran.append("first"))
+    assets.add("second", lambda: ran.append("second"))
+    assets.start()
+    assets.cancel()
+    gate.set()
+    assert assets.wait(5)
+    assert ran == ["first"] and not assets.ready("second")
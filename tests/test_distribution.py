@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pytest
+
+from rps.distribution import STREAK_BINS, Distribution, Histogram
+
+
+def test_histogram_top_fraction_and_quantile():
+    hist = Histogram(8)
+    for value in [0, 0, 0, 1, 1, 2, 5, 7, 40]:
+        hist.add(value)
+    assert hist.total == 9
+    assert hist.top_fraction(5) == pytest.approx(3 / 9)
+    assert hist.top_fraction(100) == pytest.approx(2 / 9)  # 7 and 40 share the open last bin
+    assert hist.quantile(0.5) == 1
+    hist.remove(0)
+    assert hist.top_fraction(0) == 1.0 and hist.total == 8
+
+
+def test_histograms_merge_only_with_same_buckets():
+    a = Histogram(4, counts=[1, 2])
+    b = Histogram(4, counts=[0, 1, 0, 3])
+    assert a.merge(b).counts == [1, 3, 0, 3]
+    with pytest.raises(ValueError):
+        a.merge(Histogram(5))
+
+
+def test_payload_round_trip_trims_trailing_zeros():
+    dist = Distribution()
+    for streak in (0, 1, 1, 3):
+        dist.update_player(None, {"best_streak": streak, "matches_won": streak, "matches_lost": 1})
+    payload = dist.to_payload()
+    assert payload["total"] == 4
+    assert payload["best_streak"]["counts"] == [1, 2, 0, 1]
+    again = Distribution.from_payload(payload)
+    assert again.best_streak.counts == dist.best_streak.counts
+    assert len(again.best_streak.counts) == STREAK_BINS
+    assert Distribution.from_payload({"best_streak": []}) is None
+
+
+def test_top_percent_moves_with_player_updates():
+    dist = Distribution()
+    for i in range(99):
+        dist.update_player(None, {"best_streak": i % 5, "matches_won": 1, "matches_lost": 1})
+    me = {"best_streak": 9, "matches_won": 9, "matches_lost": 0}
+    dist.update_player(None, me)
+    assert dist.top_percent(me) == 1
+    worse = {"best_streak": 0, "matches_won": 0, "matches_lost": 9}
+    version = dist.version
+    dist.update_player(me, worse)
+    assert dist.version > version
+    assert dist.total == 100
+    assert dist.top_percent(worse) > 50
@@ -0,0 +1,33 @@
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rps.frame_profiler import FrameProfiler
+
+
+def test_ring_buffer_percentiles_and_export(tmp_path):
+    profiler = FrameProfiler(capacity=100)
+    for i in range(200):
+        profiler.add("draw", i / 1000.0)
+    summary = profiler.summary()
+    assert summary["draw"]["samples"] == 100  # oldest samples rolled off
+    assert summary["draw"]["p50_ms"] == 150.0
+    assert summary["draw"]["p99_ms"] == 198.0
+    assert summary["network"]["samples"] == 0
+
+    out = profiler.export(tmp_path / "metrics.json")
+    assert json.loads(out.read_text())["draw"]["p95_ms"] == 194.0
+    csv_text = profiler.export(tmp_path / "metrics.csv").read_text()
+    assert csv_text.splitlines()[0] == "phase,samples,p50_ms,p95_ms,p99_ms"
+
+
+def test_from_env(monkeypatch, tmp_path):
+    monkeypatch.delenv("RPS_PROFILE", raising=False)
+    assert FrameProfiler.from_env(tmp_path) is None
+    monkeypatch.setenv("RPS_PROFILE", "1")
+    assert FrameProfiler.from_env(tmp_path).export_path == tmp_path / "frame_metrics.json"
@@ -0,0 +1,137 @@
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rps.leaderboard import LeaderboardIndex, LeaderboardPager, sort_key
+
+
+def rec(name, streak, won=0, lost=0, **extra):
+    return dict(name=name, best_streak=streak, matches_won=won, matches_lost=lost, **extra)
+
+
+def test_orders_by_streak_then_win_pct_then_name():
+    board = LeaderboardIndex([
+        rec("cy", 3, 1, 1),
+        rec("Ash", 5),
+        rec("bo", 3, 3, 1),
+        rec("al", 3, 1, 1),
+    ])
+    assert [r["name"] for r in board.top(10)] == ["ash", "bo", "al", "cy"]
+    assert board.rank("ASH ") == 0
+    assert board.rank("cy") == 3
+    assert board.rank("nobody") is None
+    assert board.position(rec("new", 4)) == 1
+
+
+def test_update_moves_player_and_bumps_version():
+    board = LeaderboardIndex([rec("ash", 5), rec("bo", 3), rec("cy", 1)])
+    version = board.version
+    assert not board.update(rec("cy", 1))
+    assert board.version == version
+    assert board.update(rec("cy", 9, win_pct=50))
+    assert board.rank("cy") == 0 and board.rank("ash") == 1
+    assert len(board) == 3
+    board.remove("ash")
+    assert board.rank("bo") == 1 and "ash" not in board
+
+
+def test_replace_drops_players_who_left_the_window():
+    board = LeaderboardIndex([rec("ash", 5), rec("bo", 3), rec("cy", 1), rec("me", 0)])
+    assert board.replace([rec("bo", 7), rec("dee", 6)], keep=("ME",))
+    assert [r["name"] for r in board.top(10)] == ["bo", "dee", "me"]
+    assert "ash" not in board and board.rank("me") == 2
+    version = board.version
+    assert not board.replace([rec("bo", 7), rec("dee", 6)], keep=("me",))
+    assert board.version == version
+
+
+def test_around_window_clamps_at_the_top():
+    board = LeaderboardIndex(rec(f"p{i}", 100 - i) for i in range(20))
+    start, window = board.around("p1", radius=2)
+    assert start == 0 and [r["name"] for r in window] == ["p0", "p1", "p2", "p3"]
+    start, window = board.around("p10", radius=1)
+    assert start == 9 and [r["name"] for r in window] == ["p9", "p10", "p11"]
+    assert board.around("missing") == (None, [])
+
+
+def test_matches_full_sort_after_random_updates():
+    rng = random.Random(3)
+    board = LeaderboardIndex()
+    latest = {}
+    for _ in range(2000):
+        r = rec(f"p{rng.randrange(300)}", rng.randrange(12), rng.randrange(20), rng.randrange(20))
+        board.update(r)
+        latest[r["name"]] = r
+    expected = sorted(latest.values(), key=sort_key)
+    assert board.top(len(expected)) == expected
+    assert all(board.rank(r["name"]) == i for i, r in enumerate(expected))
+    # a large batch takes the re-sort path and must agree with incremental updates
+    assert LeaderboardIndex(latest.values()).top(len(expected)) == expected
+
+
+def test_pager_prefetches_and_bounds_pages():
+    board = [rec(f"p{i}", 100 - i) for i in range(95)]
+    queued = []
+    pager = LeaderboardPager(lambda offset, limit: board[offset:offset + limit],
+                             lambda fn, *args: queued.append((fn, args)), page_size=10, max_pages=3)
+
+    def run_jobs():
+        while queued:
+            fn, args = queued.pop(0)
+            pager.receive(fn(*args))
+
+    assert pager.rows(5) == [(i, None) for i in range(5)]
+    assert sorted(args[0] for _, args in queued) == [0, 1]  # visible page plus the next one
+    run_jobs()
+    assert [r["name"] for _, r in pager.rows(5)] == ["p0", "p1", "p2", "p3", "p4"]
+    for _ in range(12):
+        pager.scroll(8, 8)
+        pager.rows(8)
+        run_jobs()
+        assert len(pager.pages) <= 3
+    assert pager.total == 95 and pager.top == 87
+    assert [rank for rank, _ in pager.rows(8)] == list(range(87, 95))
+    assert all(r is not None for _, r in pager.rows(8))
+
+
+def test_pager_drops_pages_fetched_before_reset_and_backs_off_errors():
+    queued = []
+    pager = LeaderboardPager(lambda offset, limit: None,
+                             lambda fn, *args: queued.append((fn, args)), page_size=10)
+    pager.rows(5)
+    stale = [fn(*args) for fn, args in queued]
+    queued.clear()
+    pager.reset()
+    pager.receive((0, stale[0][1], [rec("old", 1)]))
+    assert not pager.pages
+    pager.rows(5)
+    for fn, args in queued:
+        pager.receive(fn(*args))  # fetch fails
+    queued.clear()
+    pager.rows(5)
+    assert not queued  # failed pages wait for the view to move
+    pager.scroll(1, 5)
+    pager.rows(5)
+    assert queued
+
+
+def test_pager_stops_when_backend_ignores_offset():
+    board = [rec(f"p{i}", 100 - i) for i in range(95)]
+    queued = []
+    pager = LeaderboardPager(lambda offset, limit: board[:limit],  # offset dropped
+                             lambda fn, *args: queued.append((fn, args)), page_size=10)
+    pager.rows(5)
+    while queued:
+        fn, args = queued.pop(0)
+        pager.receive(fn(*args))
+    assert pager.offset_ignored
+    assert list(pager.pages) == [0] and pager.total == 10
+    pager.scroll(30, 5)
+    assert pager.top == 5
+    assert [r["name"] for _, r in pager.rows(5)] == ["p5", "p6", "p7", "p8", "p9"]
+    assert not queued
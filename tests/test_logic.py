@@ -6,7 +6,7 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from rps.logic import get_computer_move, winner_decider
+from rps.logic import Move, Outcome, decide, decide_many, get_computer_move, move_id, move_name, winner_decider
 
 moves = ['rock', 'paper', 'scissors']
 def test_get_computer_move():
@@ -26,7 +26,25 @@ def test_winner_decider ():
     assert winner_decider("rock", "paper") == "computer"
     assert winner_decider("paper", "scissors") == "computer"
     print("winner_decider() passed.")
+def test_decide_int_moves():
+    assert decide(Move.ROCK, Move.ROCK) == Outcome.TIE
+    assert decide(Move.PAPER, Move.ROCK) == Outcome.PLAYER
+    assert decide(Move.SCISSORS, Move.PAPER) == Outcome.PLAYER
+    assert decide(Move.ROCK, Move.SCISSORS) == Outcome.PLAYER
+    assert decide(Move.ROCK, Move.PAPER) == Outcome.COMPUTER
+    for name in moves:
+        assert move_name(move_id(name)) == name
+    print("decide() passed.")
+def test_decide_many():
+    players = [0, 1, 2, 0, 2]
+    computers = [0, 0, 0, 1, 1]
+    outcomes, counts = decide_many(players, computers)
+    assert list(outcomes) == [decide(p, c) for p, c in zip(players, computers)]
+    assert counts == {"tie": 1, "player": 2, "computer": 2}
+    print("decide_many() passed.")
 if __name__ == "__main__":
     test_get_computer_move()
     test_winner_decider()
+    test_decide_int_moves()
+    test_decide_many()
     print("All tests passed.")
@@ -0,0 +1,38 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rps.match import MatchState, simulate_matches
+
+
+def test_match_state_race_to_goal():
+    state = MatchState(best_of_goal=2)
+    assert state.record_round("player") is None
+    assert state.record_round("tie") is None
+    assert state.record_round("computer") is None
+    assert state.games == 3 and state.in_progress
+    assert state.record_round("player") == "player"
+    assert state.matches_won == 1 and state.win_streak == 1 and state.best_streak == 1
+    assert state.player_score == state.computer_score == state.games == 0
+    assert not state.in_progress
+
+
+def test_match_state_loss_resets_streak():
+    state = MatchState(best_of_goal=1, best_streak=4)
+    assert state.record_round("player") == "player"
+    assert state.record_round("computer") == "computer"
+    assert state.win_streak == 0 and state.best_streak == 4
+    assert state.matches_lost == 1
+
+
+def test_simulate_matches_inline():
+    stats = simulate_matches(2000, best_of_goal=3, workers=1, chunk_size=500, seed=7)
+    assert stats["matches"] == 2000
+    assert sum(stats["rounds_per_match"].values()) == 2000
+    assert min(stats["rounds_per_match"]) >= 3
+    assert 0.4 < stats["match_win_rate"] < 0.6
+    assert stats["best_streak"] == max(stats["streak_lengths"])
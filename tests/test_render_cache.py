@@ -0,0 +1,76 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rps.render_cache import OverlayCache, TextCache
+from rps.text_layout import TextLayout
+
+
+class FakeFont:
+    def __init__(self):
+        self.calls = 0
+
+    def render(self, text, antialias, color):
+        self.calls += 1
+        return (text, antialias, tuple(color))
+
+
+def test_text_cache_hits_and_eviction():
+    font = FakeFont()
+    cache = TextCache(maxsize=2)
+    first = cache.render(font, "ROCK", True, (0, 0, 0))
+    assert cache.render(font, "ROCK", True, [0, 0, 0]) is first
+    cache.render(font, "PAPER", True, (0, 0, 0))
+    cache.render(font, "ROCK", True, (0, 0, 0))
+    cache.render(font, "SCISSORS", True, (0, 0, 0))  # evicts PAPER
+    cache.render(font, "PAPER", True, (0, 0, 0))
+    assert font.calls == 4
+    assert cache.stats() == {"hits": 2, "misses": 4, "size": 2}
+
+
+def test_overlay_cache_hits_and_invalidation():
+    cache = OverlayCache(maxsize=2)
+    panel = (10, 10, 60, 40)
+    first = cache.layer((100, 80), (0, 0, 0, 160), panel, (20, 20, 40))
+    assert cache.layer([100, 80], [0, 0, 0, 160], list(panel), [20, 20, 40]) is first
+    assert first.get_size() == (100, 80)
+    assert first.get_at((0, 0)) == (0, 0, 0, 160)
+    assert first.get_at((30, 30))[:3] == (20, 20, 40)
+    # anything that changes the pixels is a different layer
+    bordered = cache.layer((100, 80), (0, 0, 0, 160), panel, (20, 20, 40), border=((255, 0, 0), 2))
+    assert bordered is not first
+    assert bordered.get_at((10, 30))[:3] == (255, 0, 0)
+    cache.layer((100, 80), (0, 0, 0, 200), panel, (20, 20, 40))  # evicts `first`
+    assert len(cache) == 2
+    assert cache.layer((100, 80), (0, 0, 0, 160), panel, (20, 20, 40)) is not first
+    cache.clear()
+    assert len(cache) == 0
+
+
+class MonoFont:
+    """Every character is 10px wide."""
+
+    def __init__(self):
+        self.size_calls = 0
+
+    def size(self, text):
+        self.size_calls += 1
+        return (10 * len(text), 20)
+
+
+def test_text_layout_wraps_and_memoizes():
+    font = MonoFont()
+    layout = TextLayout()
+    text = "Play with keys R / P / S or click the icons."
+    lines = layout.wrap(text, font, 120)
+    assert all(len(ln) * 10 <= 120 for ln in lines)
+    assert " ".join(lines) == " ".join(text.split())
+    calls = font.size_calls
+    assert layout.wrap(text, font, 120) is lines
+    layout.wrap("click the mouse", font, 60)
+    assert font.size_calls == calls + 1  # only "mouse" is new
+    assert layout.wrap("", font, 120) == ()
@@ -0,0 +1,108 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pytest
+
+from rps import replay
+from rps.replay import RECORD, ReplayReader, ReplayWriter, decode, replay_path
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_round_trip_and_match_ids_continue_across_sessions(tmp_path):
+    clock = Clock()
+    path = tmp_path / "ash.rpsr"
+    with ReplayWriter(path, clock=clock) as writer:
+        writer.record("rock", "scissors", "player")
+        clock.now += 2.5
+        writer.record("paper", "scissors", "computer")
+        writer.end_match()
+        clock.now += 1
+        writer.record("scissors", "scissors", "tie")
+    assert path.stat().st_size == replay.HEADER.size + 3 * RECORD.size
+    with ReplayWriter(path, clock=clock) as writer:
+        assert writer.match_id == 2
+        writer.record(0, 1, 2)
+
+    with ReplayReader(path) as reader:
+        rounds = list(reader)
+    assert [(r.player, r.computer, r.outcome, r.match) for r in rounds] == [
+        (0, 2, 1, 0), (1, 2, 2, 0), (2, 2, 0, 1), (0, 1, 2, 2)]
+    assert rounds[0].time == pytest.approx(1_000_000.0)
+    assert rounds[1].time == pytest.approx(1_000_002.5)
+
+
+def test_rounds_are_buffered_until_flush(tmp_path):
+    path = tmp_path / "bo.rpsr"
+    writer = ReplayWriter(path, flush_every=3)
+    writer.record("rock", "rock", "tie")
+    writer.record("rock", "rock", "tie")
+    assert len(ReplayReader(path)) == 0
+    writer.record("rock", "rock", "tie")
+    assert len(ReplayReader(path)) == 3
+    writer.close()
+
+
+def test_torn_record_is_ignored_then_truncated(tmp_path):
+    path = tmp_path / "cy.rpsr"
+    with ReplayWriter(path) as writer:
+        writer.record("rock", "paper", "computer")
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")  # crash mid-append
+    assert len(ReplayReader(path)) == 1
+    with ReplayWriter(path) as writer:
+        writer.record("paper", "rock", "player")
+    with ReplayReader(path) as reader:
+        cols = decode(reader.records())
+        assert list(cols["outcome"]) == [2, 1]
+        assert list(cols["match"]) == [0, 1]
+
+
+def test_numpy_records_are_views_of_the_file(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "dee.rpsr"
+    with ReplayWriter(path) as writer:
+        for _ in range(10):
+            writer.record("paper", "rock", "player")
+    reader = ReplayReader(path)
+    words = reader.records(2, 5)
+    assert words.shape == (3, 2) and words.dtype == np.dtype("<u4")
+    assert not words.flags.owndata
+    assert list(decode(words)["player"]) == [1, 1, 1]
+    del words
+    reader.close()
+
+
+def test_replay_path_sanitizes_names(tmp_path):
+    assert replay_path(" Ash Ketchum! ", tmp_path).name == "ash_ketchum.rpsr"
+    assert replay_path("../..", tmp_path).name == "player.rpsr"
+
+
+def test_cli_keeps_rounds_when_input_ends(tmp_path, monkeypatch):
+    from rps import cli
+
+    answers = iter(["tester", "", "rock", "paper"])
+
+    def fake_input(prompt=""):
+        try:
+            return next(answers)
+        except StopIteration:
+            raise EOFError from None
+
+    monkeypatch.setattr(replay, "REPLAY_DIR", tmp_path)
+    monkeypatch.setattr("builtins.input", fake_input)
+    with pytest.raises(EOFError):
+        cli.main()
+    with ReplayReader(replay_path("TESTER", tmp_path)) as reader:
+        assert len(reader) == 2
@@ -0,0 +1,134 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pytest
+
+from rps import score_journal
+from rps.score_journal import ScoreJournal, load_scores
+
+
+def _journal(tmp_path, sink):
+    return ScoreJournal(tmp_path / "journal.jsonl", tmp_path / "scores.json", sink=sink).open()
+
+
+def test_append_dedupes_and_drains(tmp_path):
+    sent = []
+
+    def sink(records):
+        sent.extend(records)
+        return [dict(r) for r in records]
+
+    journal = _journal(tmp_path, sink)
+    assert journal.append("ash", 1, 0, 1) is not None
+    assert journal.append("ash", 1, 0, 1) is None
+    journal.append("ash", 2, 0, 2)
+    journal.append("bo", 0, 1, 0)
+    assert [r["name"] for r in journal.pending()] == ["ash", "bo"]
+    saved = journal.drain()
+    assert saved["ash"]["matches_won"] == 2
+    assert journal.pending() == []
+    assert len(sent) == 2
+    journal.close()
+
+
+def test_unacked_records_survive_restart(tmp_path):
+    journal = _journal(tmp_path, lambda records: [None] * len(records))
+    journal.append("ash", 1, 0, 1)
+    journal.append("ash", 3, 1, 2)
+    assert journal.drain() == {}
+    journal.close()
+
+    with open(tmp_path / "journal.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"name": "torn')  # crash mid-write
+
+    reopened = _journal(tmp_path, lambda records: [dict(r) for r in records])
+    pending = reopened.pending()
+    assert [(r["name"], r["matches_won"]) for r in pending] == [("ash", 3)]
+    assert load_scores(tmp_path / "scores.json")["ash"]["best_streak"] == 2
+    assert reopened.append("ash", 4, 1, 3)["seq"] > pending[0]["seq"]
+    reopened.drain()
+    reopened.close()
+
+    # compaction drops acknowledged records
+    compacted = _journal(tmp_path, None)
+    assert compacted.pending() == []
+    compacted.close()
+
+
+def test_saved_row_survives_a_concurrent_drain(tmp_path):
+    journal = _journal(tmp_path, lambda records: [dict(r, win_pct=50.0) for r in records])
+    rec = journal.append("ash", 1, 1, 1)
+    journal.drain()  # e.g. the flusher thread got there first
+    assert journal.drain() == {}
+    assert journal.saved("ash", rec["seq"])["win_pct"] == 50.0
+    newer = journal.append("ash", 2, 1, 1)
+    assert journal.saved("ash", newer["seq"]) is None  # not sent yet
+    journal.drain()
+    assert journal.saved("ash", rec["seq"])["matches_won"] == 2  # superseded by the newer row
+    journal.close()
+
+
+@pytest.mark.skipif(score_journal.fcntl is None, reason="journal locking needs fcntl")
+def test_no_compaction_while_another_instance_appends(tmp_path):
+    first = _journal(tmp_path, lambda records: list(records))
+    first.append("ash", 1, 0, 1)
+    first.drain()  # acked: a compaction would drop it
+    second = _journal(tmp_path, None)
+    first.append("bo", 0, 1, 0)
+    first.sync()
+    # the file was not replaced under `first`, so both of its records are still there
+    assert [r["name"] for r in second._read()[0]] == ["ash", "bo"]
+    first.close()
+    second.close()
+
+    compacted = _journal(tmp_path, None)
+    assert [r["name"] for r in compacted.pending()] == ["bo"]
+    assert [r["name"] for r in compacted._read()[0]] == ["bo"]
+    compacted.close()
+
+
+def test_two_instances_never_ack_each_others_records(tmp_path):
+    sent = []
+
+    def sink(records):
+        sent.extend(r["name"] for r in records)
+        return [dict(r) for r in records]
+
+    first = _journal(tmp_path, sink)
+    second = _journal(tmp_path, lambda records: [None] * len(records))
+    a = first.append("ash", 1, 0, 1)
+    b = second.append("bo", 0, 1, 0)
+    assert a["seq"] == b["seq"]  # numbered independently
+    first.drain()
+    assert sent == ["ash"]
+    first.close()
+    second.close()
+
+    # bo was never delivered: its record must still be pending after a restart
+    reopened = _journal(tmp_path, sink)
+    assert [r["name"] for r in reopened.pending()] == ["bo"]
+    reopened.drain()
+    reopened.close()
+    assert _journal(tmp_path, None).pending() == []
+
+
+def test_names_differing_in_case_are_one_pending_record(tmp_path):
+    batches = []
+
+    def sink(records):
+        batches.append([r["name"] for r in records])
+        return [dict(r) for r in records]
+
+    journal = _journal(tmp_path, sink)
+    journal.append("Ash", 1, 0, 1)
+    rec = journal.append("ash", 2, 0, 2)
+    assert journal.pending() == [rec]
+    journal.drain()
+    assert batches == [["ash"]]
+    assert journal.saved("ASH", rec["seq"])["matches_won"] == 2
+    journal.close()
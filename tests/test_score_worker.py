@@ -0,0 +1,36 @@
+import logging
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rps.score_worker import ScoreWorker
+
+
+def test_results_and_errors_are_delivered_and_errors_logged(caplog):
+    delivered = []
+    done = threading.Event()
+
+    def post(tag, result, error):
+        delivered.append((tag, result, error))
+        if len(delivered) == 2:
+            done.set()
+
+    def boom():
+        raise KeyError("name")
+
+    worker = ScoreWorker(post=post)
+    with caplog.at_level(logging.WARNING, logger="rps.score_worker"):
+        worker.submit("leaderboard", lambda: [1])
+        worker.submit("push", boom)
+        assert done.wait(5)
+        worker.shutdown()
+    assert delivered[0] == ("leaderboard", [1], None)
+    tag, result, error = delivered[1]
+    assert (tag, result, type(error)) == ("push", None, KeyError)
+    record, = caplog.records
+    assert "'push'" in record.getMessage() and record.exc_info[0] is KeyError
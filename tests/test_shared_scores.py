@@ -0,0 +1,185 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pytest
+
+pytest.importorskip("requests")
+
+from rps import shared_scores
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, data=None, headers=None):
+        self.status_code = status_code
+        self._data = data
+        self.headers = headers or {}
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Records requests and replays queued responses per path."""
+
+    def __init__(self):
+        self.calls = []
+        self.responses = {}
+
+    def queue(self, path, *responses):
+        self.responses.setdefault(path, []).extend(responses)
+
+    def _reply(self, method, url, **kwargs):
+        path = url.rsplit("/", 1)[-1]
+        self.calls.append((method, path, kwargs))
+        return self.responses[path].pop(0)
+
+    def get(self, url, **kwargs):
+        return self._reply("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._reply("POST", url, **kwargs)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = FakeSession()
+    monkeypatch.setattr(shared_scores, "BACKEND_API_BASE", "http://backend.test")
+    shared_scores.set_session(fake)
+    shared_scores.clear_cache()
+    yield fake
+    shared_scores.set_session(None)
+    shared_scores.clear_cache()
+
+
+def test_fetch_player_is_cached(session):
+    session.queue("player", FakeResponse(data=[{"name": "ash", "best_streak": 2}]))
+    assert shared_scores.fetch_player("ASH")["best_streak"] == 2
+    assert shared_scores.fetch_player("ash")["best_streak"] == 2
+    assert len(session.calls) == 1
+
+
+def test_expired_entry_revalidates_with_etag(session, monkeypatch):
+    monkeypatch.setitem(shared_scores.CACHE_TTLS, "leaderboard", 0.0)
+    board = [{"name": "ash", "best_streak": 4}]
+    session.queue("leaderboard", FakeResponse(data=board, headers={"ETag": '"v1"'}), FakeResponse(304))
+    assert shared_scores.fetch_leaderboard(10) == board
+    assert shared_scores.fetch_leaderboard(10) == board
+    assert session.calls[1][2]["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_upsert_invalidates_and_primes_cache(session):
+    session.queue("leaderboard", FakeResponse(data=[]), FakeResponse(data=[{"name": "ash"}]))
+    session.queue("score", FakeResponse(data=[{"name": "ash", "best_streak": 3}]))
+    assert shared_scores.fetch_leaderboard(10) == []
+    assert shared_scores.upsert_score("Ash", 3, 1, 3)["best_streak"] == 3
+    # player served from the upsert response; leaderboard refetched
+    assert shared_scores.fetch_player("ash")["best_streak"] == 3
+    assert shared_scores.fetch_leaderboard(10) == [{"name": "ash"}]
+    assert [c[1] for c in session.calls] == ["leaderboard", "score", "leaderboard"]
+
+
+def test_response_cache_lru_eviction():
+    cache = shared_scores.ResponseCache(maxsize=2)
+    cache.store("a", 1, 60)
+    cache.store("b", 2, 60)
+    cache.lookup("a")
+    cache.store("c", 3, 60)
+    assert cache.lookup("b") is None
+    assert cache.lookup("a") == (True, None, 1)
+
+
+def test_upsert_scores_sends_one_array(session):
+    session.queue("score", FakeResponse(data=[
+        {"name": "ash", "matches_won": 2, "matches_lost": 0, "best_streak": 2},
+        {"name": "bo", "matches_won": 0, "matches_lost": 1, "best_streak": 0},
+    ]))
+    saved = shared_scores.upsert_scores([
+        {"name": "Ash", "matches_won": 2, "matches_lost": 0, "best_streak": 2, "seq": 7},
+        {"name": "bo", "matches_won": 0, "matches_lost": 1, "best_streak": 0},
+        {"name": "cy", "matches_won": 1, "matches_lost": 1, "best_streak": 1},
+    ])
+    assert [s and s["name"] for s in saved] == ["ash", "bo", None]
+    (method, path, kwargs), = session.calls
+    assert (method, path) == ("POST", "score")
+    assert [row["name"] for row in kwargs["json"]] == ["ash", "bo", "cy"]
+    assert "seq" not in kwargs["json"][0]
+
+
+def test_backend_base_is_resolved_lazily(monkeypatch):
+    monkeypatch.setattr(shared_scores, "BACKEND_API_BASE", None)
+    monkeypatch.setenv("BACKEND_API_BASE", "http://lazy.test/")
+    assert shared_scores.backend_api_base() == "http://lazy.test"
+    monkeypatch.setenv("BACKEND_API_BASE", "http://other.test")
+    assert shared_scores.backend_api_base() == "http://lazy.test"
+
+
+def test_fetch_distribution_is_cached(session):
+    body = {"total": 3, "best_streak": {"width": 1, "counts": [1, 2]}, "win_pct": {"width": 1, "counts": [3]}}
+    session.queue("distribution", FakeResponse(data=body))
+    assert shared_scores.fetch_distribution() == body
+    assert shared_scores.fetch_distribution() == body
+    assert len(session.calls) == 1
+    # score writes leave it alone; the client updates its copy locally
+    session.queue("score", FakeResponse(data=[{"name": "ash"}]))
+    shared_scores.upsert_scores([{"name": "ash", "matches_won": 1, "matches_lost": 0, "best_streak": 1}])
+    assert shared_scores.fetch_distribution() == body
+    assert [path for _, path, _ in session.calls] == ["distribution", "score"]
+
+
+def test_session_is_built_once_and_reused(monkeypatch):
+    shared_scores.set_session(None)
+    try:
+        session = shared_scores.get_session()
+        assert shared_scores.get_session() is session
+        # every backend call goes through the shared session
+        calls = []
+        monkeypatch.setattr(shared_scores, "BACKEND_API_BASE", "http://backend.test")
+        monkeypatch.setattr(session, "get", lambda url, **kw: calls.append(url) or FakeResponse(data=[]))
+        shared_scores.clear_cache()
+        shared_scores.fetch_leaderboard(10)
+        shared_scores.fetch_player("ash")
+        assert len(calls) == 2
+        assert shared_scores.get_session() is session
+    finally:
+        shared_scores.set_session(None)
+        shared_scores.clear_cache()
+
+
+def test_session_mounts_pooled_adapter_with_get_retries():
+    session = shared_scores._build_session()
+    try:
+        for prefix in ("http://", "https://"):
+            adapter = session.get_adapter(prefix + "backend.test")
+            assert adapter is session.adapters[prefix]
+            assert adapter._pool_connections == shared_scores.POOL_CONNECTIONS
+            assert adapter._pool_maxsize == shared_scores.POOL_MAXSIZE
+        retry = session.get_adapter("https://backend.test").max_retries
+        assert retry.total == shared_scores.GET_RETRIES
+        assert retry.backoff_factor == shared_scores.RETRY_BACKOFF
+        assert set(retry.status_forcelist) == {429, 500, 502, 503, 504}
+        assert retry.allowed_methods == frozenset({"GET"})  # POST /score is never replayed
+        assert not retry.raise_on_status
+        if hasattr(retry, "backoff_jitter"):  # urllib3 >= 2
+            assert retry.backoff_jitter == shared_scores.RETRY_JITTER
+    finally:
+        session.close()
+
+
+def test_upsert_scores_sends_each_player_once(session):
+    session.queue("score", FakeResponse(data=[{"name": "ash", "matches_won": 3}]))
+    saved = shared_scores.upsert_scores([
+        {"name": "ash", "matches_won": 2, "matches_lost": 0, "best_streak": 2},
+        {"name": "Ash ", "matches_won": 3, "matches_lost": 0, "best_streak": 3},
+    ])
+    (_, _, kwargs), = session.calls
+    assert kwargs["json"] == [{"name": "ash", "matches_won": 3, "matches_lost": 0, "best_streak": 3}]
+    assert [s["matches_won"] for s in saved] == [3, 3]
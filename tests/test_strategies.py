@@ -0,0 +1,58 @@
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pytest
+
+from rps.logic import Move
+from rps.strategies import STRATEGIES, counter_move, make_strategy
+
+
+def test_every_strategy_returns_a_move():
+    for name in STRATEGIES:
+        strat = make_strategy(name, rng=random.Random(1))
+        for i in range(20):
+            assert strat.choose() in (Move.ROCK, Move.PAPER, Move.SCISSORS)
+            strat.observe(i % 3)
+
+
+def test_frequency_counters_favourite_move():
+    strat = make_strategy("frequency", rng=random.Random(1))
+    for _ in range(5):
+        strat.observe(Move.ROCK)
+    assert strat.choose() == Move.PAPER
+
+
+def test_markov_learns_transitions():
+    strat = make_strategy("markov", rng=random.Random(1))
+    for _ in range(10):
+        strat.observe(Move.ROCK)
+        strat.observe(Move.SCISSORS)
+    # after SCISSORS the opponent always plays ROCK
+    assert strat.predict() == Move.ROCK
+
+
+def test_ngram_uses_longer_context():
+    strat = make_strategy("ngram", rng=random.Random(1))
+    cycle = [Move.ROCK, Move.ROCK, Move.PAPER]
+    for _ in range(10):
+        for m in cycle:
+            strat.observe(m)
+    # history ends ..., ROCK, ROCK, PAPER -> next is ROCK
+    assert strat.predict() == Move.ROCK
+    strat.observe(Move.ROCK)
+    assert strat.predict() == Move.ROCK
+    strat.observe(Move.ROCK)
+    # first-order stats alone are ambiguous after ROCK; the longer context is not
+    assert strat.predict() == Move.PAPER
+    assert strat.choose() == counter_move(Move.PAPER)
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        make_strategy("oracle")
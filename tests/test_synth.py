@@ -0,0 +1,66 @@
+import math
+import sys
+import wave
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rps import synth
+
+
+def test_sine_matches_per_sample_formula():
+    samples = synth.sine(440.0, 0.01, volume=0.5, rate=8000)
+    amp = int(32767 * 0.5)
+    expected = [int(amp * math.sin(2 * math.pi * 440.0 * i / 8000)) for i in range(80)]
+    assert [int(v) for v in samples] == expected
+
+
+def test_battle_music_clips_to_int16():
+    samples = synth.battle_music(duration=1.0, rate=4000)
+    assert len(samples) == 4000
+    assert all(-32768 <= int(v) <= 32767 for v in samples)
+
+
+def test_battle_music_repeats_one_beat_per_formula():
+    rate, amp, half = 4000, 26000, 2000
+    samples = synth.battle_music(duration=3.25, rate=rate)
+    two_pi = 2 * math.pi
+    expected = [
+        max(-32768, min(32767, int(amp * (math.sin(two_pi * 110 * i / rate) * 0.55
+                                          + math.sin(two_pi * 330 * i / rate + math.sin(two_pi * 2 * i / rate) * 2.5) * 0.35
+                                          + (0.15 if (i // half) % 2 == 0 else -0.15)))))
+        for i in range(len(samples))
+    ]
+    assert len(samples) == 13000
+    # the tiled period may differ from per-sample evaluation by float rounding only
+    assert max(abs(int(a) - b) for a, b in zip(samples, expected)) <= 1
+
+
+def test_sine_tiles_whole_periods():
+    samples = synth.sine(440.0, 0.5, volume=0.5, rate=8000)  # period of 200 samples
+    assert len(samples) == 4000
+    assert list(samples[200:400]) == list(samples[:200])
+
+
+def test_pcm_bytes_duplicates_channels():
+    samples = synth.sine(440.0, 0.01, rate=8000)
+    mono = synth.pcm_bytes(samples)
+    stereo = synth.pcm_bytes(samples, channels=2)
+    assert len(stereo) == 2 * len(mono)
+    assert stereo[0:2] == stereo[2:4] == mono[0:2]
+    assert stereo[4:6] == stereo[6:8] == mono[2:4]
+
+
+def test_cached_wav_is_keyed_by_content(tmp_path):
+    path = synth.cached_wav("sine", rate=8000, cache_dir=tmp_path, freq=440.0, duration=0.05)
+    assert path == synth.cache_path("sine", 8000, tmp_path, duration=0.05, freq=440.0)
+    assert path != synth.cache_path("sine", 8000, tmp_path, freq=880.0, duration=0.05)
+    with wave.open(str(path), "rb") as wf:
+        assert wf.getframerate() == 8000
+        assert wf.getnframes() == 400
+    mtime = path.stat().st_mtime_ns
+    assert synth.cached_wav("sine", rate=8000, cache_dir=tmp_path, freq=440.0, duration=0.05) == path
+    assert path.stat().st_mtime_ns == mtime
@@ -0,0 +1,35 @@
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rps.strategies import Strategy
+from rps.tournament import play_match, run_tournament
+
+
+class _Fixed(Strategy):
+    def __init__(self, move):
+        super().__init__(random.Random(0))
+        self.move = move
+
+    def choose(self):
+        return self.move
+
+
+def test_play_match_scores_and_draw_guard():
+    assert play_match(_Fixed(1), _Fixed(0)) == 1.0
+    assert play_match(_Fixed(0), _Fixed(1)) == 0.0
+    assert play_match(_Fixed(2), _Fixed(2), max_rounds=50) == 0.5
+
+
+def test_run_tournament_inline():
+    result = run_tournament(["random", "markov", "ngram"], n_matches=20, workers=1, seed=3)
+    assert set(result["ratings"]) == {"random", "markov", "ngram"}
+    assert abs(sum(result["ratings"].values()) - 3 * 1500.0) < 1e-6
+    for name, (w, l, d) in result["records"].items():
+        assert w + l + d == 40
+    assert abs(result["matrix"]["random"]["markov"] + result["matrix"]["markov"]["random"] - 1.0) < 1e-9